@@ -0,0 +1,62 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+import argparse
+import sys
+
+from src.Benchmark import SIZES, TARGETS, BENCHMARK_COLUMNS, run_benchmarks, save_report, load_report, compare_reports
+from src.BatchRunner import format_table
+from src.SimulationEngine import ALGORITHMS
+
+
+def parse_arguments():
+
+    parser = argparse.ArgumentParser(description="Benchmark the scheduling simulator")
+    parser.add_argument("--targets", nargs="+", choices=TARGETS, default=["engine"])
+    parser.add_argument("--algorithms", nargs="+", choices=ALGORITHMS, default=ALGORITHMS)
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--max-seconds", type=float, default=60, help="skip larger sizes once a run takes longer")
+    parser.add_argument("--output", help="write the report as JSON")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed drop of events per second")
+
+    return parser.parse_args()
+
+
+def print_result(result):
+    print(f"{result['target']:<10} {result['algorithm']:<36} {result['size']:>8} processes  {result['wall_time']:8.3f} s  "
+          f"{result['events_per_second']:12.0f} events/s", flush=True)
+
+
+if __name__ == "__main__":
+    arguments = parse_arguments()
+
+    report = run_benchmarks(arguments.targets, arguments.algorithms, arguments.sizes, arguments.seed, arguments.repeat, arguments.max_seconds, print_result)
+
+    print()
+    print(format_table(report["results"], BENCHMARK_COLUMNS))
+    print()
+
+    for scaling in report["scaling"]:
+        print(f"{scaling['target']:<10} {scaling['algorithm']:<36} scaling exponent {scaling['exponent']:.2f}")
+
+    if arguments.output:
+        save_report(report, arguments.output)
+
+    if arguments.baseline:
+        regressions = compare_reports(report, load_report(arguments.baseline), arguments.tolerance)
+
+        for regression in regressions:
+            print(f"Regression {regression['target']} {regression['algorithm']} {regression['size']}: "
+                  f"{regression['baseline']:.0f} -> {regression['current']:.0f} events/s ({regression['change']:+.0%})")
+
+        if regressions:
+            sys.exit(1)
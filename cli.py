@@ -0,0 +1,130 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+
+from src.WorkloadIO import read_workload
+from src.BatchRunner import simulate_table
+from src.SimulationEngine import QUANTUM, BLOCK_PROBABILITY, QUEUE_MODES
+from src.Policies import policy_names, policy_options
+
+
+# Headless entry point, it never imports tkinter (or NumPy unless the fast path is used)
+# so it starts quickly when called many times from scripts
+
+PROCESS_COLUMNS = ["pid", "arrival_time", "burst_time", "priority", "waiting_time", "finish_time", "blocked_time"]
+
+
+def positive_number(value):
+
+    number = float(value)
+
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive number: {value}")
+
+    return number
+
+
+def parse_arguments(arguments=None):
+
+    parser = argparse.ArgumentParser(description="Simulate a workload file headless and write the metrics to stdout")
+    parser.add_argument("workload", help="CSV, JSON lines or Parquet workload file")
+    parser.add_argument("--algorithm", nargs="+", choices=policy_names(), default=["FIFO"], help="one or more algorithms")
+    parser.add_argument("--quantum", type=positive_number, default=QUANTUM)
+    parser.add_argument("--cpus", type=int, default=1)
+    parser.add_argument("--queue-mode", choices=QUEUE_MODES, default="global")
+    parser.add_argument("--block-probability", type=float, default=BLOCK_PROBABILITY)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--format", choices=["json", "csv"], default="json")
+    parser.add_argument("--per-process", action="store_true", help="write the result of every process instead of the summary")
+    parser.add_argument("--levels", type=int, help="MLFQ levels")
+    parser.add_argument("--level-quanta", nargs="+", type=positive_number, help="MLFQ quantum of every level")
+    parser.add_argument("--boost-period", type=positive_number, help="MLFQ time between priority boosts")
+
+    return parser.parse_args(arguments)
+
+
+def run(arguments):
+    """Statistics of every algorithm, or the per process results with --per-process"""
+
+    workload = read_workload(arguments.workload)
+    options = {
+        "_quantum": arguments.quantum,
+        "_cpus": arguments.cpus,
+        "_queue_mode": arguments.queue_mode,
+        "_block_probability": arguments.block_probability
+    }
+
+    tuning = {"levels": arguments.levels, "quanta": arguments.level_quanta, "boost_period": arguments.boost_period}
+    tuning = {key: value for key, value in tuning.items() if value is not None}
+
+    rows = []
+
+    for algorithm in arguments.algorithm:
+        table = workload.copy()
+        algorithm_options = dict(options, _policy_options=policy_options(algorithm, tuning))
+
+        start_timestamp = time.perf_counter()
+        statistics = simulate_table(table, algorithm, arguments.seed, algorithm_options)
+        statistics["algorithm"] = algorithm
+        statistics["wall_time"] = time.perf_counter() - start_timestamp
+
+        if not arguments.per_process:
+            rows.append(statistics)
+            continue
+
+        columns = [getattr(table, column) for column in PROCESS_COLUMNS]
+
+        for values in zip(*columns):
+            row = {"algorithm": algorithm}
+            row.update(zip(PROCESS_COLUMNS, values))
+            rows.append(row)
+
+    return rows
+
+
+def write_rows(rows, output_format, output=None):
+    """JSON (one document) or CSV with a header, list values are joined with ';'.
+    The output is stdout by default, looked up at call time so redirections apply"""
+
+    output = output if output is not None else sys.stdout
+
+    if output_format == "json":
+        json.dump(rows, output, indent=2)
+        output.write("\n")
+        return
+
+    fields = list(dict.fromkeys(key for row in rows for key in row))
+    writer = csv.DictWriter(output, fieldnames=fields, lineterminator="\n")
+    writer.writeheader()
+
+    for row in rows:
+        writer.writerow({key: ";".join(str(item) for item in value) if isinstance(value, list) else value for key, value in row.items()})
+
+
+def main(arguments=None):
+
+    arguments = parse_arguments(arguments)
+
+    try:
+        rows = run(arguments)
+    except (OSError, ValueError, ImportError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+
+    write_rows(rows, arguments.format)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+import argparse
+import asyncio
+
+from src.SimulationService import SimulationService
+
+
+def parse_arguments():
+
+    parser = argparse.ArgumentParser(description="Serve simulations over HTTP with live statistics as server-sent events")
+    parser.add_argument("--host", default="127.0.0.1", help="only localhost by default")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, help="worker processes, by default one per CPU")
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = parse_arguments()
+    service = SimulationService(arguments.host, arguments.port, arguments.workers)
+
+    print(f"Serving simulations at http://{arguments.host}:{arguments.port}/runs", flush=True)
+
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
@@ -10,9 +10,6 @@ Developed at: September 2024
 
 import os
 
-import pandas as pd
-from tkinter import messagebox
-
 
 # Main properties
 
@@ -21,11 +18,26 @@ WINDOW_HEIGHT = 600
 
 FONT = "Poppins"
 
+FRAME_RATE = 30
+
+PREVIEW_ROWS = 200
+
+SHOWN_CPUS = 8
+
+# Replay mode: milliseconds the slider has to rest before seeking, and trace records
+# indexed per step of the background index
+
+SCRUB_DELAY = 50
+
+REPLAY_INDEX_CHUNK = 100000
+
 
 # Resources and utilities
 
 
 def show_error_message(message):
+        from tkinter import messagebox
+        
         messagebox.showerror(
             title="Error",
             message=message
@@ -33,6 +45,8 @@ def show_error_message(message):
 
 
 def info_message(message):
+    from tkinter import messagebox
+    
     messagebox.showinfo(
           title="Success",
           message=message
@@ -0,0 +1,117 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import time
+
+from src.SimulationEngine import SimulationEngine, ALGORITHMS
+from src.ProcessTable import ProcessTable
+
+
+# Smaller workloads always go through the engine, which is quicker than importing NumPy
+
+FAST_PATH_MIN_PROCESSES = 10000
+
+# Columns of the comparison table (statistics keys and their headers)
+
+COMPARISON_COLUMNS = [
+    ("algorithm", "Algorithm"),
+    ("cpu_usage", "CPU %"),
+    ("average_waiting_time", "Avg Wait"),
+    ("waiting_time_p95", "p95 Wait"),
+    ("waiting_time_p99", "p99 Wait"),
+    ("average_execution_time", "Avg Exec"),
+    ("execution_time_p95", "p95 Exec"),
+    ("execution_time_p99", "p99 Exec"),
+    ("simulation_time", "Sim Time"),
+    ("wall_time", "Wall (s)")
+]
+
+
+def as_table(workload):
+    """Workloads travel to the workers as compact process tables"""
+
+    return workload if isinstance(workload, ProcessTable) else ProcessTable.from_processes(workload)
+
+
+def simulate_table(table, algorithm, seed=None, options=None):
+    """Simulate a ProcessTable in place and return its statistics, the per process
+    results are left in the table columns. Large schedules that are a plain
+    sort are computed by the vectorized fast path"""
+
+    if len(table) >= FAST_PATH_MIN_PROCESSES:
+        try:
+            from src.FastPath import fast_path_statistics
+        except ImportError:             # NumPy is optional, without it every run goes through the engine
+            fast_path_statistics = None
+
+        statistics = fast_path_statistics(table, algorithm, options) if fast_path_statistics else None
+
+        if statistics is not None:
+            return statistics
+
+    return SimulationEngine(table, algorithm, _seed=seed, **(options or {})).run()
+
+
+def run_algorithm(workload, algorithm, seed=None, options=None):
+    """Simulate the workload headless with one algorithm and return its statistics"""
+
+    start_timestamp = time.perf_counter()
+
+    statistics = simulate_table(as_table(workload).copy(), algorithm, seed, options)
+
+    statistics["algorithm"] = algorithm
+    statistics["wall_time"] = time.perf_counter() - start_timestamp
+
+    return statistics
+
+
+def compare_algorithms(workload, algorithms=ALGORITHMS, seed=None, options=None, max_workers=None):
+    """Run every algorithm on the same workload (and seed) concurrently in a
+    process pool, one row of statistics per algorithm in the given order"""
+
+    if max_workers == 1 or len(algorithms) == 1:
+        table = as_table(workload)
+        return [run_algorithm(table, algorithm, seed, options) for algorithm in algorithms]
+
+    executor, futures = submit_comparison(workload, algorithms, seed, options, max_workers)
+
+    with executor:
+        return [future.result() for future in futures]
+
+
+def submit_comparison(workload, algorithms=ALGORITHMS, seed=None, options=None, max_workers=None):
+    """Start the runs of compare_algorithms without waiting for them, returns the
+    executor (to shut down once done) and one future per algorithm. Used by
+    the GUI to poll the runs without blocking its event loop"""
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    table = as_table(workload)
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    futures = [executor.submit(run_algorithm, table, algorithm, seed, options) for algorithm in algorithms]
+
+    return executor, futures
+
+
+def format_table(rows, columns=COMPARISON_COLUMNS):
+    """Side by side text table of the comparison rows"""
+
+    cells = [[header for _, header in columns]]
+
+    for row in rows:
+        cells.append([format_cell(row.get(key, "")) for key, _ in columns])
+
+    widths = [max(len(line[index]) for line in cells) for index in range(len(columns))]
+
+    return "\n".join("  ".join(cell.ljust(width) for cell, width in zip(line, widths)) for line in cells)
+
+
+def format_cell(value):
+    return f"{value:.2f}" if isinstance(value, float) else str(value)
@@ -0,0 +1,259 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import json
+import math
+import platform
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.SimulationEngine import SimulationEngine, ALGORITHMS
+from src.ProcessTable import ProcessTable
+
+
+SIZES = [10, 100, 1000, 10000, 100000, 1000000]
+
+TARGETS = ["engine", "fast_path", "window"]
+
+# Offered load of the synthetic workload (mean burst / mean inter-arrival time)
+
+LOAD = 0.95
+MEAN_BURST_TIME = 5
+
+BENCHMARK_COLUMNS = [
+    ("target", "Target"),
+    ("algorithm", "Algorithm"),
+    ("size", "Processes"),
+    ("events", "Events"),
+    ("wall_time", "Wall (s)"),
+    ("events_per_second", "Events/s"),
+    ("peak_memory_mb", "Peak MB")
+]
+
+
+def make_workload(size, seed=0):
+    """Poisson arrivals and exponential bursts drawn with the standard library so
+    the benchmark does not depend on NumPy"""
+
+    rng = random.Random(seed)
+    table = ProcessTable()
+    arrival_time = 0
+
+    for pid in range(size):
+        arrival_time += rng.expovariate(LOAD / MEAN_BURST_TIME)
+        table.append(pid, arrival_time, rng.expovariate(1 / MEAN_BURST_TIME) + 0.01, rng.randint(1, 5))
+
+    return table
+
+
+def run_engine(table, algorithm, seed):
+
+    engine = SimulationEngine(table, algorithm, _seed=seed)
+    engine.run()
+
+    return engine.sequence + engine.total_processes
+
+
+def run_fast_path(table, algorithm, seed):
+
+    from src.FastPath import fast_path_statistics
+
+    fast_path_statistics(table, algorithm, {"_block_probability": 0})
+    return len(table)
+
+
+def run_window(table, algorithm, seed):
+    """Drive a hidden SimulationWindow with an event driven virtual clock until it finishes"""
+
+    import tkinter as tk
+    from src.Clock import VirtualClock
+    from windows.SimulationWindow import SimulationWindow
+
+    root = tk.Tk()
+    root.withdraw()
+
+    window = SimulationWindow(root, table, algorithm, VirtualClock(), seed)
+
+    while not window.engine.finished:
+        root.update()
+
+    root.destroy()
+
+    return window.engine.sequence + window.engine.total_processes
+
+
+RUNNERS = {"engine": run_engine, "fast_path": run_fast_path, "window": run_window}
+
+
+def import_target(target):
+    """Import what the runner of the target imports lazily (NumPy, tkinter) so the
+    import time stays out of the measurement"""
+
+    if target == "fast_path":
+        import src.FastPath
+
+    elif target == "window":
+        import tkinter
+        import windows.SimulationWindow
+
+
+def peak_memory_mb():
+    """Peak resident memory of this process, None where the resource module is missing (Windows)"""
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss is in bytes on macOS and in KiB on Linux
+
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure(target, algorithm, size, seed=0, repeat=1):
+    """Best wall time of repeat runs, meant to be executed in a fresh worker process
+    so the peak resident memory belongs to this measurement only"""
+
+    wall_time = None
+    events = 0
+
+    import_target(target)
+
+    for _ in range(repeat):
+        table = make_workload(size, seed)
+
+        start_timestamp = time.perf_counter()
+        events = RUNNERS[target](table, algorithm, seed)
+        elapsed = time.perf_counter() - start_timestamp
+
+        wall_time = elapsed if wall_time is None else min(wall_time, elapsed)
+
+    return {
+        "target": target,
+        "algorithm": algorithm,
+        "size": size,
+        "events": events,
+        "wall_time": wall_time,
+        "events_per_second": events / wall_time if wall_time > 0 else 0,
+        "peak_memory_mb": peak_memory_mb()
+    }
+
+
+def applies(target, algorithm):
+    """The synthetic workload has distinct arrivals, so only FIFO takes the fast path"""
+
+    return target != "fast_path" or algorithm == "FIFO"
+
+
+def run_benchmarks(targets=("engine",), algorithms=ALGORITHMS, sizes=SIZES, seed=0, repeat=1, max_seconds=60, report=None):
+    """Measure every target and algorithm over growing workload sizes, the larger
+    sizes are skipped once a run takes longer than max_seconds"""
+
+    results = []
+
+    for target in targets:
+        for algorithm in algorithms:
+            if not applies(target, algorithm):
+                continue
+
+            for size in sizes:
+
+                # A new single worker per measurement, so its peak memory is not shared
+
+                with ProcessPoolExecutor(max_workers=1) as executor:
+                    result = executor.submit(measure, target, algorithm, size, seed, repeat).result()
+
+                results.append(result)
+
+                if report:
+                    report(result)
+
+                if result["wall_time"] > max_seconds:
+                    break
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S")
+        },
+        "results": results,
+        "scaling": scaling_exponents(results)
+    }
+
+
+def scaling_exponents(results, min_wall_time=0.001):
+    """Least squares slope of log(wall time) over log(size) per target and algorithm,
+    1 means linear scaling. Runs too short to time reliably are left out"""
+
+    groups = {}
+
+    for result in results:
+        if result["wall_time"] >= min_wall_time:
+            groups.setdefault((result["target"], result["algorithm"]), []).append(result)
+
+    exponents = []
+
+    for (target, algorithm), group in groups.items():
+        if len(group) < 2:
+            continue
+
+        xs = [math.log(result["size"]) for result in group]
+        ys = [math.log(result["wall_time"]) for result in group]
+        mean_x = sum(xs) / len(xs)
+        mean_y = sum(ys) / len(ys)
+        slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sum((x - mean_x) ** 2 for x in xs)
+
+        exponents.append({"target": target, "algorithm": algorithm, "exponent": slope})
+
+    return exponents
+
+
+def save_report(report, path):
+
+    with open(path, "w") as file:
+        json.dump(report, file, indent=2)
+
+
+def load_report(path):
+
+    with open(path) as file:
+        return json.load(file)
+
+
+def compare_reports(report, baseline, tolerance=0.2):
+    """Measurements whose events per second dropped more than tolerance against the baseline"""
+
+    baseline_results = {(result["target"], result["algorithm"], result["size"]): result for result in baseline["results"]}
+    regressions = []
+
+    for result in report["results"]:
+        previous = baseline_results.get((result["target"], result["algorithm"], result["size"]))
+
+        if previous is None or previous["events_per_second"] == 0:
+            continue
+
+        change = result["events_per_second"] / previous["events_per_second"] - 1
+
+        if change < -tolerance:
+            regressions.append({
+                "target": result["target"],
+                "algorithm": result["algorithm"],
+                "size": result["size"],
+                "baseline": previous["events_per_second"],
+                "current": result["events_per_second"],
+                "change": change
+            })
+
+    return regressions
@@ -0,0 +1,132 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import heapq
+
+
+# ---------------------------- Distributions -----------------------------------------
+
+
+class Exponential():
+    """Memoryless time with the given rate (mean 1 / rate)"""
+
+    def __init__(self, _rate):
+        self.rate = _rate
+
+
+    def sample(self, rng):
+        return rng.expovariate(self.rate)
+
+
+class Uniform():
+
+    def __init__(self, _low, _high):
+        self.low = _low
+        self.high = _high
+
+
+    def sample(self, rng):
+        return rng.uniform(self.low, self.high)
+
+
+class UniformInteger():
+    """Whole time units from low to high, both included"""
+
+    def __init__(self, _low, _high):
+        self.low = _low
+        self.high = _high
+
+
+    def sample(self, rng):
+        return rng.randint(self.low, self.high)
+
+
+class Constant():
+
+    def __init__(self, _value):
+        self.value = _value
+
+
+    def sample(self, rng):
+        return self.value
+
+
+# ---------------------------- Blocking model -----------------------------------------
+
+
+class BlockingModel():
+    """When processes block for I/O and for how long. The time to block is CPU
+    time: a process blocks once it has run that long, across preemptions,
+    and draws a new one after waking up. Processes can get their own
+    distributions by pid, the rest use the defaults"""
+
+    def __init__(self, _time_to_block, _duration):
+        self.time_to_block = _time_to_block
+        self.duration = _duration
+        self.profiles = {}
+
+
+    def configure(self, pid, time_to_block=None, duration=None):
+        """Use other distributions for one process, None keeps the default"""
+
+        self.profiles[pid] = (time_to_block or self.time_to_block, duration or self.duration)
+
+
+    def sample_time_to_block(self, process, rng):
+
+        profile = self.profiles.get(process.pid)
+        return (profile[0] if profile else self.time_to_block).sample(rng)
+
+
+    def sample_duration(self, process, rng):
+
+        profile = self.profiles.get(process.pid)
+        return (profile[1] if profile else self.duration).sample(rng)
+
+
+def make_blocking_model(probability, duration, check_interval):
+    """Model of the original simulator: the block chance per check interval of CPU
+    becomes an exponential time to block and the duration whole time units,
+    None when processes never block"""
+
+    if probability <= 0:
+        return None
+
+    return BlockingModel(Exponential(probability / check_interval), UniformInteger(*duration))
+
+
+class BlockedQueue():
+    """Blocked processes in a min-heap keyed by wake time, blocking and waking
+    are O(log n) whatever the number of blocked processes"""
+
+    def __init__(self):
+        self.heap = []
+        self.sequence = 0
+
+
+    def __len__(self):
+        return len(self.heap)
+
+
+    def __iter__(self):
+        return (entry[2] for entry in self.heap)
+
+
+    def push(self, process):
+        heapq.heappush(self.heap, (process.blocked_until, self.sequence, process))
+        self.sequence += 1
+
+
+    def next_wake_time(self):
+        return self.heap[0][0] if self.heap else None
+
+
+    def pop(self):
+        return heapq.heappop(self.heap)[2]
@@ -0,0 +1,137 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import os
+import pickle
+import random
+import zlib
+
+
+# File layout: magic, format version (1 byte) and the zlib compressed pickle of the engine
+
+MAGIC = b"SCHEDCKP"
+VERSION = 1
+
+COMPRESSION_LEVEL = 6
+
+CHECKPOINT_FILE_TYPES = [
+    ("Simulation checkpoints", "*.ckpt"),
+    ("All files", "*.*")
+]
+
+
+def snapshot(engine):
+    """Full state of the engine as bytes: clock, pending events, queues, processes,
+    policy state, rng state and the results recorded so far. Listeners and
+    the profiler are not included"""
+
+    data = pickle.dumps(engine, protocol=pickle.HIGHEST_PROTOCOL)
+    return MAGIC + bytes([VERSION]) + zlib.compress(data, COMPRESSION_LEVEL)
+
+
+def restore(data):
+    """Engine rebuilt from a snapshot, it continues exactly where the original was"""
+
+    if len(data) <= len(MAGIC) or data[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not a simulation checkpoint")
+
+    if data[len(MAGIC)] != VERSION:
+        raise ValueError(f"Unsupported checkpoint version: {data[len(MAGIC)]}")
+
+    # A truncated or corrupted file fails to decompress or to unpickle
+
+    try:
+        return pickle.loads(zlib.decompress(data[len(MAGIC) + 1:]))
+    except (zlib.error, pickle.UnpicklingError, EOFError):
+        raise ValueError("Not a simulation checkpoint")
+
+
+def save_checkpoint(engine, path):
+    """Write the snapshot to a temporary file first so an interrupted save never
+    leaves a broken checkpoint behind"""
+
+    temporary_path = f"{path}.tmp"
+
+    with open(temporary_path, "wb") as file:
+        file.write(snapshot(engine))
+
+    os.replace(temporary_path, path)
+
+
+def load_checkpoint(path):
+    """Engine saved at the path, checkpoints are pickles so only load trusted files"""
+
+    with open(path, "rb") as file:
+        return restore(file.read())
+
+
+def fork(source, seeds):
+    """Independent copies of an engine (or of a snapshot), one per seed, to explore
+    what-if continuations from a shared warm-up. A seed of None keeps the
+    rng state so that copy continues exactly as the original would"""
+
+    data = source if isinstance(source, bytes) else snapshot(source)
+    forks = []
+
+    for seed in seeds:
+        copy = restore(data)
+
+        if seed is not None:
+            reseed(copy, seed)
+
+        forks.append(copy)
+
+    return forks
+
+
+def reseed(engine, seed):
+    """Restart the random draws of the engine (its policy and ready queues share
+    the same rng object) from the seed"""
+
+    state = random.Random(seed).getstate()
+    engine.rng.setstate(state)
+    engine.seed = seed
+
+
+def run_with_checkpoints(engine, path, every, until=None):
+    """Run the engine saving a checkpoint every given amount of simulated time.
+    The path may use {index} and {time} to keep every checkpoint, otherwise
+    each one replaces the previous one. With until the run stops there after
+    a last checkpoint, so long runs can be split in resumable chunks. Returns
+    the paths written"""
+
+    if every <= 0:
+        raise ValueError("The checkpoint interval must be positive")
+
+    paths = []
+    next_checkpoint = engine.time + every
+
+    while True:
+        next_time = engine.next_event_time()
+
+        if next_time is None:
+            return paths
+
+        stop_time = next_checkpoint if until is None else min(next_checkpoint, until)
+
+        if next_time <= stop_time:
+            engine.step()
+            continue
+
+        engine.run_until(stop_time)
+
+        checkpoint_path = path.format(index=len(paths), time=engine.time)
+        save_checkpoint(engine, checkpoint_path)
+        paths.append(checkpoint_path)
+
+        if until is not None and stop_time >= until:
+            return paths
+
+        next_checkpoint += every
@@ -0,0 +1,67 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import time
+
+
+# Clock modes offered by the MainWindow
+
+CLOCK_MODES = [
+    "Real Time",
+    "Virtual (Fixed Step)",
+    "Virtual (Event Driven)"
+]
+
+
+class WallClock():
+    """Advance the simulation by the wall clock time elapsed between ticks,
+    results depend on the host load so two runs never match"""
+
+    def __init__(self, _speed=1):
+        self.speed = _speed
+        self.last_timestamp = None
+
+
+    def next_time(self, engine):
+
+        now = time.time()
+        dt = now - self.last_timestamp if self.last_timestamp is not None else 0
+        self.last_timestamp = now
+
+        return engine.time + dt * self.speed
+
+
+class VirtualClock():
+    """Advance the simulation by a fixed step every tick, or straight to the
+    next event when no step is given, so runs are reproducible"""
+
+    def __init__(self, _step=None):
+        self.step = _step
+
+
+    def next_time(self, engine):
+
+        if self.step is not None:
+            return engine.time + self.step
+
+        next_event_time = engine.next_event_time()
+        return next_event_time if next_event_time is not None else engine.time
+
+
+def make_clock(mode, step=0.1):
+    """Build the clock for one of the CLOCK_MODES"""
+
+    if mode == "Virtual (Fixed Step)":
+        return VirtualClock(step)
+
+    if mode == "Virtual (Event Driven)":
+        return VirtualClock()
+
+    return WallClock()
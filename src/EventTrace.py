@@ -0,0 +1,404 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import mmap
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+
+from src.SimulationEngine import ARRIVAL, DISPATCH, PREEMPT, BLOCK, UNBLOCK, FINISH
+
+
+# File layout: a header (magic, cpus, processes, algorithm) followed by fixed width
+# records (time, event kind, cpu, pid) in the order the engine emitted them
+
+MAGIC = b"PSTRACE\x01"
+
+HEADER = struct.Struct("<8sH6xq40s")
+RECORD = struct.Struct("<dBHq")
+
+BUFFER_RECORDS = 65536
+
+# Records replayed at most from a keyframe to any position. A keyframe holds the ready
+# and blocked pids, they are at least KEYFRAME_RECORDS_PER_PID records apart per pid so
+# keyframes take at most 2 bytes per record, a tenth of the trace
+
+KEYFRAME_RECORDS = 50000
+KEYFRAME_RECORDS_PER_PID = 4
+
+TRACE_FILE_TYPES = [("Event traces", "*.trace"), ("All files", "*.*")]
+
+
+class TraceWriter():
+    """Buffered appender of event records, its append method is an engine listener"""
+
+    def __init__(self, _path, _cpus=1, _processes=0, _algorithm="", _buffer_records=BUFFER_RECORDS):
+        self.file = open(_path, "wb")
+        self.file.write(HEADER.pack(MAGIC, _cpus, _processes, _algorithm.encode()[:40]))
+
+        self.buffer = bytearray(_buffer_records * RECORD.size)
+        self.offset = 0
+        self.records = 0
+
+
+    def append(self, kind, time, process):
+
+        RECORD.pack_into(self.buffer, self.offset, time, kind, process.cpu or 0, process.pid)
+        self.offset += RECORD.size
+        self.records += 1
+
+        if self.offset == len(self.buffer):
+            self.flush()
+
+
+    def flush(self):
+
+        self.file.write(memoryview(self.buffer)[:self.offset])
+        self.offset = 0
+
+
+    def close(self):
+
+        if self.file.closed:
+            return
+
+        self.flush()
+        self.file.close()
+
+
+def record_trace(engine, path):
+    """Write every event of the engine to a trace file, the writer must be closed once done.
+    Records store the PID as a 64 bit integer"""
+
+    if engine.processes is not None and not all(isinstance(process.pid, int) for process in engine.processes):
+        raise ValueError("Event traces need integer PIDs")
+
+    writer = TraceWriter(path, engine.cpus, engine.total_processes, engine.algorithm)
+    engine.add_listener(writer.append)
+
+    return writer
+
+
+class TraceTimes():
+    """Sequence of the record times read straight from the mapped file, for bisect"""
+
+    def __init__(self, _reader):
+        self.reader = _reader
+
+
+    def __len__(self):
+        return len(self.reader)
+
+
+    def __getitem__(self, index):
+        return struct.unpack_from("<d", self.reader.data, HEADER.size + index * RECORD.size)[0]
+
+
+class TraceReader():
+    """Memory mapped trace, records are decoded on demand so the file never has to fit in RAM"""
+
+    def __init__(self, _path):
+        self.file = open(_path, "rb")
+
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:                  # Empty files cannot be mapped
+            self.file.close()
+            raise ValueError(f"{_path} is not an event trace")
+
+        if len(self.data) < HEADER.size:
+            self.close()
+            raise ValueError(f"{_path} is not an event trace")
+
+        magic, self.cpus, self.processes, algorithm = HEADER.unpack_from(self.data)
+
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{_path} is not an event trace")
+
+        self.algorithm = algorithm.rstrip(b"\x00").decode()
+        self.count = (len(self.data) - HEADER.size) // RECORD.size
+        self.times = TraceTimes(self)
+
+
+    def __len__(self):
+        return self.count
+
+
+    def __getitem__(self, index):
+        return RECORD.unpack_from(self.data, HEADER.size + index * RECORD.size)
+
+
+    def records(self, start=0, stop=None):
+        """Iterate over the records [start, stop) decoding them in bulk"""
+
+        stop = self.count if stop is None else stop
+        view = memoryview(self.data)[HEADER.size + start * RECORD.size:HEADER.size + stop * RECORD.size]
+
+        try:
+            yield from RECORD.iter_unpack(view)
+        finally:
+            view.release()
+
+
+    def index_at(self, time):
+        """Number of records that happened at or before the time"""
+
+        return bisect_right(self.times, time, 0, self.count)
+
+
+    @property
+    def end_time(self):
+        return self.times[self.count - 1] if self.count else 0
+
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+
+class FinishedRecords():
+    """(pid, finish time) of the processes finished before a replay position, read
+    from the mapped trace through the record indices of its finish events"""
+
+    def __init__(self, _reader, _indices, _count):
+        self.reader = _reader
+        self.indices = _indices
+        self.count = _count
+
+
+    def __len__(self):
+        return self.count
+
+
+    def __getitem__(self, index):
+
+        if index < 0:
+            index += self.count
+
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+
+        time, _, _, pid = self.reader[self.indices[index]]
+        return pid, time
+
+
+    def window(self, start, stop):
+        """Rows [start, stop), read without going over the ones before"""
+
+        return [self[index] for index in range(start, min(stop, self.count))]
+
+
+class ReplayState():
+    """Scheduler state at a position of a trace, every transition can be applied and undone"""
+
+    def __init__(self, _reader):
+        self.reader = _reader
+        self.cpus = max(1, _reader.cpus)
+
+        # Sets of pids (dicts for O(1) updates) and the running pid of each cpu. Undoing a
+        # dispatch or a wake up can not restore the position of the pid in its set, use
+        # ready_pids and blocked_pids for a stable order
+
+        self.ready_processes = {}
+        self.blocked_processes = {}
+        self.running = [None] * self.cpus
+
+        self.position = 0
+        self.time = 0
+        self.busy_time = 0
+
+
+    @property
+    def busy_cpus(self):
+        return sum(1 for pid in self.running if pid is not None)
+
+
+    def apply(self, time, kind, cpu, pid):
+
+        self.busy_time += self.busy_cpus * (time - self.time)
+        self.time = time
+        self.position += 1
+
+        if kind == ARRIVAL:
+            self.ready_processes[pid] = None
+        elif kind == DISPATCH:
+            self.ready_processes.pop(pid, None)
+            self.running[cpu] = pid
+        elif kind == PREEMPT:
+            self.running[cpu] = None
+            self.ready_processes[pid] = None
+        elif kind == BLOCK:
+            self.running[cpu] = None
+            self.blocked_processes[pid] = None
+        elif kind == UNBLOCK:
+            self.blocked_processes.pop(pid, None)
+            self.ready_processes[pid] = None
+        elif kind == FINISH:
+            self.running[cpu] = None
+
+
+    def undo(self, time, kind, cpu, pid):
+
+        self.busy_time -= self.busy_cpus * (self.time - time)
+        self.time = time
+        self.position -= 1
+
+        if kind == ARRIVAL:
+            self.ready_processes.pop(pid, None)
+        elif kind == DISPATCH:
+            self.running[cpu] = None
+            self.ready_processes[pid] = None
+        elif kind == PREEMPT:
+            self.ready_processes.pop(pid, None)
+            self.running[cpu] = pid
+        elif kind == BLOCK:
+            self.blocked_processes.pop(pid, None)
+            self.running[cpu] = pid
+        elif kind == UNBLOCK:
+            self.ready_processes.pop(pid, None)
+            self.blocked_processes[pid] = None
+        elif kind == FINISH:
+            self.running[cpu] = pid
+
+        # Going back over the record leaves the clock at the previous one
+
+        previous_time = self.reader.times[self.position - 1] if self.position else 0
+        self.busy_time -= self.busy_cpus * (self.time - previous_time)
+        self.time = previous_time
+
+
+    def keyframe(self):
+        """Compact copy of the state, pids are kept in arrays of 64 bit integers"""
+
+        return (self.position, self.time, self.busy_time, tuple(self.running),
+                array("q", self.ready_processes), array("q", self.blocked_processes))
+
+
+    def restore(self, keyframe):
+
+        self.position, self.time, self.busy_time, running, ready, blocked = keyframe
+
+        self.running = list(running)
+        self.ready_processes = dict.fromkeys(ready)
+        self.blocked_processes = dict.fromkeys(blocked)
+
+
+class TraceReplay(ReplayState):
+    """Scheduler state rebuilt from a trace. An index scan running ahead of the replay
+    saves keyframes of the state and the positions of the finish records, so a seek
+    restores the nearest keyframe (or starts from the current position when that is
+    closer) and only replays or undoes the records from there. index can be called in
+    small chunks before seeking so a long trace never has to be scanned at once"""
+
+    def __init__(self, _reader):
+        super().__init__(_reader)
+
+        self.scan = ReplayState(_reader)
+        self.finish_indices = array("q")
+
+        self.keyframes = [self.scan.keyframe()]
+        self.keyframe_positions = [0]
+        self.next_keyframe = KEYFRAME_RECORDS
+
+
+    @property
+    def finished(self):
+        return self.position == len(self.reader)
+
+
+    @property
+    def indexed(self):
+        return self.scan.position == len(self.reader)
+
+
+    @property
+    def indexed_time(self):
+        """Time up to which seeking does not need to scan the trace"""
+
+        return self.reader.end_time if self.indexed else self.scan.time
+
+
+    @property
+    def finished_processes(self):
+        return FinishedRecords(self.reader, self.finish_indices, bisect_left(self.finish_indices, self.position))
+
+
+    def ready_pids(self):
+        """Ready pids in pid order, the same whichever direction the replay was seeked"""
+
+        return sorted(self.ready_processes)
+
+
+    def blocked_pids(self):
+        return sorted(self.blocked_processes)
+
+
+    def index(self, records=None):
+        """Scan the given number of records (by default all) past the indexed part.
+        A keyframe is saved every KEYFRAME_RECORDS records, or more apart when the
+        state is large. Returns whether the whole trace is indexed"""
+
+        scan = self.scan
+        stop = len(self.reader) if records is None else min(len(self.reader), scan.position + records)
+
+        for record in self.reader.records(scan.position, stop):
+            scan.apply(*record)
+
+            if record[1] == FINISH:
+                self.finish_indices.append(scan.position - 1)
+
+            if scan.position < self.next_keyframe:
+                continue
+
+            size = len(scan.ready_processes) + len(scan.blocked_processes)
+            self.next_keyframe = self.keyframe_positions[-1] + max(KEYFRAME_RECORDS, KEYFRAME_RECORDS_PER_PID * size)
+
+            if scan.position >= self.next_keyframe:
+                self.keyframes.append(scan.keyframe())
+                self.keyframe_positions.append(scan.position)
+                self.next_keyframe = scan.position + KEYFRAME_RECORDS
+
+        return self.indexed
+
+
+    def seek(self, time):
+        """Move the state to the given time"""
+
+        target = self.reader.index_at(time)
+
+        if target > self.scan.position:
+            self.index(target - self.scan.position)
+
+        keyframe = bisect_right(self.keyframe_positions, target) - 1
+
+        if target - self.keyframe_positions[keyframe] < abs(target - self.position):
+            self.restore(self.keyframes[keyframe])
+
+        if target > self.position:
+            for record in self.reader.records(self.position, target):
+                self.apply(*record)
+        else:
+            for index in range(self.position - 1, target - 1, -1):
+                self.undo(*self.reader[index])
+
+        self.busy_time += self.busy_cpus * (time - self.time)
+        self.time = time
+
+
+    def statistics(self):
+
+        simulation_time = self.time if self.time > 0 else 0.1
+
+        return {
+            "cpu_usage": (self.busy_time / (simulation_time * self.cpus)) * 100,
+            "simulation_time": self.time,
+            "completed": bisect_left(self.finish_indices, self.position)
+        }
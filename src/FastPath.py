@@ -0,0 +1,124 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+from array import array
+
+import numpy as np
+
+from src.SimulationEngine import BLOCK_PROBABILITY
+from src.Statistics import SimulationStatistics
+
+
+FAST_PATH_ALGORITHMS = ["FIFO", "SJF", "PrioritySelection (Non-Preemptive)"]
+
+
+def can_use_fast_path(table, algorithm, options=None):
+    """Non preemptive policies on a single CPU without blocking run the processes
+    in a fixed order: arrival order for FIFO, and for SJF and priority the
+    sorted order when every process arrives at the same time"""
+
+    options = options or {}
+
+    if algorithm not in FAST_PATH_ALGORITHMS or len(table) == 0:
+        return False
+
+    if options.get("_block_probability", BLOCK_PROBABILITY) != 0 or options.get("_blocking") is not None or options.get("_cpus", 1) != 1:
+        return False
+
+    if options.get("_policy_options"):          # Left to the engine, which rejects them
+        return False
+
+    if algorithm == "FIFO":
+        return True
+
+    arrival_times = np.frombuffer(table.arrival_time, dtype=np.float64)
+    return arrival_times.min() == arrival_times.max()
+
+
+def fast_path_statistics(table, algorithm, options=None):
+    """Every per process metric computed in one vectorized pass, returns None
+    when the schedule is not a plain sort and the engine must be used"""
+
+    if not can_use_fast_path(table, algorithm, options):
+        return None
+
+    table.sort_by_arrival()
+
+    arrival_times = np.frombuffer(table.arrival_time, dtype=np.float64)
+    burst_times = np.frombuffer(table.burst_time, dtype=np.float64)
+
+    # Running order, stable sorts keep the engine tie breaking (arrival order)
+
+    if algorithm == "FIFO":
+        order = np.arange(len(table))
+    elif algorithm == "SJF":
+        order = np.argsort(burst_times, kind="stable")
+    else:
+        order = np.argsort(-np.frombuffer(table.priority, dtype=np.int64), kind="stable")
+
+    arrival = arrival_times[order]
+    burst = burst_times[order]
+
+    # finish_i = C_i + max over j <= i of (arrival_j - C_j-1), with C the cumulative burst
+    # time, accounts for the CPU staying idle until a process arrives
+
+    cumulative = np.cumsum(burst)
+    previous = np.concatenate(([0.0], cumulative[:-1]))
+    finish = cumulative + np.maximum.accumulate(arrival - previous)
+
+    start = finish - burst
+    waiting = start - arrival
+    execution = finish - arrival
+
+    # Results back to the table rows
+
+    finish_times = np.empty_like(finish)
+    finish_times[order] = finish
+    waiting_times = np.empty_like(waiting)
+    waiting_times[order] = waiting
+
+    table.finish_time = array("d", finish_times.tobytes())
+    table.waiting_time = array("d", waiting_times.tobytes())
+    table.blocked_time = array("d", bytes(8 * len(table)))
+
+    stats = SimulationStatistics()
+    stats.completed = len(table)
+    fill_metric(stats.waiting_time, waiting)
+    fill_metric(stats.execution_time, execution)
+
+    simulation_time = float(finish[-1]) if finish[-1] > 0 else 0.1
+
+    statistics = {
+        "cpu_usage": (float(burst.sum()) / simulation_time) * 100,
+        "simulation_time": float(finish[-1])
+    }
+    statistics.update(stats.summary())
+
+    return statistics
+
+
+def fill_metric(metric, values):
+    """Load a whole array into a Metric (running stat and quantile sketch) at once"""
+
+    stat = metric.stat
+    stat.count = len(values)
+    stat.total = float(values.sum())
+    stat.mean = stat.total / stat.count
+    stat.m2 = float(((values - stat.mean) ** 2).sum())
+    stat.min = float(values.min())
+    stat.max = float(values.max())
+
+    sketch = metric.sketch
+    positive = values[values > 0]
+    sketch.count = len(values)
+    sketch.zero_count = len(values) - len(positive)
+
+    indices, counts = np.unique(np.ceil(np.log(positive) / sketch.log_gamma).astype(np.int64), return_counts=True)
+    sketch.buckets = dict(zip(indices.tolist(), counts.tolist()))
@@ -0,0 +1,122 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from src.SimulationEngine import ALGORITHMS, QUANTUM, BLOCK_PROBABILITY, BLOCK_DURATION
+from src.Policies import POLICIES, check_policy_options
+from src.BatchRunner import as_table, run_algorithm
+from src.ResultCache import ResultCache, workload_digest, make_key
+
+
+# Bump when the engine changes its results so cached cells are not reused
+
+CACHE_VERSION = 2
+
+
+def accepts_options(algorithm, options):
+
+    try:
+        check_policy_options(algorithm, options)
+    except ValueError:
+        return False
+
+    return True
+
+
+def sweep_grid(algorithms=ALGORITHMS, quanta=(QUANTUM,), block_probabilities=(BLOCK_PROBABILITY,), block_durations=(BLOCK_DURATION,),
+               policy_variants=(None,)):
+    """Cells of the grid quantum x block probability x block duration x policy options
+    x algorithm. Parameters that do not affect a cell are left out so it is
+    only simulated once (the quantum only matters for policies that use it,
+    the duration only when processes can block and each dict of policy
+    options only for the policies that take it, e.g. {"levels": 4} for MLFQ)"""
+
+    cells = []
+
+    for algorithm in algorithms:
+        variants = [options for options in policy_variants if options and accepts_options(algorithm, options)] or [None]
+
+        for quantum in (quanta if POLICIES[algorithm].uses_quantum else [None]):
+            for block_probability in block_probabilities:
+                for block_duration in (block_durations if block_probability > 0 else [None]):
+                    for options in variants:
+                        cells.append({
+                            "algorithm": algorithm,
+                            "quantum": quantum,
+                            "block_probability": block_probability,
+                            "block_duration": list(block_duration) if block_duration else None,
+                            "policy_options": options
+                        })
+
+    return cells
+
+
+def run_cell(table, cell, seed):
+
+    options = {"_block_probability": cell["block_probability"]}
+
+    if cell["quantum"] is not None:
+        options["_quantum"] = cell["quantum"]
+
+    if cell["block_duration"] is not None:
+        options["_block_duration"] = tuple(cell["block_duration"])
+
+    if cell["policy_options"] is not None:
+        options["_policy_options"] = cell["policy_options"]
+
+    statistics = run_algorithm(table, cell["algorithm"], seed, options)
+    statistics.update(cell)
+
+    return statistics
+
+
+def sweep(workload, algorithms=ALGORITHMS, quanta=(QUANTUM,), block_probabilities=(BLOCK_PROBABILITY,), block_durations=(BLOCK_DURATION,),
+          seed=0, cache=None, max_workers=None, policy_variants=(None,)):
+    """Run every cell of the grid across worker processes and return one row of
+    statistics per cell. Results are cached on disk by workload and parameters
+    so running the sweep again only simulates the cells that are new. Unseeded
+    runs (seed None) are not reproducible so they never use the cache"""
+
+    table = as_table(workload)
+    cells = sweep_grid(algorithms, quanta, block_probabilities, block_durations, policy_variants)
+
+    if seed is None:
+        cache = None
+        keys = [None] * len(cells)
+        rows = [None] * len(cells)
+    else:
+        cache = cache if cache is not None else ResultCache()
+        digest = workload_digest(table)
+        keys = [make_key(digest, {"cell": cell, "seed": seed, "version": CACHE_VERSION}) for cell in cells]
+        rows = [cache.get(key) for key in keys]
+
+    missing = [index for index, row in enumerate(rows) if row is None]
+
+    if len(missing) <= 1 or max_workers == 1:
+        for index in missing:
+            rows[index] = run_cell(table, cells[index], seed)
+
+            if cache is not None:
+                cache.put(keys[index], rows[index])
+
+        return rows
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(run_cell, table, cells[index], seed): index for index in missing}
+
+        for future in as_completed(futures):
+            index = futures[future]
+            rows[index] = future.result()
+
+            if cache is not None:
+                cache.put(keys[index], rows[index])
+
+    return rows
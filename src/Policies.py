@@ -0,0 +1,491 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+from src.ReadyQueues import FifoQueue, HeapQueue, RandomQueue, MultiLevelQueue, LotteryQueue
+
+
+# Registered policies by name, in the order they are shown to the user
+
+POLICIES = {}
+
+
+def register_policy(policy_class):
+    """Make a Policy subclass available to the engine under its name, usable as a decorator"""
+
+    POLICIES[policy_class.name] = policy_class
+    return policy_class
+
+
+def policy_names():
+    return list(POLICIES)
+
+
+def check_policy_options(name, options):
+    """Raise ValueError when the algorithm does not exist or does not take every option"""
+
+    if name not in POLICIES:
+        raise ValueError(f"Unknown algorithm: {name}")
+
+    unknown = set(options or {}) - set(POLICIES[name].option_names)
+
+    if unknown:
+        raise ValueError(f"Unknown options for {name}: {', '.join(sorted(unknown))}")
+
+
+def policy_options(name, options):
+    """The entries of options the algorithm takes, to share one set of tuning options
+    between several algorithms"""
+
+    return {key: value for key, value in (options or {}).items() if key in POLICIES[name].option_names}
+
+
+def make_policy(name, engine, quantum=None, options=None):
+
+    check_policy_options(name, options)
+
+    return POLICIES[name](engine, quantum, options)
+
+
+class Policy():
+    """Scheduling decisions of an algorithm. The engine owns the clock, the
+    cores and the events, and asks its policy which ready queue to use, which
+    process runs next, whether a ready process must preempt a running one and
+    what happens when a time slice expires. The defaults are plain FIFO"""
+
+    name = None
+
+    # Preemptive policies are asked on_preempt_check after every scheduling round
+
+    preemptive = False
+
+    # Whether the quantum given to the engine changes the results
+
+    uses_quantum = False
+
+    # Names of the tuning options taken by the policy (SimulationEngine _policy_options)
+
+    option_names = ()
+
+    def __init__(self, _engine, _quantum=None, _options=None):
+        self.engine = _engine
+        self.rng = _engine.rng
+
+
+    def make_queue(self):
+        """Ready queue structure, one per core with per core queues"""
+
+        return FifoQueue()
+
+
+    def select(self, ready_processes):
+        """Take the process to dispatch out of a non empty ready queue"""
+
+        return ready_processes.pop()
+
+
+    def on_arrival(self, process):
+        """Called when a process arrives, before it is enqueued"""
+
+
+    def on_preempt_check(self, candidate, running):
+        """Whether the best ready process must take the CPU from the running one"""
+
+        return False
+
+
+    def running_key(self, process):
+        """Heap key of a running process, the worst one to keep on the CPU first"""
+
+        return 0
+
+
+    def quantum(self, process):
+        """Length of the next time slice of the process, None to run until it finishes or blocks"""
+
+        return None
+
+
+    def on_quantum_expiry(self, process, core):
+        """Called when the slice of the process ran out, by default it goes back to the queue of its core"""
+
+        self.engine.enqueue(process, core)
+
+
+    def on_finish(self, process):
+        """Called once the process has finished"""
+
+
+    def statistics(self):
+        """Policy specific figures added to the engine statistics"""
+
+        return {}
+
+
+# Ready queue keys, plain functions so the queues (and engine checkpoints) can be pickled
+
+def shortest_remaining(process):
+    return process.remaining_burst_time
+
+
+def highest_priority(process):
+    return -process.priority
+
+
+@register_policy
+class FifoPolicy(Policy):
+    name = "FIFO"
+
+
+@register_policy
+class SjfPolicy(Policy):
+    name = "SJF"
+
+    def make_queue(self):
+        return HeapQueue(shortest_remaining)
+
+
+@register_policy
+class RandomPolicy(Policy):
+    name = "RandomSelection"
+
+    def make_queue(self):
+        return RandomQueue(self.rng)
+
+
+@register_policy
+class PriorityPolicy(Policy):
+    name = "PrioritySelection (Non-Preemptive)"
+
+    def make_queue(self):
+        return HeapQueue(highest_priority)
+
+
+@register_policy
+class RoundRobinPolicy(Policy):
+    name = "RoundRobin"
+    uses_quantum = True
+
+    def __init__(self, _engine, _quantum=None, _options=None):
+        super().__init__(_engine, _quantum, _options)
+        self.time_slice = _quantum
+
+
+    def quantum(self, process):
+        return self.time_slice
+
+
+@register_policy
+class SrtfPolicy(Policy):
+    name = "SRTF"
+    preemptive = True
+
+    def make_queue(self):
+        return HeapQueue(shortest_remaining)
+
+
+    def on_preempt_check(self, candidate, running):
+        return candidate.remaining_burst_time < self.engine.remaining_burst_time(running)
+
+
+    def running_key(self, process):
+        """The remaining time at dispatch plus the dispatch time keeps the same order
+        while every running process advances"""
+
+        return -(process.remaining_burst_time + process.dispatched_at)
+
+
+@register_policy
+class PreemptivePriorityPolicy(Policy):
+    name = "PrioritySelection (Preemptive)"
+    preemptive = True
+
+    def make_queue(self):
+        return HeapQueue(highest_priority)
+
+
+    def on_preempt_check(self, candidate, running):
+        return candidate.priority > running.priority
+
+
+    def running_key(self, process):
+        return process.priority
+
+
+# Smallest slice worth dispatching, below it the allotment counts as used up
+
+EPSILON = 1e-9
+
+
+@register_policy
+class MlfqPolicy(Policy):
+    """Multi level feedback queue. Processes arrive at the top level, a process
+    that uses up the allotment of its level (its quantum, counted across
+    preemptions and blocks) drops one level, and every boost_period all of
+    them go back to the top. A higher level preempts a lower one. The quantum
+    doubles at every level starting from the engine quantum.
+
+    The options levels, quanta (one per level) and boost_period override the
+    defaults below, giving only the quanta sets the number of levels"""
+
+    name = "MLFQ"
+    preemptive = True
+    uses_quantum = True
+    option_names = ("levels", "quanta", "boost_period")
+
+    levels = 3
+    boost_period = 50
+
+    def __init__(self, _engine, _quantum=None, _options=None):
+        super().__init__(_engine, _quantum, _options)
+
+        options = _options or {}
+        quanta = options.get("quanta")
+
+        self.levels = int(options.get("levels", len(quanta) if quanta else self.levels))
+        self.boost_period = options.get("boost_period", self.boost_period)
+        self.quanta = list(quanta) if quanta else [(_quantum or 1) * 2 ** level for level in range(self.levels)]
+
+        if self.levels < 1 or len(self.quanta) != self.levels:
+            raise ValueError("MLFQ needs at least one level and one quantum per level")
+
+        if min(self.quanta) <= 0 or self.boost_period <= 0:
+            raise ValueError("MLFQ quanta and boost period must be positive")
+
+        self.next_boost = self.boost_period
+
+        # [level, CPU time used at the level, remaining burst time at the last charge,
+        # time of the last charge] of every process that has not finished
+
+        self.states = {}
+        self.queues = []
+
+        self.level_cpu_time = [0] * self.levels
+        self.level_dispatches = [0] * self.levels
+        self.demotions = 0
+        self.boosts = 0
+
+
+    def make_queue(self):
+        queue = MultiLevelQueue(self.levels, self.level_of)
+        self.queues.append(queue)
+        return queue
+
+
+    def level_of(self, process):
+        return self.states[process][0]
+
+
+    def on_arrival(self, process):
+        self.check_boost()
+        self.states[process] = [0, 0, process.remaining_burst_time, self.engine.time]
+
+
+    def check_boost(self):
+        """Boosts are applied lazily, before the first decision or level change after
+        they are due. Nothing reads the levels of the ready processes in between
+        so for them it is the same as boosting on time, a slice running across a
+        boost still ends with the quantum of its old level but is only charged
+        the time run since the boost"""
+
+        if self.engine.time < self.next_boost:
+            return
+
+        while self.next_boost <= self.engine.time:
+            boost_time = self.next_boost
+            self.next_boost += self.boost_period
+
+        self.boosts += 1
+
+        for queue in self.queues:
+            queue.merge_levels()
+
+        for process, state in self.states.items():
+            self.charge(process, state, boost_time)
+            state[0] = 0
+            state[1] = 0
+
+
+    def charge(self, process, state, time=None):
+        """Account the CPU time run since the last charge (up to the time, by default
+        now) to the level of the process"""
+
+        time = self.engine.time if time is None else time
+        remaining = process.remaining_burst_time
+
+        if process.cpu is not None and self.engine.cores[process.cpu].current_process is process:
+            remaining -= max(0, time - process.dispatched_at)
+        elif state[2] > remaining:
+            # Released since the last charge, only the part of that run before the time counts
+
+            start = max(process.dispatched_at, state[3])
+            remaining = max(remaining, state[2] - max(0, time - start))
+
+        used = state[2] - remaining
+
+        state[1] += used
+        state[2] = remaining
+        state[3] = time
+        self.level_cpu_time[state[0]] += used
+
+
+    def select(self, ready_processes):
+        self.check_boost()
+        return ready_processes.pop()
+
+
+    def on_preempt_check(self, candidate, running):
+        self.check_boost()
+        return self.states[candidate][0] < self.states[running][0]
+
+
+    def running_key(self, process):
+        return -self.states[process][0]
+
+
+    def quantum(self, process):
+        """What is left of the allotment of the process at its level"""
+
+        self.check_boost()
+        state = self.states[process]
+        self.charge(process, state)
+
+        if self.quanta[state[0]] - state[1] <= EPSILON:
+            self.demote(state)
+
+        self.level_dispatches[state[0]] += 1
+
+        return self.quanta[state[0]] - state[1]
+
+
+    def demote(self, state):
+
+        if state[0] < self.levels - 1:
+            state[0] += 1
+            self.demotions += 1
+
+        state[1] = 0
+
+
+    def on_quantum_expiry(self, process, core):
+        self.check_boost()
+        state = self.states[process]
+        self.charge(process, state)
+
+        # A slice that ran across a boost only used part of the new top level allotment
+
+        if state[1] >= self.quanta[state[0]] - EPSILON:
+            self.demote(state)
+
+        self.engine.enqueue(process, core)
+
+
+    def on_finish(self, process):
+        self.check_boost()
+        state = self.states.pop(process)
+        self.level_cpu_time[state[0]] += state[2]
+
+
+    def statistics(self):
+        total = sum(self.level_cpu_time) or 1
+
+        return {
+            "level_cpu_time": list(self.level_cpu_time),
+            "level_residency": [(cpu_time / total) * 100 for cpu_time in self.level_cpu_time],
+            "level_dispatches": list(self.level_dispatches),
+            "demotions": self.demotions,
+            "boosts": self.boosts
+        }
+
+
+def priority_tickets(process):
+    """Tickets of a process for proportional share policies, higher priorities get
+    more and every process gets at least one"""
+
+    return max(1, process.priority)
+
+
+@register_policy
+class LotteryPolicy(Policy):
+    """Lottery scheduling, every time slice goes to a process drawn at random with
+    a chance proportional to its tickets (its priority)"""
+
+    name = "Lottery"
+    uses_quantum = True
+
+    def __init__(self, _engine, _quantum=None, _options=None):
+        super().__init__(_engine, _quantum, _options)
+        self.time_slice = _quantum
+
+
+    def make_queue(self):
+        return LotteryQueue(self.rng, priority_tickets)
+
+
+    def quantum(self, process):
+        return self.time_slice
+
+
+@register_policy
+class StridePolicy(Policy):
+    """Stride scheduling, the deterministic counterpart of lottery scheduling. Each
+    process advances a pass value by the CPU time it uses divided by its tickets
+    and the lowest pass runs next. Arrivals start at the pass of the last
+    selected process so they can not monopolize the CPU"""
+
+    name = "Stride"
+    uses_quantum = True
+
+    def __init__(self, _engine, _quantum=None, _options=None):
+        super().__init__(_engine, _quantum, _options)
+        self.time_slice = _quantum
+        self.global_pass = 0
+
+        # [pass, remaining burst time when the pass was last advanced] of every process
+        # that has not finished
+
+        self.states = {}
+
+
+    def make_queue(self):
+        return HeapQueue(self.pass_value)
+
+
+    def pass_value(self, process):
+        """Pass of the process charging the CPU time it used since the last call,
+        it is only called while the process is off the CPU"""
+
+        state = self.states[process]
+        used = state[1] - process.remaining_burst_time
+
+        if used:
+            state[0] += used / priority_tickets(process)
+            state[1] = process.remaining_burst_time
+
+        return state[0]
+
+
+    def on_arrival(self, process):
+        self.states[process] = [self.global_pass, process.remaining_burst_time]
+
+
+    def select(self, ready_processes):
+        process = ready_processes.pop()
+        self.global_pass = self.states[process][0]
+
+        return process
+
+
+    def quantum(self, process):
+        return self.time_slice
+
+
+    def on_finish(self, process):
+        del self.states[process]
+
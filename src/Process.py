@@ -9,6 +9,14 @@ Developed at: September 2024
 
 
 class Process():
+    """Scheduling record of a single process, slotted so each instance
+    stays small when many of them are alive at once"""
+    
+    __slots__ = (
+        "pid", "arrival_time", "burst_time", "priority", "waiting_time",
+        "remaining_burst_time", "blocked_time", "enqueued_at",
+        "dispatched_at", "blocked_until", "time_to_block", "index", "cpu"
+    )
     
     def __init__(self, _pid, _arrival_time, _burst_time, _priority):
         self.pid = _pid
@@ -17,17 +25,23 @@ class Process():
         self.priority = _priority
         self.waiting_time = 0
         self.remaining_burst_time = self.burst_time
-        self.blocked = False
         self.blocked_time = 0
-        self.blocked_max_time = 0
         
+        # State transition timestamps, timers are derived from them instead of
+        # being accumulated on every tick
+        
+        self.enqueued_at = 0
+        self.dispatched_at = 0
+        self.blocked_until = 0
+        
+        # CPU time left until the process blocks, None until the blocking model draws it
+        
+        self.time_to_block = None
+        
+        # Row of the process in its ProcessTable, if it comes from one
         
-    def still_bloked(self, dt):
+        self.index = None
         
-        self.blocked_time += dt
+        # Core the process last ran on
         
-        if self.blocked_time >= self.blocked_max_time:
-            self.blocked = False
-            return self.blocked
-        else:
-            return True           
\ No newline at end of file
+        self.cpu = None
@@ -0,0 +1,182 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+from array import array
+
+from src.Process import Process
+
+
+class ProcessTable():
+    """Columnar workload storage backed by typed arrays, a job takes 32 bytes
+    (plus 24 more once results are recorded) instead of a full Process
+    object. The engine reads rows by index and only builds Process records
+    for the jobs that are currently in the system"""
+
+    def __init__(self):
+        self.pid = array("q")
+        self.arrival_time = array("d")
+        self.burst_time = array("d")
+        self.priority = array("q")
+
+        # PIDs typed as text (e.g. "P1") are stored as negative ids, with their labels here
+
+        self.labels = {}
+        self.label_ids = {}
+
+        # Per process results written by the engine as processes finish
+
+        self.waiting_time = None
+        self.finish_time = None
+        self.blocked_time = None
+
+
+    def __len__(self):
+        return len(self.pid)
+
+
+    @property
+    def nbytes(self):
+        columns = [self.pid, self.arrival_time, self.burst_time, self.priority, self.waiting_time, self.finish_time, self.blocked_time]
+        return sum(column.itemsize * len(column) for column in columns if column is not None)
+
+
+    def append(self, pid, arrival_time, burst_time, priority):
+        self.pid.append(int(pid))
+        self.arrival_time.append(arrival_time)
+        self.burst_time.append(burst_time)
+        self.priority.append(int(priority))
+
+
+    def pid_of(self, label):
+        """PID to store for a label given by the user, a non negative integer is kept as
+        is and any other label gets a negative id of its own"""
+
+        label = str(label).strip()
+
+        if label.isascii() and label.isdigit():
+            return int(label)
+
+        if label not in self.label_ids:
+            pid = -(len(self.label_ids) + 1)
+            self.label_ids[label] = pid
+            self.labels[pid] = label
+
+        return self.label_ids[label]
+
+
+    def label(self, pid):
+        """PID as the user gave it"""
+
+        return self.labels.get(pid, pid)
+
+
+    def extend(self, pids, arrival_times, burst_times, priorities):
+        """Append whole columns at once (lists, arrays or any buffer of the right type)"""
+
+        self.pid.extend(array("q", pids))
+        self.arrival_time.extend(array("d", arrival_times))
+        self.burst_time.extend(array("d", burst_times))
+        self.priority.extend(array("q", priorities))
+
+
+    def extend_buffers(self, pids, arrival_times, burst_times, priorities):
+        """Append whole columns given as contiguous buffers of 64 bit integers and
+        doubles (e.g. NumPy arrays), copied as raw bytes instead of element by element"""
+
+        self.pid.frombytes(memoryview(pids).cast("B"))
+        self.arrival_time.frombytes(memoryview(arrival_times).cast("B"))
+        self.burst_time.frombytes(memoryview(burst_times).cast("B"))
+        self.priority.frombytes(memoryview(priorities).cast("B"))
+
+
+    def remove(self, index):
+        """Delete a row, O(n) so it is meant for interactive edits only"""
+
+        del self.pid[index]
+        del self.arrival_time[index]
+        del self.burst_time[index]
+        del self.priority[index]
+
+
+    def row(self, index):
+        return self.pid[index], self.arrival_time[index], self.burst_time[index], self.priority[index]
+
+
+    def copy(self):
+
+        table = ProcessTable()
+        table.pid = array("q", self.pid)
+        table.arrival_time = array("d", self.arrival_time)
+        table.burst_time = array("d", self.burst_time)
+        table.priority = array("q", self.priority)
+        table.labels = dict(self.labels)
+        table.label_ids = dict(self.label_ids)
+
+        return table
+
+
+    @classmethod
+    def from_processes(cls, processes):
+
+        table = cls()
+        for process in processes:
+            table.append(process.pid, process.arrival_time, process.burst_time, process.priority)
+
+        return table
+
+
+    def process(self, index):
+        """Build the Process record for the given row"""
+
+        process = Process(self.pid[index], self.arrival_time[index], self.burst_time[index], self.priority[index])
+        process.index = index
+
+        return process
+
+
+    def to_processes(self):
+        return [self.process(index) for index in range(len(self))]
+
+
+    def is_sorted_by_arrival(self):
+
+        arrival_time = self.arrival_time
+        return all(arrival_time[index] <= arrival_time[index + 1] for index in range(len(arrival_time) - 1))
+
+
+    def sort_by_arrival(self):
+        """Reorder the rows by arrival time in place (stable), returns the table"""
+
+        if self.is_sorted_by_arrival():
+            return self
+
+        order = sorted(range(len(self)), key=self.arrival_time.__getitem__)
+
+        self.pid = array("q", [self.pid[index] for index in order])
+        self.arrival_time = array("d", [self.arrival_time[index] for index in order])
+        self.burst_time = array("d", [self.burst_time[index] for index in order])
+        self.priority = array("q", [self.priority[index] for index in order])
+
+        return self
+
+
+    def allocate_results(self):
+
+        size = len(self)
+        self.waiting_time = array("d", bytes(8 * size))
+        self.finish_time = array("d", bytes(8 * size))
+        self.blocked_time = array("d", bytes(8 * size))
+
+
+    def record_result(self, index, waiting_time, finish_time, blocked_time):
+
+        self.waiting_time[index] = waiting_time
+        self.finish_time[index] = finish_time
+        self.blocked_time[index] = blocked_time
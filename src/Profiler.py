@@ -0,0 +1,128 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+from time import perf_counter_ns
+
+
+# Histogram bucket i holds the durations below 2**i nanoseconds
+
+BUCKETS = 64
+
+
+class PhaseHistogram():
+    """Count, total and log2 histogram of the durations of one phase"""
+
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.buckets = [0] * BUCKETS
+
+
+    def add(self, elapsed):
+        self.count += 1
+        self.total += elapsed
+        self.buckets[elapsed.bit_length()] += 1
+
+        if elapsed > self.max:
+            self.max = elapsed
+
+
+    def quantile(self, q):
+        """Upper bound in nanoseconds of the bucket holding the q quantile"""
+
+        if self.count == 0:
+            return 0
+
+        rank = q * self.count
+        seen = 0
+
+        for index, count in enumerate(self.buckets):
+            seen += count
+
+            if seen >= rank:
+                return min(1 << index, self.max)
+
+        return self.max
+
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "total_ns": self.total,
+            "mean_ns": self.total / self.count if self.count else 0,
+            "p50_ns": self.quantile(0.5),
+            "p99_ns": self.quantile(0.99),
+            "max_ns": self.max,
+            "buckets": {1 << index: count for index, count in enumerate(self.buckets) if count}
+        }
+
+
+class PhaseProfiler():
+    """Time spent per phase of the simulation loop. It is off by default and
+    while disabled measure() calls straight through, so it can stay attached"""
+
+    def __init__(self, _enabled=False):
+        self.enabled = _enabled
+        self.phases = {}
+
+
+    def enable(self):
+        self.enabled = True
+
+
+    def disable(self):
+        self.enabled = False
+
+
+    def reset(self):
+        self.phases = {}
+
+
+    def record(self, name, elapsed):
+        """Add a duration in nanoseconds to the phase histogram"""
+
+        phase = self.phases.get(name)
+
+        if phase is None:
+            phase = self.phases[name] = PhaseHistogram()
+
+        phase.add(elapsed)
+
+
+    def measure(self, name, function, *args):
+        """Call the function and, when enabled, record how long it took"""
+
+        if not self.enabled:
+            return function(*args)
+
+        start_timestamp = perf_counter_ns()
+        result = function(*args)
+        self.record(name, perf_counter_ns() - start_timestamp)
+
+        return result
+
+
+    def histograms(self):
+        return {name: phase.as_dict() for name, phase in self.phases.items()}
+
+
+    def report(self):
+        """Text table of the phases, the most expensive first"""
+
+        phases = sorted(self.phases.items(), key=lambda item: item[1].total, reverse=True)
+        lines = [f"{'Phase':<26}{'Calls':>9}{'Total ms':>10}{'Mean us':>9}{'p99 us':>9}"]
+
+        for name, phase in phases:
+            lines.append(f"{name:<26}{phase.count:>9}{phase.total / 1e6:>10.1f}{phase.total / phase.count / 1e3:>9.1f}{phase.quantile(0.99) / 1e3:>9.1f}")
+
+        return "\n".join(lines)
@@ -0,0 +1,339 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import heapq
+import itertools
+from collections import deque
+
+
+def queue_window(queue, start, stop):
+    """Processes [start, stop) of a ready queue in the order they will be served, for
+    viewers. Queues that do not iterate in that order define their own window"""
+
+    if hasattr(queue, "window"):
+        return queue.window(start, stop)
+
+    return list(itertools.islice(queue, start, stop))
+
+
+class FifoQueue():
+    """Ready queue served in arrival order, push and pop are O(1)"""
+
+    def __init__(self):
+        self.items = deque()
+
+
+    def __len__(self):
+        return len(self.items)
+
+
+    def __iter__(self):
+        return iter(self.items)
+
+
+    def push(self, process):
+        self.items.append(process)
+
+
+    def pop(self):
+        return self.items.popleft()
+
+
+    def peek(self):
+        return self.items[0]
+
+
+    def remove(self, process):
+        self.items.remove(process)
+
+
+class HeapQueue():
+    """Binary heap ordered by key(process) with lazy deletion, removed entries
+    stay in the heap marked as dead and are discarded when they reach the
+    top so every operation is O(log n)"""
+
+    def __init__(self, _key):
+        self.key = _key
+        self.heap = []
+        self.entries = {}
+        self.sequence = 0
+
+
+    def __len__(self):
+        return len(self.entries)
+
+
+    def __iter__(self):
+        """Live processes in no particular order"""
+
+        return iter(self.entries)
+
+
+    def window(self, start, stop):
+        """Processes [start, stop) in key order, O(n log stop)"""
+
+        return [entry[2] for entry in heapq.nsmallest(stop, self.entries.values())[start:]]
+
+
+    def push(self, process):
+        entry = [self.key(process), self.sequence, process, True]
+        self.sequence += 1
+        self.entries[process] = entry
+        heapq.heappush(self.heap, entry)
+
+
+    def pop(self):
+        self.discard_dead()
+        entry = heapq.heappop(self.heap)
+        del self.entries[entry[2]]
+        return entry[2]
+
+
+    def peek(self):
+        self.discard_dead()
+        return self.heap[0][2]
+
+
+    def remove(self, process):
+        entry = self.entries.pop(process)
+        entry[3] = False
+
+
+    def discard_dead(self):
+        while not self.heap[0][3]:
+            heapq.heappop(self.heap)
+
+
+class RandomQueue():
+    """Ready queue served in random order, the chosen slot is swapped with
+    the last one so picking and removing are O(1)"""
+
+    def __init__(self, _rng):
+        self.rng = _rng
+        self.items = []
+        self.positions = {}
+
+
+    def __len__(self):
+        return len(self.items)
+
+
+    def __iter__(self):
+        return iter(self.items)
+
+
+    def push(self, process):
+        self.positions[process] = len(self.items)
+        self.items.append(process)
+
+
+    def pop(self):
+        process = self.items[self.rng.randrange(len(self.items))]
+        self.remove(process)
+        return process
+
+
+    def peek(self):
+        return self.items[0]
+
+
+    def remove(self, process):
+        index = self.positions.pop(process)
+        last = self.items.pop()
+
+        if last is not process:
+            self.items[index] = last
+            self.positions[last] = index
+
+
+
+class MultiLevelQueue():
+    """One FIFO deque per priority level (0 is the highest) and a bitmap of the
+    non empty levels, the next process is taken from the lowest set bit so
+    push and pop are O(1) whatever the number of levels"""
+
+    def __init__(self, _levels, _level_of):
+        self.levels = [deque() for _ in range(_levels)]
+        self.level_of = _level_of
+        self.bitmap = 0
+        self.count = 0
+
+
+    def __len__(self):
+        return self.count
+
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self.levels)
+
+
+    def push(self, process):
+        level = self.level_of(process)
+        self.levels[level].append(process)
+        self.bitmap |= 1 << level
+        self.count += 1
+
+
+    def top_level(self):
+        return (self.bitmap & -self.bitmap).bit_length() - 1
+
+
+    def pop(self):
+        level = self.top_level()
+        queue = self.levels[level]
+        process = queue.popleft()
+        self.count -= 1
+
+        if not queue:
+            self.bitmap &= ~(1 << level)
+
+        return process
+
+
+    def peek(self):
+        return self.levels[self.top_level()][0]
+
+
+    def remove(self, process):
+        level = self.level_of(process)
+        queue = self.levels[level]
+        queue.remove(process)
+        self.count -= 1
+
+        if not queue:
+            self.bitmap &= ~(1 << level)
+
+
+    def merge_levels(self):
+        """Move every process to the top level keeping the level order (priority boost)"""
+
+        top = self.levels[0]
+
+        for queue in self.levels[1:]:
+            top.extend(queue)
+            queue.clear()
+
+        self.bitmap = 1 if self.count else 0
+
+
+class LotteryQueue():
+    """Ready queue drawn at random with a chance proportional to the tickets of
+    each process. Tickets are summed in a Fenwick tree over the slots of the
+    queue, so a weighted draw, a push and a removal are all O(log n). Freed
+    slots are reused so the tree only grows with the deepest queue seen"""
+
+    def __init__(self, _rng, _tickets):
+        self.rng = _rng
+        self.tickets = _tickets
+        self.slots = []
+        self.weights = []
+        self.tree = [0]
+        self.positions = {}
+        self.free_slots = []
+        self.total = 0
+
+
+    def __len__(self):
+        return len(self.positions)
+
+
+    def __iter__(self):
+        """Queued processes in no particular order"""
+
+        return iter(self.positions)
+
+
+    def window(self, start, stop):
+        """Processes [start, stop) from the most to the fewest tickets, the most
+        likely to win the next draw first"""
+
+        slots = heapq.nsmallest(stop, self.positions.values(), key=lambda slot: (-self.weights[slot], slot))
+        return [self.slots[slot] for slot in slots[start:]]
+
+
+    def prefix_sum(self, index):
+        """Tickets of the first index slots"""
+
+        total = 0
+
+        while index > 0:
+            total += self.tree[index]
+            index -= index & -index
+
+        return total
+
+
+    def add(self, index, weight):
+
+        tree = self.tree
+
+        while index < len(tree):
+            tree[index] += weight
+            index += index & -index
+
+
+    def push(self, process):
+        weight = self.tickets(process)
+
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            slot = len(self.slots)
+            self.slots.append(None)
+            self.weights.append(0)
+
+            # The new tree node covers the slots (n - lowbit(n), n], all of them already stored
+
+            node = slot + 1
+            self.tree.append(self.prefix_sum(node - 1) - self.prefix_sum(node - (node & -node)))
+
+        self.slots[slot] = process
+        self.weights[slot] = weight
+        self.positions[process] = slot
+        self.total += weight
+        self.add(slot + 1, weight)
+
+
+    def pop(self):
+        """Draw a ticket and remove the process holding it"""
+
+        ticket = self.rng.randrange(self.total)
+        tree = self.tree
+        position = 0
+        step = 1 << (len(tree) - 1).bit_length()
+
+        while step:
+            node = position + step
+
+            if node < len(tree) and tree[node] <= ticket:
+                position = node
+                ticket -= tree[node]
+
+            step >>= 1
+
+        process = self.slots[position]
+        self.remove(process)
+
+        return process
+
+
+    def peek(self):
+        return next(iter(self.positions))
+
+
+    def remove(self, process):
+        slot = self.positions.pop(process)
+        weight = self.weights[slot]
+
+        self.add(slot + 1, -weight)
+        self.total -= weight
+        self.weights[slot] = 0
+        self.slots[slot] = None
+        self.free_slots.append(slot)
@@ -0,0 +1,123 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import hashlib
+import json
+import os
+
+
+CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "process-scheduling-simulator")
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+def workload_digest(table):
+    """Hash of the raw columns of a ProcessTable"""
+
+    digest = hashlib.sha256()
+
+    for column in (table.pid, table.arrival_time, table.burst_time, table.priority):
+        digest.update(column.tobytes())
+
+    return digest.hexdigest()
+
+
+def make_key(digest, parameters):
+    """Cache key of a simulation: workload digest plus its parameters"""
+
+    payload = json.dumps(parameters, sort_keys=True, default=str)
+    return hashlib.sha256(f"{digest}:{payload}".encode()).hexdigest()
+
+
+class ResultCache():
+    """On disk cache of simulation results, one JSON file per key. Reading an
+    entry refreshes its modification time and once the directory grows past
+    max_bytes the least recently used entries are evicted"""
+
+    def __init__(self, _directory=CACHE_DIRECTORY, _max_bytes=CACHE_MAX_BYTES):
+        self.directory = _directory
+        self.max_bytes = _max_bytes
+
+        os.makedirs(self.directory, exist_ok=True)
+        self.total_bytes = sum(size for _, size, _ in self.entries())
+
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+
+    def get(self, key):
+
+        path = self.path(key)
+
+        try:
+            with open(path) as file:
+                value = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        os.utime(path)
+        return value
+
+
+    def put(self, key, value):
+
+        path = self.path(key)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+
+        with open(temporary_path, "w") as file:
+            json.dump(value, file)
+
+        if os.path.exists(path):
+            self.total_bytes -= os.path.getsize(path)
+
+        os.replace(temporary_path, path)
+        self.total_bytes += os.path.getsize(path)
+
+        if self.total_bytes > self.max_bytes:
+            self.evict()
+
+
+    def entries(self):
+        """(modification time, size, path) of every entry"""
+
+        entries = []
+
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        return entries
+
+
+    def evict(self):
+        """Remove the least recently used entries until the cache fits in max_bytes"""
+
+        entries = self.entries()
+        self.total_bytes = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if self.total_bytes <= self.max_bytes:
+                break
+
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+
+            self.total_bytes -= size
+
+
+    def clear(self):
+
+        for _, _, path in self.entries():
+            os.remove(path)
+
+        self.total_bytes = 0
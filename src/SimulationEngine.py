@@ -0,0 +1,746 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import heapq
+import random
+from time import perf_counter_ns
+
+from src.Policies import POLICIES, make_policy
+from src.BlockingModel import BlockedQueue, make_blocking_model
+from src.Statistics import SimulationStatistics
+from src.ProcessTable import ProcessTable
+from src.ReadyQueues import queue_window
+
+
+# Built-in algorithms, more can be added with Policies.register_policy
+
+ALGORITHMS = list(POLICIES)
+
+
+# Event kinds reported to the listeners
+
+ARRIVAL = 0
+DISPATCH = 1
+PREEMPT = 2
+BLOCK = 3
+UNBLOCK = 4
+FINISH = 5
+
+EVENT_NAMES = ["ARRIVAL", "DISPATCH", "PREEMPT", "BLOCK", "UNBLOCK", "FINISH"]
+
+
+# Internal event kinds for the running slice
+
+QUANTUM_EXPIRY = 6
+
+# Profiler phase of each event kind handled by the engine
+
+PHASE_NAMES = [f"handle_{name.lower()}" for name in EVENT_NAMES] + ["handle_quantum_expiry"]
+
+
+# Default parameters: the Tk loop drew random.randint(0,3000) == 11 roughly once per
+# millisecond of CPU and blocked the process from 1 to 7 time units
+
+QUANTUM = 2
+BLOCK_PROBABILITY = 1 / 3001
+BLOCK_CHECK_INTERVAL = 0.001
+BLOCK_DURATION = (1, 7)
+
+
+# Multi CPU queue modes: a single queue shared by every core or one queue per core
+# with work stealing
+
+QUEUE_MODES = ["global", "per_core"]
+
+
+class Core():
+    """One CPU of the simulated host"""
+
+    __slots__ = ("index", "current_process", "token", "busy_time", "dispatches", "idle", "touched", "ready_processes")
+
+    def __init__(self, _index, _ready_processes=None):
+        self.index = _index
+        self.current_process = None
+        self.token = None
+        self.busy_time = 0
+        self.dispatches = 0
+        self.idle = False
+        self.touched = False
+        self.ready_processes = _ready_processes
+
+
+class ReadyQueuesView():
+    """Read only view of the per core ready queues as a single collection"""
+
+    def __init__(self, _cores):
+        self.cores = _cores
+
+
+    def __len__(self):
+        return sum(len(core.ready_processes) for core in self.cores)
+
+
+    def __iter__(self):
+        for core in self.cores:
+            yield from core.ready_processes
+
+
+    def window(self, start, stop):
+        """Processes [start, stop) core after core, each queue in the order it is served"""
+
+        rows = []
+
+        for core in self.cores:
+            size = len(core.ready_processes)
+
+            if start < size:
+                rows.extend(queue_window(core.ready_processes, max(0, start), min(stop, size)))
+
+            start -= size
+            stop -= size
+
+            if stop <= 0:
+                break
+
+        return rows
+
+
+class SimulationEngine():
+    """Discrete event simulation of one or more CPUs. Instead of polling every
+    millisecond the engine jumps straight to the next event (arrival,
+    completion, quantum expiry, block or unblock) so it can run without
+    any display and as fast as the host allows. Every random draw goes
+    through the engine rng so the same seed gives bit-identical runs.
+
+    With several CPUs the ready queue is either shared by every core or
+    split per core, where arrivals go to an idle core or the shorter of two
+    random queues and idle cores steal work. Idle cores are kept in a stack
+    and running processes in a heap so the cost of an event does not grow
+    with the number of cores"""
+
+    def __init__(self, _processes, _algorithm, _quantum=QUANTUM, _block_probability=BLOCK_PROBABILITY, _block_duration=BLOCK_DURATION,
+                 _seed=None, _rng=None, _keep_finished=None, _cpus=1, _queue_mode="global", _profiler=None,
+                 _blocking=None, _policy_options=None):
+
+        if _queue_mode not in QUEUE_MODES:
+            raise ValueError(f"Unknown queue mode: {_queue_mode}")
+
+        if _cpus < 1:
+            raise ValueError("At least one CPU is required")
+
+        if _quantum is None or _quantum <= 0:
+            raise ValueError("The quantum must be a positive number")
+
+        self.algorithm = _algorithm
+
+        # A BlockingModel gives the CPU time to the next block and its duration, by default
+        # the block probability per BLOCK_CHECK_INTERVAL of CPU becomes an exponential
+        # time to block
+
+        self.block_probability = _block_probability
+        self.block_duration = _block_duration
+        self.blocking = _blocking if _blocking is not None else make_blocking_model(_block_probability, _block_duration, BLOCK_CHECK_INTERVAL)
+        self.seed = _seed
+        self.rng = _rng if _rng is not None else random.Random(_seed)
+
+        # Every algorithm specific decision is taken by the policy, tuned by its options
+        # (e.g. {"levels": 4, "boost_period": 100} for MLFQ)
+
+        self.policy = make_policy(_algorithm, self, _quantum, _policy_options)
+        self.preemptive = self.policy.preemptive
+        self.select = self.policy.select
+        self.slice_length = self.policy.quantum
+
+        # Pending workload sorted by arrival time, the cursor points to the next process to
+        # arrive. A ProcessTable is read by index and its rows only become Process records
+        # once they arrive, results are written back to the table as they finish
+
+        if isinstance(_processes, ProcessTable):
+            self.table = _processes.sort_by_arrival()
+            self.table.allocate_results()
+            self.processes = None
+            self.arrival_times = self.table.arrival_time
+            self.materialize = self.table.process
+        else:
+            self.table = None
+            self.processes = sorted(_processes, key=lambda p: p.arrival_time)
+            self.arrival_times = [process.arrival_time for process in self.processes]
+            self.materialize = self.processes.__getitem__
+
+        self.total_processes = len(self.arrival_times)
+        self.arrival_cursor = 0
+
+        self.time = 0
+        self.cpu_usage_time = 0
+
+        # Cores, the idle ones are kept in a stack and the running ones in a heap keyed by
+        # how good their process is so the worst one can be preempted in O(log n)
+
+        self.cpus = _cpus
+        self.per_core = _queue_mode == "per_core"
+        self.queue_mode = _queue_mode
+
+        if self.per_core:
+            self.cores = [Core(index, self.policy.make_queue()) for index in range(_cpus)]
+            self.ready_processes = ReadyQueuesView(self.cores)
+        else:
+            self.cores = [Core(index) for index in range(_cpus)]
+            self.ready_processes = self.policy.make_queue()
+
+        self.idle_cores = []
+        self.touched_cores = []
+        self.running = []
+        self.backlogged_cores = {}
+        self.migrations = 0
+
+        for core in reversed(self.cores):
+            core.idle = True
+            self.idle_cores.append(core.index)
+
+        self.blocked_processes = BlockedQueue()
+
+        # Finished processes are only kept when asked for (by default for a plain list of
+        # processes), with a table the results already live in its columns
+
+        if _keep_finished is None:
+            _keep_finished = self.table is None
+
+        self.finished_processes = [] if _keep_finished else None
+
+        # Figures shown by the statistics panel, aggregated as processes finish
+
+        self.stats = SimulationStatistics()
+
+        self.listeners = []
+
+        # Optional PhaseProfiler, steps are only timed while it is enabled
+
+        self.profiler = _profiler
+
+        # Pending events (time, sequence, kind, process, dispatch token), arrivals are not
+        # stored here since they are read from the sorted workload
+
+        self.events = []
+        self.sequence = 0
+        self.dispatch_token = 0
+
+
+    # ---------------------------- Public API -----------------------------------------
+
+
+    @property
+    def finished(self):
+        return self.stats.completed == self.total_processes
+
+
+    @property
+    def current_process(self):
+        """Process at the first CPU"""
+
+        return self.cores[0].current_process
+
+
+    def add_listener(self, listener):
+        """Register a callable receiving (kind, time, process) for every state change,
+        process.cpu tells the core involved"""
+
+        self.listeners.append(listener)
+
+
+    def __getstate__(self):
+        """Listeners and the profiler belong to whoever drives the engine (windows,
+        open trace files) so they are left out of pickles and checkpoints"""
+
+        state = self.__dict__.copy()
+        state["listeners"] = []
+        state["profiler"] = None
+
+        return state
+
+
+    def next_event_time(self):
+        """Time of the next pending event or None when nothing is left"""
+
+        next_time = self.events[0][0] if self.events else None
+
+        if self.arrival_cursor < self.total_processes:
+            arrival_time = self.arrival_times[self.arrival_cursor]
+
+            if next_time is None or arrival_time < next_time:
+                next_time = arrival_time
+
+        if self.blocked_processes:
+            wake_time = self.blocked_processes.next_wake_time()
+
+            if next_time is None or wake_time < next_time:
+                next_time = wake_time
+
+        return next_time
+
+
+    def step(self):
+        """Process every event that happens at the next event time, returns False once done"""
+
+        if self.profiler is not None and self.profiler.enabled:
+            return self.profiled_step()
+
+        now = self.next_event_time()
+
+        if now is None:
+            return False
+
+        self.advance(now)
+        self.admit_arrivals(now)
+        self.wake_blocked(now)
+
+        events = self.events
+        cores = self.cores
+
+        while events and events[0][0] <= now:
+            _, _, kind, process, token = heapq.heappop(events)
+
+            if token is not None and token != cores[process.cpu].token:        # The slice was cut short by a preemption
+                continue
+
+            self.handle_event(kind, process)
+
+        self.schedule()
+
+        return bool(events) or self.arrival_cursor < self.total_processes or bool(self.blocked_processes)
+
+
+    def profiled_step(self):
+        """Same as step, recording the time of every phase in the profiler"""
+
+        record = self.profiler.record
+        step_timestamp = perf_counter_ns()
+
+        now = self.next_event_time()
+
+        if now is None:
+            return False
+
+        self.advance(now)
+
+        timestamp = perf_counter_ns()
+        self.admit_arrivals(now)
+        record("admit_arrivals", perf_counter_ns() - timestamp)
+
+        if self.blocked_processes:
+            timestamp = perf_counter_ns()
+            self.wake_blocked(now)
+            record("wake_blocked", perf_counter_ns() - timestamp)
+
+        events = self.events
+        cores = self.cores
+
+        while events and events[0][0] <= now:
+            _, _, kind, process, token = heapq.heappop(events)
+
+            if token is not None and token != cores[process.cpu].token:
+                continue
+
+            timestamp = perf_counter_ns()
+            self.handle_event(kind, process)
+            record(PHASE_NAMES[kind], perf_counter_ns() - timestamp)
+
+        timestamp = perf_counter_ns()
+        self.schedule()
+        record("schedule", perf_counter_ns() - timestamp)
+
+        record("step", perf_counter_ns() - step_timestamp)
+
+        return bool(events) or self.arrival_cursor < self.total_processes or bool(self.blocked_processes)
+
+
+    def run_until(self, _time):
+        """Process all events up to the given time and leave the clock there"""
+
+        next_time = self.next_event_time()
+
+        while next_time is not None and next_time <= _time:
+            self.step()
+            next_time = self.next_event_time()
+
+        if _time > self.time:
+            self.advance(_time)
+
+
+    def run(self):
+        """Run the simulation until every process has finished"""
+
+        while self.step():
+            pass
+
+        return self.statistics()
+
+
+    def core_busy_time(self, core):
+        """CPU time used by the core including the slice running right now"""
+
+        if core.current_process:
+            return core.busy_time + self.time - core.current_process.dispatched_at
+
+        return core.busy_time
+
+
+    def statistics(self):
+        """Same figures shown by the simulation window, plus per core utilization
+        and migrations when simulating several CPUs"""
+
+        simulation_time = self.time if self.time > 0 else 0.1
+        busy_times = [self.core_busy_time(core) for core in self.cores]
+
+        statistics = {
+            "cpu_usage": (sum(busy_times) / (simulation_time * self.cpus)) * 100,
+            "simulation_time": self.time
+        }
+        statistics.update(self.stats.summary())
+        statistics.update(self.policy.statistics())
+
+        if self.cpus > 1:
+            statistics["cpus"] = self.cpus
+            statistics["queue_mode"] = self.queue_mode
+            statistics["per_core_utilization"] = [(busy_time / simulation_time) * 100 for busy_time in busy_times]
+            statistics["migrations"] = self.migrations
+
+        return statistics
+
+
+    # ---------------------------- Event handling -----------------------------------------
+
+
+    def push_event(self, _time, _kind, _process, _token=None):
+        heapq.heappush(self.events, (_time, self.sequence, _kind, _process, _token))
+        self.sequence += 1
+
+
+    def notify(self, _kind, _process):
+        for listener in self.listeners:
+            listener(_kind, self.time, _process)
+
+
+    def advance(self, _time):
+        """Move the clock forward, waiting, blocked and CPU times are derived from
+        the state transition timestamps so this does not depend on the queue sizes"""
+
+        if _time > self.time:
+            self.time = _time
+
+
+    def touch(self, core):
+        """Mark the core to be revisited by the scheduler at the end of the current time"""
+
+        if not core.touched:
+            core.touched = True
+            self.touched_cores.append(core)
+
+
+    def enqueue(self, _process, core=None):
+        """Place the process at a ready queue stamping when it started to wait. With
+        per core queues it goes to the given core, an idle core or the shorter
+        of two random queues"""
+
+        _process.enqueued_at = self.time
+
+        if not self.per_core:
+            self.ready_processes.push(_process)
+            return
+
+        if core is None:
+            core = self.place(_process)
+
+        core.ready_processes.push(_process)
+        self.backlogged_cores[core.index] = True
+        self.touch(core)
+
+
+    def place(self, _process):
+
+        if self.idle_cores:
+            core = self.cores[self.idle_cores.pop()]
+            core.idle = False
+            return core
+
+        if self.cpus == 1:
+            return self.cores[0]
+
+        first = self.cores[self.rng.randrange(self.cpus)]
+        second = self.cores[self.rng.randrange(self.cpus)]
+
+        return first if len(first.ready_processes) <= len(second.ready_processes) else second
+
+
+    def pop_ready(self, core):
+        """Take the best process from the core queue (or the global one)"""
+
+        if not self.per_core:
+            return self.select(self.ready_processes)
+
+        process = self.select(core.ready_processes)
+
+        if not core.ready_processes:
+            del self.backlogged_cores[core.index]
+
+        return process
+
+
+    def steal(self, core):
+        """Move the best process of a backlogged core to the idle core queue"""
+
+        index = next(iter(self.backlogged_cores), None)
+
+        if index is None or index == core.index:
+            return
+
+        core.ready_processes.push(self.pop_ready(self.cores[index]))
+        self.backlogged_cores[core.index] = True
+
+
+    def release_cpu(self, core):
+        """Take the current process off the core charging the time it ran since dispatched"""
+
+        process = core.current_process
+        elapsed = self.time - process.dispatched_at
+
+        process.remaining_burst_time -= elapsed
+        self.cpu_usage_time += elapsed
+        core.busy_time += elapsed
+        core.current_process = None
+        core.token = None
+
+        # CPU time left before the process blocks carries over to its next slice
+
+        if process.time_to_block is not None:
+            process.time_to_block -= elapsed
+
+        return process
+
+
+    def free_core(self, core):
+        """The core has nothing to run, with a global queue it goes straight to the
+        idle stack while per core queues are revisited by the scheduler"""
+
+        if self.per_core:
+            self.touch(core)
+        else:
+            core.idle = True
+            self.idle_cores.append(core.index)
+
+
+    def remaining_burst_time(self, process):
+        """Remaining burst time of a process at the CPU at the current time"""
+
+        return process.remaining_burst_time - (self.time - process.dispatched_at)
+
+
+    def admit_arrivals(self, _time):
+        """Move to the ready queue only the processes whose arrival time has been reached"""
+
+        while self.arrival_cursor < self.total_processes and self.arrival_times[self.arrival_cursor] <= _time:
+            process = self.materialize(self.arrival_cursor)
+            self.arrival_cursor += 1
+
+            self.policy.on_arrival(process)
+            self.enqueue(process)
+            self.notify(ARRIVAL, process)
+
+
+    def wake_blocked(self, _time):
+        """Move back to a ready queue the blocked processes whose wake time has been reached"""
+
+        blocked_processes = self.blocked_processes
+
+        while blocked_processes and blocked_processes.next_wake_time() <= _time:
+            process = blocked_processes.pop()
+            self.enqueue(process, None if self.idle_cores else self.cores[process.cpu])
+            self.notify(UNBLOCK, process)
+
+
+    def handle_event(self, _kind, _process):
+
+        core = self.cores[_process.cpu]
+        self.release_cpu(core)
+        self.free_core(core)
+
+        if _kind == FINISH:
+            _process.remaining_burst_time = 0
+            self.stats.record_finish(_process, self.time)
+
+            if self.table is not None:
+                self.table.record_result(_process.index, _process.waiting_time, self.time, _process.blocked_time)
+
+            if self.finished_processes is not None:
+                self.finished_processes.append(_process)
+
+            self.policy.on_finish(_process)
+            self.notify(FINISH, _process)
+
+        elif _kind == QUANTUM_EXPIRY:
+            self.policy.on_quantum_expiry(_process, core)
+            self.notify(PREEMPT, _process)
+
+        elif _kind == BLOCK:
+            blocked_time = self.blocking.sample_duration(_process, self.rng)
+            _process.blocked_until = self.time + blocked_time
+            _process.blocked_time += blocked_time
+            _process.time_to_block = None
+            self.stats.record_block(blocked_time)
+            self.blocked_processes.push(_process)
+            self.notify(BLOCK, _process)
+
+
+    # ---------------------------- Scheduling -----------------------------------------
+
+
+    def worst_running_core(self):
+
+        if self.cpus == 1:
+            return self.cores[0] if self.cores[0].current_process else None
+
+        while self.running:
+            _, token, index = self.running[0]
+            core = self.cores[index]
+
+            if core.token == token:
+                return core
+
+            heapq.heappop(self.running)
+
+        return None
+
+
+    def push_running(self, core):
+        """Add the core to the running heap, rebuilding it once most entries are stale"""
+
+        if len(self.running) > 2 * self.cpus + 64:
+            self.running = [entry for entry in self.running if self.cores[entry[2]].token == entry[1]]
+            heapq.heapify(self.running)
+
+        heapq.heappush(self.running, (self.policy.running_key(core.current_process), core.token, core.index))
+
+
+    def preempt(self, core):
+
+        preempted = self.release_cpu(core)
+        self.enqueue(preempted, core)
+        self.notify(PREEMPT, preempted)
+
+
+    def schedule(self):
+        """Hand work to the idle cores and preempt the running processes that must leave"""
+
+        if self.per_core:
+            touched_cores = self.touched_cores
+            self.touched_cores = []
+
+            for core in touched_cores:
+                core.touched = False
+
+            self.schedule_per_core(touched_cores)
+        else:
+            self.schedule_global()
+
+
+    def schedule_global(self):
+
+        ready_processes = self.ready_processes
+
+        if not ready_processes:
+            return
+
+        # When every core was idle they all just took the best ready processes so there
+        # is nothing to preempt
+
+        all_idle = len(self.idle_cores) == self.cpus
+
+        while self.idle_cores:
+            core = self.cores[self.idle_cores.pop()]
+            core.idle = False
+            self.dispatch(core, self.select(ready_processes))
+
+            if not ready_processes:
+                return
+
+        if not self.preemptive or all_idle:
+            return
+
+        on_preempt_check = self.policy.on_preempt_check
+
+        while True:
+            core = self.worst_running_core()
+
+            if core is None or not on_preempt_check(ready_processes.peek(), core.current_process):
+                return
+
+            self.preempt(core)
+            self.dispatch(core, self.select(ready_processes))
+
+
+    def schedule_per_core(self, touched_cores):
+
+        for core in touched_cores:
+            if core.current_process is None:
+                if not core.ready_processes:
+                    self.steal(core)
+
+                if core.ready_processes:
+                    core.idle = False
+                    self.dispatch(core, self.pop_ready(core))
+                elif not core.idle:
+                    core.idle = True
+                    self.idle_cores.append(core.index)
+
+            elif self.preemptive and core.ready_processes and self.policy.on_preempt_check(core.ready_processes.peek(), core.current_process):
+                self.preempt(core)
+                self.dispatch(core, self.pop_ready(core))
+
+
+    def dispatch(self, core, _process):
+        """Place the process at the core and schedule the event that ends its slice"""
+
+        if _process.cpu is not None and _process.cpu != core.index:
+            self.migrations += 1
+
+        core.current_process = _process
+        core.dispatches += 1
+        _process.cpu = core.index
+        _process.waiting_time += self.time - _process.enqueued_at
+        _process.dispatched_at = self.time
+
+        self.dispatch_token += 1
+        core.token = self.dispatch_token
+
+        # The quantum first, asking for it may change the running key (an MLFQ demotion)
+
+        quantum = self.slice_length(_process)
+
+        if self.preemptive and not self.per_core and self.cpus > 1:
+            self.push_running(core)
+
+        end_time = self.time + _process.remaining_burst_time
+        kind = FINISH
+
+        if quantum and quantum < _process.remaining_burst_time:
+            end_time = self.time + quantum
+            kind = QUANTUM_EXPIRY
+
+        if self.blocking is not None:
+            if _process.time_to_block is None:
+                _process.time_to_block = self.blocking.sample_time_to_block(_process, self.rng)
+
+            block_time = self.time + _process.time_to_block
+
+            if block_time < end_time:
+                end_time = block_time
+                kind = BLOCK
+
+        self.push_event(end_time, kind, _process, core.token)
+        self.notify(DISPATCH, _process)
@@ -0,0 +1,429 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import asyncio
+import itertools
+import json
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.SimulationEngine import SimulationEngine, QUANTUM, BLOCK_PROBABILITY, QUEUE_MODES
+from src.ProcessTable import ProcessTable
+from src.WorkloadIO import COLUMNS
+from src.Policies import check_policy_options
+
+
+# Seconds of wall time between two statistics updates of a running simulation
+
+PUBLISH_INTERVAL = 0.25
+
+# Steps simulated between two looks at the wall clock
+
+STEPS_PER_CHECK = 256
+
+# Largest request body accepted, in bytes
+
+MAX_BODY_SIZE = 64 * 1024 * 1024
+
+# Finished runs kept for late subscribers, the oldest ones are forgotten first
+
+MAX_FINISHED_RUNS = 1000
+
+# Statistics updates buffered per subscriber, a slow one skips the oldest
+
+SUBSCRIBER_BUFFER = 16
+
+STATUS_REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large"}
+
+
+# ---------------------------- Workers -----------------------------------------
+
+
+# Queue shared with the worker processes, set by the pool initializer
+
+updates = None
+
+
+def initialize_worker(queue):
+    global updates
+    updates = queue
+
+
+def simulate(run_id, table, algorithm, seed, options):
+    """Run one simulation in a worker process, sending (run_id, statistics) to the
+    service every PUBLISH_INTERVAL. The final statistics are the result"""
+
+    engine = SimulationEngine(table, algorithm, _seed=seed, **options)
+    last_publish = time.monotonic()
+    steps = 0
+
+    while engine.step():
+        steps += 1
+
+        if steps % STEPS_PER_CHECK:
+            continue
+
+        now = time.monotonic()
+
+        if now - last_publish >= PUBLISH_INTERVAL:
+            updates.put((run_id, engine.statistics()))
+            last_publish = now
+
+    return engine.statistics()
+
+
+def workload_table(workload):
+    """ProcessTable from the workload of a request, either columns
+    ({"pid": [...], "arrival_time": [...], ...}) or a list of rows with those keys"""
+
+    table = ProcessTable()
+
+    try:
+        if isinstance(workload, dict):
+            table.extend(*(workload[column] for column in COLUMNS))
+        elif isinstance(workload, list):
+            for row in workload:
+                table.append(*(row[column] for column in COLUMNS))
+        else:
+            raise TypeError("expected a list of processes or a dict of columns")
+    except KeyError as error:
+        raise ValueError(f"Missing workload column: {error.args[0]}")
+    except (TypeError, ValueError) as error:
+        raise ValueError(f"Invalid workload, PID and priority must be integers and times numbers: {error}")
+
+    if not (len(table.pid) == len(table.arrival_time) == len(table.burst_time) == len(table.priority)):
+        raise ValueError("Workload columns have different lengths")
+
+    if not len(table):
+        raise ValueError("The workload is empty")
+
+    return table
+
+
+def parse_submission(body):
+    """(table, algorithm, seed, engine options) of a submitted run, ValueError when invalid"""
+
+    try:
+        submission = json.loads(body)
+    except (UnicodeDecodeError, json.JSONDecodeError) as error:
+        raise ValueError(f"Invalid JSON: {error}")
+
+    if not isinstance(submission, dict):
+        raise ValueError("The request body must be a JSON object")
+
+    algorithm = submission.get("algorithm", "FIFO")
+    tuning = submission.get("policy_options") or {}
+
+    if not isinstance(tuning, dict):
+        raise ValueError("policy_options must be a JSON object")
+
+    check_policy_options(algorithm, tuning)
+
+    queue_mode = submission.get("queue_mode", "global")
+
+    if queue_mode not in QUEUE_MODES:
+        raise ValueError(f"Unknown queue mode: {queue_mode}")
+
+    try:
+        options = {
+            "_quantum": float(submission.get("quantum", QUANTUM)),
+            "_cpus": int(submission.get("cpus", 1)),
+            "_queue_mode": queue_mode,
+            "_block_probability": float(submission.get("block_probability", BLOCK_PROBABILITY)),
+            "_policy_options": tuning
+        }
+        seed = submission.get("seed")
+        seed = int(seed) if seed is not None else None
+    except (TypeError, ValueError) as error:
+        raise ValueError(f"Invalid option: {error}")
+
+    if options["_quantum"] <= 0 or options["_cpus"] < 1:
+        raise ValueError("The quantum must be positive and at least one CPU is required")
+
+    return workload_table(submission.get("workload")), algorithm, seed, options
+
+
+# ---------------------------- Runs -----------------------------------------
+
+
+class SimulationRun():
+    """A submitted simulation, its latest statistics and the subscribers to its updates"""
+
+    def __init__(self, _id, _algorithm, _processes):
+        self.id = _id
+        self.algorithm = _algorithm
+        self.processes = _processes
+        self.status = "queued"
+        self.statistics = None
+        self.error = None
+        self.subscribers = set()
+
+
+    @property
+    def done(self):
+        return self.status in ("finished", "failed")
+
+
+    def as_dict(self):
+        return {
+            "id": self.id,
+            "algorithm": self.algorithm,
+            "processes": self.processes,
+            "status": self.status,
+            "statistics": self.statistics,
+            "error": self.error
+        }
+
+
+    def subscribe(self):
+        queue = asyncio.Queue(SUBSCRIBER_BUFFER)
+        self.subscribers.add(queue)
+        return queue
+
+
+    def unsubscribe(self, queue):
+        self.subscribers.discard(queue)
+
+
+    def publish(self):
+        """Send the current state to every subscriber, skipping the oldest update of
+        the ones that fall behind since every update holds the full statistics"""
+
+        update = self.as_dict()
+
+        for queue in self.subscribers:
+            if queue.full():
+                queue.get_nowait()
+
+            queue.put_nowait(update)
+
+
+# ---------------------------- Service -----------------------------------------
+
+
+class SimulationService():
+    """Local HTTP service running simulations in a pool of worker processes.
+
+    POST /runs                submit {"workload", "algorithm", "quantum", "cpus", "queue_mode", "block_probability", "seed",
+                              "policy_options"}
+    GET  /runs                every known run
+    GET  /runs/<id>           status and latest statistics of a run
+    GET  /runs/<id>/events    server-sent events with the statistics of the run until it ends
+
+    Every statistics update carries the same figures the simulation window shows"""
+
+    def __init__(self, _host="127.0.0.1", _port=8765, _workers=None):
+        self.host = _host
+        self.port = _port
+        self.workers = _workers
+        self.runs = {}
+        self.ids = itertools.count(1)
+        self.executor = None
+        self.updates = None
+        self.update_task = None
+        self.server = None
+
+        # Background tasks waiting for the workers, referenced so they are not collected
+
+        self.tasks = set()
+
+
+    async def start(self):
+
+        # Forked workers would inherit the sockets open when the pool grows, so a
+        # client would not see its connection closed until the worker exits
+
+        context = multiprocessing.get_context("spawn")
+        self.updates = context.Queue()
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context, initializer=initialize_worker,
+                                            initargs=(self.updates,))
+        self.update_task = asyncio.create_task(self.forward_updates())
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+
+        return self.server
+
+
+    async def serve_forever(self):
+
+        server = await self.start()
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.close()
+
+
+    async def close(self):
+
+        if self.server is not None:
+            self.server.close()
+
+        self.updates.put(None)                   # Ends the thread waiting on the queue
+        self.update_task.cancel()
+        self.executor.shutdown(cancel_futures=True)
+
+
+    async def forward_updates(self):
+        """Hand the statistics sent by the workers to the subscribers of each run"""
+
+        loop = asyncio.get_running_loop()
+
+        while True:
+            update = await loop.run_in_executor(None, self.updates.get)
+
+            if update is None:
+                return
+
+            run = self.runs.get(update[0])
+
+            if run is not None and not run.done:
+                run.status = "running"
+                run.statistics = update[1]
+                run.publish()
+
+
+    def submit(self, body):
+
+        table, algorithm, seed, options = parse_submission(body)
+
+        run = SimulationRun(next(self.ids), algorithm, len(table))
+        self.runs[run.id] = run
+        self.forget_finished_runs()
+
+        future = self.executor.submit(simulate, run.id, table, algorithm, seed, options)
+        task = asyncio.create_task(self.wait_for(run, asyncio.wrap_future(future)))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+        return run
+
+
+    async def wait_for(self, run, future):
+
+        try:
+            run.statistics = await future
+            run.status = "finished"
+        except Exception as error:
+            run.error = str(error)
+            run.status = "failed"
+
+        run.publish()
+
+
+    def forget_finished_runs(self):
+
+        finished = [run_id for run_id, run in self.runs.items() if run.done]
+
+        for run_id in finished[:max(0, len(finished) - MAX_FINISHED_RUNS)]:
+            del self.runs[run_id]
+
+
+    # ---------------------------- HTTP -----------------------------------------
+
+
+    async def handle_connection(self, reader, writer):
+        """One request per connection"""
+
+        try:
+            method, path, body = await read_request(reader)
+            await self.route(method, path, body, writer)
+        except ValueError as error:
+            await write_json(writer, 400, {"error": str(error)})
+        except OverflowError:
+            await write_json(writer, 413, {"error": "Request body too large"})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+    async def route(self, method, path, body, writer):
+
+        parts = [part for part in path.split("?")[0].split("/") if part]
+
+        if parts == ["runs"]:
+            if method == "POST":
+                await write_json(writer, 201, self.submit(body).as_dict())
+            elif method == "GET":
+                await write_json(writer, 200, [run.as_dict() for run in self.runs.values()])
+            else:
+                await write_json(writer, 405, {"error": f"Method {method} not allowed"})
+            return
+
+        run = self.runs.get(int(parts[1])) if len(parts) in (2, 3) and parts[0] == "runs" and parts[1].isdigit() else None
+
+        if run is None or (len(parts) == 3 and parts[2] != "events"):
+            await write_json(writer, 404, {"error": "Not found"})
+        elif method != "GET":
+            await write_json(writer, 405, {"error": f"Method {method} not allowed"})
+        elif len(parts) == 2:
+            await write_json(writer, 200, run.as_dict())
+        else:
+            await self.stream_events(run, writer)
+
+
+    async def stream_events(self, run, writer):
+        """Server-sent events: the current state right away, then every update until the run ends"""
+
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\nConnection: close\r\n\r\n")
+
+        queue = run.subscribe()
+        update = run.as_dict()
+
+        try:
+            while True:
+                writer.write(f"event: {update['status']}\ndata: {json.dumps(update)}\n\n".encode())
+                await writer.drain()
+
+                if update["status"] in ("finished", "failed"):
+                    return
+
+                update = await queue.get()
+        finally:
+            run.unsubscribe(queue)
+
+
+async def read_request(reader):
+    """(method, path, body) of an HTTP/1.1 request"""
+
+    request_line = (await reader.readline()).decode("latin-1").split()
+
+    if len(request_line) != 3:
+        raise ValueError("Malformed request line")
+
+    headers = {}
+
+    while True:
+        line = (await reader.readline()).decode("latin-1").strip()
+
+        if not line:
+            break
+
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    length = int(headers.get("content-length", 0))
+
+    if length > MAX_BODY_SIZE:
+        raise OverflowError(length)
+
+    body = await reader.readexactly(length) if length else b""
+
+    return request_line[0].upper(), request_line[1], body
+
+
+async def write_json(writer, status, payload):
+
+    body = json.dumps(payload).encode()
+    writer.write(f"HTTP/1.1 {status} {STATUS_REASONS[status]}\r\nContent-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+                 f"Connection: close\r\n\r\n".encode() + body)
+    await writer.drain()
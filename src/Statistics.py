@@ -0,0 +1,191 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import math
+
+
+class RunningStat():
+    """Count, sum, mean and variance kept incrementally with Welford's method"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.mean = 0
+        self.m2 = 0
+        self.min = None
+        self.max = None
+
+
+    def add(self, value):
+
+        self.count += 1
+        self.total += value
+
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+        if self.min is None or value < self.min: self.min = value
+        if self.max is None or value > self.max: self.max = value
+
+
+    def merge(self, other):
+        """Combine with the stat of another run (Chan's parallel formula)"""
+
+        if other.count == 0: return
+
+        if self.count == 0:
+            self.count, self.total, self.mean, self.m2 = other.count, other.total, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.mean += delta * other.count / count
+        self.count = count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else 0
+
+
+    @property
+    def stdev(self):
+        return math.sqrt(self.variance)
+
+
+class QuantileSketch():
+    """Mergeable quantile sketch with logarithmic buckets, every estimate is
+    within the given relative error of the real quantile. Adding a value is
+    O(1) and the number of buckets only grows with the log of the range"""
+
+    def __init__(self, _relative_error=0.01):
+        self.relative_error = _relative_error
+        self.gamma = (1 + _relative_error) / (1 - _relative_error)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = {}
+        self.zero_count = 0
+        self.count = 0
+
+
+    def add(self, value):
+
+        self.count += 1
+
+        if value <= 0:
+            self.zero_count += 1
+            return
+
+        index = math.ceil(math.log(value) / self.log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+
+    def merge(self, other):
+
+        self.count += other.count
+        self.zero_count += other.zero_count
+
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+
+    def quantile(self, q):
+
+        if self.count == 0:
+            return 0
+
+        rank = q * (self.count - 1)
+
+        if rank < self.zero_count:
+            return 0
+
+        seen = self.zero_count
+
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+
+            if seen > rank:
+                return 2 * self.gamma ** index / (self.gamma + 1)
+
+        return 0
+
+
+class Metric():
+    """Running stat plus quantile sketch for one measured figure"""
+
+    def __init__(self):
+        self.stat = RunningStat()
+        self.sketch = QuantileSketch()
+
+
+    def add(self, value):
+        self.stat.add(value)
+        self.sketch.add(value)
+
+
+    def merge(self, other):
+        self.stat.merge(other.stat)
+        self.sketch.merge(other.sketch)
+
+
+    def summary(self, name):
+        return {
+            f"average_{name}": self.stat.mean,
+            f"{name}_stdev": self.stat.stdev,
+            f"{name}_p50": self.sketch.quantile(0.5),
+            f"{name}_p95": self.sketch.quantile(0.95),
+            f"{name}_p99": self.sketch.quantile(0.99)
+        }
+
+
+class SimulationStatistics():
+    """Incremental aggregator for the statistics of a simulation, updating it
+    is O(1) per finished process no matter how many have finished"""
+
+    def __init__(self):
+        self.waiting_time = Metric()
+        self.execution_time = Metric()
+        self.blocked_time = Metric()
+        self.completed = 0
+
+
+    def record_finish(self, process, time):
+
+        self.completed += 1
+        self.waiting_time.add(process.waiting_time)
+        self.execution_time.add(time - process.arrival_time)
+
+
+    def record_block(self, blocked_time):
+        self.blocked_time.add(blocked_time)
+
+
+    def merge(self, other):
+
+        self.completed += other.completed
+        self.waiting_time.merge(other.waiting_time)
+        self.execution_time.merge(other.execution_time)
+        self.blocked_time.merge(other.blocked_time)
+
+
+    def summary(self):
+
+        summary = {"completed": self.completed}
+        summary.update(self.execution_time.summary("execution_time"))
+        summary.update(self.waiting_time.summary("waiting_time"))
+        summary.update(self.blocked_time.summary("blocked_time"))
+
+        return summary
@@ -0,0 +1,235 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+from src.SimulationEngine import DISPATCH, PREEMPT, BLOCK, UNBLOCK, FINISH
+
+
+# Level k of the interval index merges intervals closer than RESOLUTION * 4**(k - 1),
+# level 0 only merges slices that touch and belong to the same process
+
+RESOLUTION = 0.01
+LEVELS = 12
+
+# Value of a merged interval that covers several processes, the smallest int64 since
+# negative pids stand for text labels (see ProcessTable.pid_of)
+
+MIXED = -2 ** 63
+
+
+class IntervalLevel():
+    """Intervals sorted by time in three columns (start, end, value)"""
+
+    __slots__ = ("gap", "starts", "ends", "values", "cursor")
+
+    def __init__(self, _gap):
+        self.gap = _gap
+        self.starts = array("d")
+        self.ends = array("d")
+        self.values = array("q")
+
+        # Next interval of the finer level to merge into this one
+
+        self.cursor = 0
+
+
+    def add(self, start, end, value):
+        """Append an interval, merging it with the last one when the gap is small enough"""
+
+        if self.ends and start - self.ends[-1] <= self.gap and (self.gap > 0 or self.values[-1] == value):
+            self.ends[-1] = max(self.ends[-1], end)
+
+            if self.values[-1] != value:
+                self.values[-1] = MIXED
+
+            return
+
+        self.starts.append(start)
+        self.ends.append(end)
+        self.values.append(value)
+
+
+    def sync(self, finer):
+        """Merge the intervals the finer level got since the last sync. Its last
+        interval is merged again next time since it may still grow"""
+
+        count = len(finer.starts)
+
+        if self.cursor >= count:
+            return
+
+        if not self.ends:
+            self.add(finer.starts[0], finer.ends[0], finer.values[0])
+
+        # Same merge as add, kept inline since the first sync may go over millions of intervals
+
+        gap = self.gap
+        starts, ends, values = self.starts, self.ends, self.values
+        last_end, last_value = ends[-1], values[-1]
+
+        for start, end, value in zip(finer.starts[self.cursor:], finer.ends[self.cursor:], finer.values[self.cursor:]):
+            if start - last_end <= gap:
+                if end > last_end:
+                    last_end = end
+
+                if value != last_value:
+                    last_value = MIXED
+            else:
+                ends[-1] = last_end
+                values[-1] = last_value
+                starts.append(start)
+                ends.append(end)
+                values.append(value)
+                last_end, last_value = end, value
+
+        ends[-1] = last_end
+        values[-1] = last_value
+
+        self.cursor = count - 1
+
+
+    def query(self, start_time, end_time):
+        """Intervals overlapping [start_time, end_time]"""
+
+        first = bisect_left(self.ends, start_time)
+        last = bisect_right(self.starts, end_time, first)
+
+        return zip(self.starts[first:last], self.ends[first:last], self.values[first:last])
+
+
+class IntervalLane():
+    """One row of the Gantt chart with its multi resolution index. Appending
+    only touches the finest level, the coarser ones catch up when queried so
+    recording costs the same whether or not the chart is ever shown"""
+
+    def __init__(self):
+        self.levels = [IntervalLevel(0)] + [IntervalLevel(RESOLUTION * 4 ** level) for level in range(LEVELS - 1)]
+
+
+    def __len__(self):
+        return len(self.levels[0].starts)
+
+
+    def add(self, start, end, value):
+        self.levels[0].add(start, end, value)
+
+
+    def query(self, start_time, end_time, resolution):
+        """Intervals of the coarsest level whose gaps are not larger than the resolution
+        (time per drawn unit), at most about (end_time - start_time) / resolution of them"""
+
+        chosen = self.levels[0]
+
+        for level in self.levels[1:]:
+            if level.gap > resolution:
+                break
+
+            level.sync(chosen)
+            chosen = level
+
+        return chosen.query(start_time, end_time)
+
+
+class Timeline():
+    """Which process held every CPU over time plus the periods with blocked
+    processes (the value is how many), built from the engine events"""
+
+    def __init__(self, _cpus=1):
+        self.cpus = _cpus
+        self.cpu_lanes = [IntervalLane() for _ in range(_cpus)]
+        self.blocked_lane = IntervalLane()
+
+        # Slice running at every cpu (start time, pid) and the blocked count since last_change
+
+        self.open_slices = [None] * _cpus
+        self.blocked = 0
+        self.last_change = 0
+        self.end_time = 0
+
+
+    @classmethod
+    def from_trace(cls, reader):
+        """Timeline of a recorded event trace (see EventTrace)"""
+
+        timeline = cls(max(1, reader.cpus))
+
+        for time, kind, cpu, pid in reader.records():
+            timeline.record(kind, time, cpu, pid)
+
+        return timeline
+
+
+    def attach(self, engine):
+        """Follow the engine from its current state, a resumed engine may already have
+        processes running and blocked that the listener never saw start"""
+
+        self.end_time = engine.time
+        self.last_change = engine.time
+        self.blocked = len(engine.blocked_processes)
+
+        for core in engine.cores:
+            if core.current_process is not None:
+                self.open_slices[core.index] = (core.current_process.dispatched_at, core.current_process.pid)
+
+        engine.add_listener(self.listener)
+
+
+    def listener(self, kind, time, process):
+        """Engine listener"""
+
+        self.record(kind, time, process.cpu, process.pid)
+
+
+    def record(self, kind, time, cpu, pid):
+
+        self.end_time = time
+
+        if kind == DISPATCH:
+            self.open_slices[cpu] = (time, pid)
+
+        elif kind in (PREEMPT, BLOCK, FINISH):
+            start_time, running_pid = self.open_slices[cpu]
+            self.open_slices[cpu] = None
+            self.cpu_lanes[cpu].add(start_time, time, running_pid)
+
+        if kind == BLOCK or kind == UNBLOCK:
+            if self.blocked:
+                self.blocked_lane.add(self.last_change, time, self.blocked)
+
+            self.blocked += 1 if kind == BLOCK else -1
+            self.last_change = time
+
+
+    def query(self, start_time, end_time, units, cpus=None):
+        """Intervals of every lane (the cpus first, blocked last) overlapping the range,
+        downsampled so each lane has at most about `units` of them"""
+
+        resolution = (end_time - start_time) / max(1, units)
+        lanes = []
+
+        for cpu, lane in enumerate(self.cpu_lanes[:cpus]):
+            intervals = list(lane.query(start_time, end_time, resolution))
+
+            if self.open_slices[cpu] is not None:
+                open_start, pid = self.open_slices[cpu]
+                intervals.append((open_start, self.end_time, pid))
+
+            lanes.append(intervals)
+
+        blocked = list(self.blocked_lane.query(start_time, end_time, resolution))
+
+        if self.blocked:
+            blocked.append((self.last_change, self.end_time, self.blocked))
+
+        lanes.append(blocked)
+
+        return lanes
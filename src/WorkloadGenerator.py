@@ -0,0 +1,138 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import numpy as np
+
+from src.ProcessTable import ProcessTable
+
+
+ARRIVAL_DISTRIBUTIONS = ["poisson", "bursty"]
+BURST_DISTRIBUTIONS = ["exponential", "pareto"]
+
+CHUNK_SIZE = 1000000
+
+
+class WorkloadGenerator():
+    """Synthetic workloads drawn with NumPy, every chunk is produced by a few
+    vectorized calls so there is no Python loop per job.
+
+    - arrival: "poisson" (exponential inter-arrival times) or "bursty"
+      (jobs arrive in batches of geometric size around batch_size)
+    - burst: "exponential" or "pareto" (heavy tail, shape pareto_shape)
+      with mean mean_burst_time
+    - priorities follow a Zipf law truncated to 1..priority_levels, so
+      high priorities are rare
+
+    Consecutive chunks continue the same trace (time and PIDs keep going)
+    and the same seed and chunk size always give the same workload"""
+
+    def __init__(self, arrival="poisson", arrival_rate=1.0, batch_size=10, burst="exponential", mean_burst_time=5.0,
+                 pareto_shape=2.5, min_burst_time=0.01, priority_levels=5, zipf_exponent=1.5, integer_times=False, seed=None):
+
+        if arrival not in ARRIVAL_DISTRIBUTIONS:
+            raise ValueError(f"Unknown arrival distribution: {arrival}")
+
+        if burst not in BURST_DISTRIBUTIONS:
+            raise ValueError(f"Unknown burst distribution: {burst}")
+
+        if burst == "pareto" and pareto_shape <= 1:
+            raise ValueError("The pareto shape must be greater than 1 to have a finite mean")
+
+        self.arrival = arrival
+        self.arrival_rate = arrival_rate
+        self.batch_size = batch_size
+        self.burst = burst
+        self.mean_burst_time = mean_burst_time
+        self.pareto_shape = pareto_shape
+        self.min_burst_time = min_burst_time
+        self.integer_times = integer_times
+        self.rng = np.random.default_rng(seed)
+
+        levels = np.arange(1, priority_levels + 1)
+        weights = levels ** -float(zipf_exponent)
+        self.priority_levels = levels
+        self.priority_weights = weights / weights.sum()
+
+        self.next_pid = 0
+        self.last_arrival_time = 0.0
+
+
+    def arrival_times(self, size):
+
+        if self.arrival == "poisson":
+            gaps = self.rng.exponential(1 / self.arrival_rate, size)
+            return self.last_arrival_time + np.cumsum(gaps)
+
+        # Batches arrive as a Poisson process with the rate scaled down so the job rate is kept
+
+        batches = self.rng.geometric(1 / self.batch_size, size)
+        batches = batches[:np.searchsorted(np.cumsum(batches), size) + 1]
+        epochs = self.last_arrival_time + np.cumsum(self.rng.exponential(self.batch_size / self.arrival_rate, len(batches)))
+
+        return np.repeat(epochs, batches)[:size]
+
+
+    def burst_times(self, size):
+
+        if self.burst == "exponential":
+            burst_times = self.rng.exponential(self.mean_burst_time, size)
+        else:
+            scale = self.mean_burst_time * (self.pareto_shape - 1) / self.pareto_shape
+            burst_times = (self.rng.pareto(self.pareto_shape, size) + 1) * scale
+
+        return np.maximum(burst_times, self.min_burst_time)
+
+
+    def priorities(self, size):
+        return self.rng.choice(self.priority_levels, size, p=self.priority_weights)
+
+
+    def chunk(self, size):
+        """Next size jobs of the trace as a ProcessTable"""
+
+        arrival_times = self.arrival_times(size)
+        burst_times = self.burst_times(size)
+
+        if self.integer_times:
+            arrival_times = np.floor(arrival_times)
+            burst_times = np.maximum(np.rint(burst_times), 1)
+
+        pids = np.arange(self.next_pid, self.next_pid + size, dtype=np.int64)
+
+        self.next_pid += size
+        self.last_arrival_time = float(arrival_times[-1]) if size else self.last_arrival_time
+
+        table = ProcessTable()
+        table.extend_buffers(pids, arrival_times, burst_times, self.priorities(size).astype(np.int64))
+
+        return table
+
+
+    def generate(self, size, chunk_size=CHUNK_SIZE):
+        """Whole workload of the given size in a single ProcessTable"""
+
+        table = ProcessTable()
+
+        for chunk in self.stream(chunk_size, size):
+            table.extend_buffers(chunk.pid, chunk.arrival_time, chunk.burst_time, chunk.priority)
+
+        return table
+
+
+    def stream(self, chunk_size=CHUNK_SIZE, total=None):
+        """Yield ProcessTable chunks, forever when no total is given"""
+
+        produced = 0
+
+        while total is None or produced < total:
+            size = chunk_size if total is None else min(chunk_size, total - produced)
+            produced += size
+
+            yield self.chunk(size)
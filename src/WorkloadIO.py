@@ -0,0 +1,179 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import csv
+import json
+import os
+
+from src.ProcessTable import ProcessTable
+
+
+# Columns expected in every workload file (headers are matched ignoring case and spaces)
+
+COLUMNS = ["pid", "arrival_time", "burst_time", "priority"]
+
+WORKLOAD_FILE_TYPES = [
+    ("Workload files", "*.csv *.jsonl *.ndjson *.parquet"),
+    ("CSV", "*.csv"),
+    ("JSON lines", "*.jsonl *.ndjson"),
+    ("Parquet", "*.parquet")
+]
+
+CHUNK_SIZE = 100000
+
+
+def normalize_column(name):
+    return str(name).strip().lower().replace(" ", "_")
+
+
+def read_workload(path, chunk_size=CHUNK_SIZE, table=None):
+    """Load a CSV, JSON lines or Parquet workload file into a ProcessTable,
+    the file is read in chunks so only one chunk of rows is held as Python
+    objects at a time"""
+
+    table = table if table is not None else ProcessTable()
+
+    for pids, arrival_times, burst_times, priorities in iter_workload_chunks(path, chunk_size):
+        table.extend(pids, arrival_times, burst_times, priorities)
+
+    return table
+
+
+def iter_workload_chunks(path, chunk_size=CHUNK_SIZE):
+    """Yield (pids, arrival_times, burst_times, priorities) columns of at most chunk_size rows"""
+
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".csv":
+        rows = iter_csv_rows(path)
+    elif extension in (".jsonl", ".ndjson"):
+        rows = iter_json_lines_rows(path)
+    elif extension == ".parquet":
+        yield from iter_parquet_chunks(path, chunk_size)
+        return
+    else:
+        raise ValueError(f"Unsupported workload file: {path}")
+
+    columns = ([], [], [], [])
+
+    for line, row in enumerate(rows, start=1):
+        try:
+            columns[0].append(int(row[0]))
+            columns[1].append(float(row[1]))
+            columns[2].append(float(row[2]))
+            columns[3].append(int(row[3]))
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid process at row {line} of {path}: {row} (PID and priority must be integers)")
+
+        if len(columns[0]) == chunk_size:
+            yield columns
+            columns = ([], [], [], [])
+
+    if columns[0]:
+        yield columns
+
+
+def iter_csv_rows(path):
+
+    with open(path, newline="") as file:
+        reader = csv.reader(file)
+        header = [normalize_column(name) for name in next(reader, [])]
+
+        try:
+            positions = [header.index(column) for column in COLUMNS]
+        except ValueError:
+            raise ValueError(f"{path} must have the columns {', '.join(COLUMNS)}")
+
+        line = 0
+
+        for row in reader:
+            if not row:
+                continue
+
+            line += 1
+
+            if len(row) < len(header):
+                raise ValueError(f"Invalid process at row {line} of {path}: {row}")
+
+            yield [row[position] for position in positions]
+
+
+def iter_json_lines_rows(path):
+
+    with open(path) as file:
+        line = 0
+
+        for text in file:
+            if not text.strip():
+                continue
+
+            line += 1
+
+            try:
+                record = json.loads(text)
+            except ValueError:
+                record = None
+
+            if not isinstance(record, dict):
+                raise ValueError(f"Invalid process at row {line} of {path}: {text.strip()}")
+
+            record = {normalize_column(key): value for key, value in record.items()}
+            yield [record.get(column) for column in COLUMNS]
+
+
+def iter_parquet_chunks(path, chunk_size):
+    """Parquet files are read in record batches with pyarrow, imported only here.
+    Every column is cast to the type of the table (a float or string PID is
+    accepted when it holds whole numbers) and missing values are rejected"""
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path)
+    names = {normalize_column(name): name for name in parquet_file.schema_arrow.names}
+
+    if not all(column in names for column in COLUMNS):
+        raise ValueError(f"{path} must have the columns {', '.join(COLUMNS)}")
+
+    types = [pa.int64(), pa.float64(), pa.float64(), pa.int64()]
+    line = 0
+
+    for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=[names[column] for column in COLUMNS]):
+        try:
+            if any(batch.column(index).null_count for index in range(len(COLUMNS))):
+                raise ValueError("missing value")
+
+            columns = [batch.column(index).cast(types[index]).to_pylist() for index in range(len(COLUMNS))]
+        except (ValueError, pa.ArrowException):
+            offset, row = first_invalid_parquet_row(batch, types)
+            raise ValueError(f"Invalid process at row {line + offset} of {path}: {row} (PID and priority must be integers)")
+
+        line += batch.num_rows
+        yield columns
+
+
+def first_invalid_parquet_row(batch, types):
+    """(row number, values) of the first row of the batch that can not be cast, one by one"""
+
+    import pyarrow as pa
+
+    rows = zip(*(batch.column(index).to_pylist() for index in range(len(COLUMNS))))
+
+    for offset, row in enumerate(rows, start=1):
+        try:
+            if None in row:
+                return offset, list(row)
+
+            for value, column_type in zip(row, types):
+                pa.array([value]).cast(column_type)
+        except (ValueError, pa.ArrowException):
+            return offset, list(row)
+
+    return 1, []
@@ -0,0 +1,39 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import os
+import random
+import sys
+
+import pytest
+
+# The modules are imported as src.X and windows.X from the repository root
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ProcessTable import ProcessTable
+
+
+def make_table(size, seed=0, span=None):
+    """Random workload with overlapping arrivals so every policy has decisions to take"""
+
+    rng = random.Random(seed)
+    span = span if span is not None else size * 2
+    table = ProcessTable()
+
+    for pid in range(size):
+        table.append(pid, rng.uniform(0, span), rng.uniform(1, 10), rng.randint(1, 5))
+
+    return table
+
+
+@pytest.fixture
+def table():
+    return make_table(300)
@@ -0,0 +1,59 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+from src.BatchRunner import compare_algorithms, submit_comparison, format_table, run_algorithm
+from src.SimulationEngine import SimulationEngine
+
+
+ALGORITHMS = ["FIFO", "SJF", "RoundRobin", "RandomSelection"]
+
+
+def without_wall_time(rows):
+    return [{key: value for key, value in row.items() if key != "wall_time"} for row in rows]
+
+
+def test_parallel_comparison_matches_sequential_runs(table):
+
+    parallel = compare_algorithms(table, ALGORITHMS, seed=5, options={"_quantum": 1.5}, max_workers=2)
+    sequential = compare_algorithms(table, ALGORITHMS, seed=5, options={"_quantum": 1.5}, max_workers=1)
+
+    assert [row["algorithm"] for row in parallel] == ALGORITHMS
+    assert without_wall_time(parallel) == without_wall_time(sequential)
+
+    # Same figures as an engine run of its own, the workload given is left untouched
+    expected = SimulationEngine(table.copy(), "SJF", _seed=5, _quantum=1.5).run()
+
+    assert without_wall_time([parallel[1]])[0] == dict(expected, algorithm="SJF")
+    assert table.waiting_time is None
+
+
+def test_submitted_comparison_can_be_polled(table):
+
+    executor, futures = submit_comparison(table, ALGORITHMS, seed=5, max_workers=2)
+
+    with executor:
+        rows = [future.result() for future in futures]
+
+    assert without_wall_time(rows) == without_wall_time([run_algorithm(table, algorithm, 5) for algorithm in ALGORITHMS])
+
+
+def test_format_table_aligns_columns(table):
+
+    text = format_table(compare_algorithms(table, ["FIFO", "SJF"], seed=0, max_workers=1))
+    lines = text.splitlines()
+
+    assert len(lines) == 3
+    assert lines[0].startswith("Algorithm")
+    assert lines[1].startswith("FIFO ") and lines[2].startswith("SJF  ")
+
+    # The second column starts at the same offset in every line
+    column = lines[0].index("CPU %")
+
+    assert all(line[column - 2:column] == "  " and line[column] != " " for line in lines)
@@ -0,0 +1,36 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import sys
+import types
+
+import pytest
+
+from src.Benchmark import run_benchmarks, peak_memory_mb
+
+
+def test_benchmarks_measure_every_size():
+
+    report = run_benchmarks(("engine",), ["FIFO", "RoundRobin"], sizes=[10, 100], repeat=1)
+
+    assert [(result["algorithm"], result["size"]) for result in report["results"]] == [("FIFO", 10), ("FIFO", 100), ("RoundRobin", 10), ("RoundRobin", 100)]
+    assert all(result["events"] > result["size"] and result["wall_time"] > 0 for result in report["results"])
+
+
+@pytest.mark.parametrize("platform, max_rss", [("linux", 2048 * 1024), ("darwin", 2048 * 1024 * 1024)])
+def test_peak_memory_units(monkeypatch, platform, max_rss):
+
+    usage = types.SimpleNamespace(ru_maxrss=max_rss)
+    resource = types.SimpleNamespace(RUSAGE_SELF=0, getrusage=lambda who: usage)
+
+    monkeypatch.setitem(sys.modules, "resource", resource)
+    monkeypatch.setattr(sys, "platform", platform)
+
+    assert peak_memory_mb() == 2048
@@ -0,0 +1,67 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import random
+
+from src.BlockingModel import BlockingModel, BlockedQueue, Constant, make_blocking_model
+from src.Process import Process
+from src.SimulationEngine import SimulationEngine, FINISH
+
+
+def test_per_pid_profiles_override_the_defaults():
+
+    blocking = BlockingModel(Constant(100), Constant(1))
+    blocking.configure(1, Constant(2), Constant(3))
+
+    # PID 1 runs 0-2, blocks until 5, waits for PID 2 (2-6), runs 6-8, blocks until 11
+    # and finishes at 12. PID 2 never reaches the default time to block
+
+    processes = [Process(1, 0, 5, 1), Process(2, 0, 4, 1)]
+    engine = SimulationEngine(processes, "FIFO", _blocking=blocking)
+    finish_times = {}
+    engine.add_listener(lambda kind, time, process: finish_times.update({process.pid: time}) if kind == FINISH else None)
+    statistics = engine.run()
+
+    assert finish_times == {2: 6, 1: 12}
+    assert [process.blocked_time for process in processes] == [6, 0]
+    assert statistics["average_blocked_time"] == 3
+
+
+def test_configure_keeps_the_default_it_is_not_given():
+
+    blocking = BlockingModel(Constant(10), Constant(4))
+    blocking.configure(7, duration=Constant(1))
+
+    rng = random.Random(0)
+    process = Process(7, 0, 1, 1)
+
+    assert blocking.sample_time_to_block(process, rng) == 10
+    assert blocking.sample_duration(process, rng) == 1
+    assert blocking.sample_duration(Process(8, 0, 1, 1), rng) == 4
+
+
+def test_no_model_without_a_block_probability():
+
+    assert make_blocking_model(0, (1, 7), 1) is None
+    assert make_blocking_model(0.5, (1, 7), 1) is not None
+
+
+def test_blocked_queue_wakes_in_time_order():
+
+    queue = BlockedQueue()
+
+    for pid, blocked_until in enumerate([5, 1, 3, 1]):
+        process = Process(pid, 0, 1, 1)
+        process.blocked_until = blocked_until
+        queue.push(process)
+
+    assert queue.next_wake_time() == 1
+    assert [queue.pop().pid for _ in range(4)] == [1, 3, 2, 0]
+    assert queue.next_wake_time() is None
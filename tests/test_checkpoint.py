@@ -0,0 +1,113 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import pytest
+
+from src.Checkpoint import snapshot, restore, save_checkpoint, load_checkpoint, fork, run_with_checkpoints
+from src.SimulationEngine import SimulationEngine, ALGORITHMS
+from src.Timeline import Timeline
+
+
+def make_engine(table, algorithm, cpus=1, queue_mode="global", block_probability=0.0005):
+    return SimulationEngine(table.copy(), algorithm, _seed=3, _cpus=cpus, _queue_mode=queue_mode, _block_probability=block_probability)
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("cpus, queue_mode", [(1, "global"), (3, "global"), (3, "per_core")])
+def test_resume_matches_uninterrupted_run(algorithm, cpus, queue_mode, table):
+
+    expected = make_engine(table, algorithm, cpus, queue_mode).run()
+
+    engine = make_engine(table, algorithm, cpus, queue_mode)
+    engine.run_until(200)
+    resumed = restore(snapshot(engine))
+
+    assert resumed.run() == expected
+    assert engine.run() == expected
+
+
+def test_checkpoint_files_split_a_run_in_chunks(table, tmp_path):
+
+    expected = make_engine(table, "MLFQ").run()
+
+    engine = make_engine(table, "MLFQ")
+    paths = run_with_checkpoints(engine, str(tmp_path / "run-{index}.ckpt"), 100, until=400)
+
+    assert len(paths) == 4
+    assert engine.time == 400
+
+    # Every checkpoint continues to the same end, the last one is the end of the chunk
+    for path in paths:
+        assert load_checkpoint(path).run() == expected
+
+
+def test_save_replaces_atomically(table, tmp_path):
+
+    engine = make_engine(table, "SRTF")
+    path = str(tmp_path / "run.ckpt")
+
+    save_checkpoint(engine, path)
+    engine.run_until(100)
+    save_checkpoint(engine, path)
+
+    assert load_checkpoint(path).time == 100
+    assert [entry.name for entry in tmp_path.iterdir()] == ["run.ckpt"]
+
+
+def test_fork(table):
+
+    engine = make_engine(table, "Lottery")
+    engine.run_until(150)
+    data = snapshot(engine)
+    expected = restore(data).run()
+
+    same, first, second = fork(data, [None, 11, 11])
+
+    assert same.run() == expected
+
+    # Reseeded forks diverge from the original but are reproducible
+    first_statistics = first.run()
+    assert first_statistics == second.run()
+    assert first_statistics != expected
+
+
+def test_rejects_other_files(table):
+
+    data = snapshot(make_engine(table, "FIFO"))
+    corrupted = data[:20] + bytes(byte ^ 0xFF for byte in data[20:40]) + data[40:]
+
+    for other in (b"not a checkpoint", data[:9], data[:len(data) // 2], corrupted):
+        with pytest.raises(ValueError, match="Not a simulation checkpoint"):
+            restore(other)
+
+
+def test_listeners_are_not_saved(table):
+
+    engine = make_engine(table, "FIFO")
+    engine.add_listener(lambda kind, time, process: None)
+
+    assert restore(snapshot(engine)).listeners == []
+
+
+@pytest.mark.parametrize("cpus", [1, 3])
+def test_timeline_follows_a_resumed_engine(cpus, table):
+
+    engine = make_engine(table, "RoundRobin", cpus, block_probability=0.01)
+    engine.run_until(200)
+
+    resumed = restore(snapshot(engine))
+    assert resumed.blocked_processes and resumed.current_process is not None
+
+    timeline = Timeline(cpus)
+    timeline.attach(resumed)
+    resumed.run()
+
+    assert timeline.blocked == 0
+    assert timeline.open_slices == [None] * cpus
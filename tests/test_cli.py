@@ -0,0 +1,87 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import cli
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def workload(tmp_path):
+
+    path = tmp_path / "workload.csv"
+    path.write_text("pid,arrival_time,burst_time,priority\n1,0,5,1\n2,1,3,3\n3,2,1,2\n4,3,2,4\n")
+
+    return str(path)
+
+
+def run(arguments, capsys):
+
+    code = cli.main(arguments)
+    captured = capsys.readouterr()
+
+    return code, captured.out, captured.err
+
+
+def test_json_summary_per_algorithm(workload, capsys):
+
+    code, out, _ = run([workload, "--algorithm", "FIFO", "SRTF", "--block-probability", "0"], capsys)
+    rows = json.loads(out)
+
+    assert code == 0
+    assert [row["algorithm"] for row in rows] == ["FIFO", "SRTF"]
+    assert all(row["completed"] == 4 and row["simulation_time"] == 11 for row in rows)
+
+
+def test_csv_per_process(workload, capsys):
+
+    code, out, _ = run([workload, "--algorithm", "SJF", "--block-probability", "0", "--per-process", "--format", "csv"], capsys)
+    rows = list(csv.DictReader(io.StringIO(out)))
+
+    assert code == 0
+    assert {row["pid"]: float(row["finish_time"]) for row in rows} == {"1": 5, "3": 6, "4": 8, "2": 11}
+
+
+def test_mlfq_tuning_options(workload, capsys):
+
+    code, out, _ = run([workload, "--algorithm", "MLFQ", "FIFO", "--level-quanta", "1", "1", "1", "1", "--boost-period", "100"], capsys)
+    rows = json.loads(out)
+
+    assert code == 0
+    assert len(rows[0]["level_cpu_time"]) == 4
+    assert "level_cpu_time" not in rows[1]
+
+
+def test_errors(tmp_path, workload, capsys):
+
+    code, _, err = run([str(tmp_path / "missing.csv")], capsys)
+
+    assert code == 1 and err.startswith("error:")
+
+    with pytest.raises(SystemExit):
+        cli.main([workload, "--quantum", "0"])
+
+
+def test_starts_without_tkinter_or_numpy():
+
+    script = "import sys, cli; print(sorted(name for name in ('tkinter', 'numpy') if name in sys.modules))"
+    output = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+
+    assert output.strip() == "[]"
@@ -0,0 +1,110 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import pytest
+
+from src import EventTrace
+from src.EventTrace import record_trace, TraceReader, TraceReplay, ReplayState
+from src.Process import Process
+from src.SimulationEngine import SimulationEngine, FINISH
+
+
+@pytest.fixture(params=[1, 3])
+def recorded(request, table, tmp_path):
+    """Statistics of a run and the replay of its trace"""
+
+    path = str(tmp_path / "run.trace")
+    engine = SimulationEngine(table, "SRTF", _seed=2, _cpus=request.param, _block_probability=0.0005)
+
+    writer = record_trace(engine, path)
+    statistics = engine.run()
+    writer.close()
+
+    replay = TraceReplay(TraceReader(path))
+    yield statistics, replay
+    replay.reader.close()
+
+
+def state(replay):
+    return (replay.ready_pids(), replay.blocked_pids(), list(replay.running), list(replay.finished_processes), replay.position, replay.time)
+
+
+def test_replay_reaches_the_engine_results(recorded):
+
+    statistics, replay = recorded
+    replay.seek(replay.reader.end_time)
+
+    assert replay.finished
+    assert replay.statistics()["completed"] == statistics["completed"]
+    assert replay.statistics()["simulation_time"] == pytest.approx(statistics["simulation_time"])
+    assert replay.statistics()["cpu_usage"] == pytest.approx(statistics["cpu_usage"])
+
+
+def test_seek_and_undo_round_trip(recorded):
+
+    _, replay = recorded
+    end_time = replay.reader.end_time
+    times = [end_time * fraction for fraction in (0.3, 0.7, 0.1, 1, 0, 0.5)]
+
+    # Seeking from anywhere gives the state of a replay that only went forward
+    for time in times:
+        fresh = TraceReplay(replay.reader)
+        fresh.seek(time)
+
+        replay.seek(time)
+
+        assert state(replay) == state(fresh)
+        assert replay.busy_time == pytest.approx(fresh.busy_time, abs=1e-6)
+
+
+def test_seek_from_keyframes(recorded, monkeypatch):
+
+    monkeypatch.setattr(EventTrace, "KEYFRAME_RECORDS", 50)
+    monkeypatch.setattr(EventTrace, "KEYFRAME_RECORDS_PER_PID", 1)
+
+    _, replay = recorded
+    reader = replay.reader
+    replay = TraceReplay(reader)
+
+    # Indexed in chunks as the window does, seeks stay inside the indexed part
+
+    while not replay.index(500):
+        replay.seek(replay.indexed_time / 2)
+
+    assert len(replay.keyframes) > 10
+    assert list(replay.keyframe_positions) == sorted(replay.keyframe_positions)
+
+    for fraction in (0.9, 0.2, 0.21, 1, 0, 0.55):
+        time = reader.end_time * fraction
+        replay.seek(time)
+
+        forward = ReplayState(reader)
+        finished = []
+
+        for record in reader.records(0, reader.index_at(time)):
+            forward.apply(*record)
+
+            if record[1] == FINISH:
+                finished.append((record[3], record[0]))
+
+        assert replay.position == forward.position
+        assert replay.ready_pids() == sorted(forward.ready_processes)
+        assert replay.blocked_pids() == sorted(forward.blocked_processes)
+        assert replay.running == forward.running
+        assert list(replay.finished_processes) == finished
+        assert replay.finished_processes.window(max(0, len(finished) - 3), len(finished) + 5) == finished[-3:]
+
+
+def test_traces_need_integer_pids(tmp_path):
+
+    engine = SimulationEngine([Process("P1", 0, 3, 1)], "FIFO")
+
+    with pytest.raises(ValueError):
+        record_trace(engine, str(tmp_path / "run.trace"))
@@ -0,0 +1,73 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.FastPath import can_use_fast_path, fast_path_statistics
+from src.SimulationEngine import SimulationEngine
+from src.ProcessTable import ProcessTable
+from conftest import make_table
+
+
+OPTIONS = {"_block_probability": 0}
+
+
+def simultaneous_table(size):
+    """Every process arrives at once, so SJF and priority are a plain sort"""
+
+    table = make_table(size, seed=5)
+    table.arrival_time = type(table.arrival_time)("d", [0.0] * size)
+
+    return table
+
+
+def assert_same_results(table, algorithm):
+
+    fast_table = table.copy()
+    engine_table = table.copy()
+
+    fast = fast_path_statistics(fast_table, algorithm, OPTIONS)
+    engine = SimulationEngine(engine_table, algorithm, **OPTIONS).run()
+
+    assert fast is not None
+    assert fast.keys() == engine.keys()
+
+    for key in fast:
+        assert fast[key] == pytest.approx(engine[key]), key
+
+    # The engine sorts its table by arrival, so rows are matched by pid
+    fast_rows = {fast_table.pid[index]: (fast_table.waiting_time[index], fast_table.finish_time[index]) for index in range(len(table))}
+    engine_rows = {engine_table.pid[index]: (engine_table.waiting_time[index], engine_table.finish_time[index]) for index in range(len(table))}
+
+    for pid, (waiting_time, finish_time) in fast_rows.items():
+        assert waiting_time == pytest.approx(engine_rows[pid][0], abs=1e-6)
+        assert finish_time == pytest.approx(engine_rows[pid][1], abs=1e-6)
+
+
+def test_fifo_matches_engine():
+    assert_same_results(make_table(20000, seed=2), "FIFO")
+
+
+@pytest.mark.parametrize("algorithm", ["SJF", "PrioritySelection (Non-Preemptive)"])
+def test_sorted_policies_match_engine(algorithm):
+    assert_same_results(simultaneous_table(5000), algorithm)
+
+
+def test_fast_path_declines_what_it_can_not_compute():
+
+    table = make_table(100)
+
+    assert not can_use_fast_path(table, "SJF", OPTIONS)
+    assert not can_use_fast_path(table, "RoundRobin", OPTIONS)
+    assert not can_use_fast_path(table, "FIFO", {})
+    assert not can_use_fast_path(table, "FIFO", dict(OPTIONS, _cpus=2))
+    assert not can_use_fast_path(ProcessTable(), "FIFO", OPTIONS)
@@ -0,0 +1,82 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import os
+
+import pytest
+
+from conftest import make_table
+from src.ParameterSweep import sweep, sweep_grid
+from src.ResultCache import ResultCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(str(tmp_path / "cache"))
+
+
+def test_grid_leaves_out_parameters_that_do_not_matter():
+
+    cells = sweep_grid(["FIFO", "RoundRobin", "MLFQ"], quanta=(1, 2), block_probabilities=(0, 0.01), block_durations=((1, 3), (2, 5)),
+                       policy_variants=(None, {"levels": 2}))
+
+    fifo = [cell for cell in cells if cell["algorithm"] == "FIFO"]
+    round_robin = [cell for cell in cells if cell["algorithm"] == "RoundRobin"]
+    mlfq = [cell for cell in cells if cell["algorithm"] == "MLFQ"]
+
+    # FIFO: no quantum, durations only when blocking, no policy options
+    assert len(fifo) == 1 + 2
+    assert {cell["quantum"] for cell in fifo} == {None}
+    assert [cell["block_duration"] for cell in fifo if cell["block_probability"] == 0] == [None]
+    assert {str(cell["policy_options"]) for cell in fifo} == {"None"}
+
+    assert len(round_robin) == 2 * (1 + 2)
+    assert len(mlfq) == 2 * (1 + 2)
+    assert all(cell["policy_options"] == {"levels": 2} for cell in mlfq)
+
+
+def test_sweep_reuses_cached_cells(cache):
+
+    table = make_table(50)
+
+    first = sweep(table, ["FIFO", "RandomSelection"], seed=4, cache=cache, max_workers=1)
+    cached = os.listdir(cache.directory)
+
+    assert len(cached) == 2
+    assert sweep(table, ["FIFO", "RandomSelection"], seed=4, cache=cache, max_workers=1) == first
+
+
+def test_unseeded_sweeps_are_not_cached(cache):
+
+    table = make_table(50)
+    sweep(table, ["RandomSelection"], seed=None, cache=cache, max_workers=1)
+
+    assert os.listdir(cache.directory) == []
+
+
+def test_cache_evicts_least_recently_used(cache):
+
+    value = {"payload": "x" * 100}
+
+    for index, key in enumerate(["a", "b", "c"]):
+        cache.put(key, value)
+        os.utime(cache.path(key), (index, index))
+
+    entry_size = os.path.getsize(cache.path("a"))
+
+    # Reading "a" makes it the most recently used, so "b" goes first
+    assert cache.get("a") == value
+
+    cache.max_bytes = 3 * entry_size
+    cache.put("d", value)
+
+    assert cache.get("b") is None
+    assert all(cache.get(key) == value for key in ("a", "c", "d"))
+    assert cache.total_bytes == 3 * entry_size
@@ -0,0 +1,160 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import pytest
+
+from src.Process import Process
+from src.SimulationEngine import SimulationEngine, ALGORITHMS, FINISH
+
+
+# (pid, arrival time, burst time, priority), higher priorities go first
+
+WORKLOAD = [(1, 0, 5, 1), (2, 1, 3, 3), (3, 2, 1, 2), (4, 3, 2, 4)]
+
+# Finish time of every pid, worked out by hand without blocking and with a quantum of 2
+# (MLFQ with a quantum of 1, so its levels get 1, 2 and 4)
+
+SCHEDULES = {
+    "FIFO": {1: 5, 2: 8, 3: 9, 4: 11},
+    "SJF": {1: 5, 3: 6, 4: 8, 2: 11},
+    "PrioritySelection (Non-Preemptive)": {1: 5, 4: 7, 2: 10, 3: 11},
+    "SRTF": {3: 3, 2: 5, 4: 7, 1: 11},
+    "PrioritySelection (Preemptive)": {4: 5, 2: 6, 3: 7, 1: 11},
+    "RoundRobin": {3: 5, 4: 9, 2: 10, 1: 11},
+    "MLFQ": {3: 3, 2: 8, 4: 9, 1: 11}
+}
+
+
+def simulate(algorithm, workload=WORKLOAD, quantum=2, **options):
+
+    processes = [Process(*row) for row in workload]
+    engine = SimulationEngine(processes, algorithm, _quantum=quantum, _block_probability=0, **options)
+    finish_times = {}
+
+    def record_finish(kind, time, process):
+        if kind == FINISH:
+            finish_times[process.pid] = time
+
+    engine.add_listener(record_finish)
+    statistics = engine.run()
+
+    return engine, statistics, finish_times
+
+
+@pytest.mark.parametrize("algorithm", list(SCHEDULES))
+def test_hand_computed_schedule(algorithm):
+
+    engine, statistics, finish_times = simulate(algorithm, quantum=1 if algorithm == "MLFQ" else 2)
+
+    assert finish_times == SCHEDULES[algorithm]
+    assert statistics["completed"] == len(WORKLOAD)
+    assert statistics["simulation_time"] == 11
+    assert statistics["cpu_usage"] == pytest.approx(100)
+
+
+def test_waiting_times_add_up():
+
+    engine, statistics, _ = simulate("FIFO")
+
+    # Waits of 0, 4, 6 and 6 time units
+    assert sorted(process.waiting_time for process in engine.finished_processes) == [0, 4, 6, 6]
+    assert statistics["average_waiting_time"] == pytest.approx(4)
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("cpus, queue_mode", [(1, "global"), (3, "global"), (3, "per_core")])
+def test_every_process_finishes_once(algorithm, cpus, queue_mode, table):
+
+    engine = SimulationEngine(table, algorithm, _seed=1, _cpus=cpus, _queue_mode=queue_mode, _block_probability=0.0005)
+    statistics = engine.run()
+
+    assert statistics["completed"] == len(table)
+    assert not engine.blocked_processes and not len(engine.ready_processes)
+
+    # A process can not finish before it arrived and ran its whole burst
+    for index in range(len(table)):
+        assert table.finish_time[index] >= table.arrival_time[index] + table.burst_time[index] - 1e-9
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_same_seed_same_results(algorithm, table):
+
+    first = SimulationEngine(table.copy(), algorithm, _seed=7, _cpus=2).run()
+    second = SimulationEngine(table.copy(), algorithm, _seed=7, _cpus=2).run()
+
+    assert first == second
+
+
+def cpu_time(engine, process):
+    """CPU time the process has used, counting the slice it may be running"""
+
+    if process is engine.current_process:
+        return process.burst_time - engine.remaining_burst_time(process)
+
+    return process.burst_time - process.remaining_burst_time
+
+
+def test_stride_splits_cpu_by_tickets():
+
+    # Priorities 1 to 4 are 10%, 20%, 30% and 40% of the tickets
+    workload = [(pid, 0, 1000, pid) for pid in range(1, 5)]
+
+    processes = [Process(*row) for row in workload]
+    engine = SimulationEngine(processes, "Stride", _quantum=1, _block_probability=0)
+    engine.run_until(100)
+
+    assert {process.pid: cpu_time(engine, process) for process in processes} == {1: 10, 2: 20, 3: 30, 4: 40}
+
+
+def test_lottery_splits_cpu_by_tickets_on_average():
+
+    workload = [(pid, 0, 100000, pid) for pid in range(1, 5)]
+
+    processes = [Process(*row) for row in workload]
+    engine = SimulationEngine(processes, "Lottery", _quantum=1, _block_probability=0, _seed=3)
+    engine.run_until(10000)
+
+    for process in processes:
+        assert cpu_time(engine, process) / 10000 == pytest.approx(process.priority / 10, abs=0.02)
+
+
+def test_mlfq_options():
+
+    engine, statistics, _ = simulate("MLFQ", quantum=1, _policy_options={"quanta": [1, 1, 1, 1], "boost_period": 1000})
+
+    assert len(statistics["level_cpu_time"]) == 4
+    assert sum(statistics["level_cpu_time"]) == pytest.approx(11)
+
+    with pytest.raises(ValueError):
+        simulate("FIFO", _policy_options={"levels": 2})
+
+    with pytest.raises(ValueError):
+        simulate("MLFQ", _policy_options={"levels": 2, "quanta": [1]})
+
+
+def test_mlfq_slice_across_a_boost_keeps_the_top_level():
+
+    # Level 0 runs 0-4, the level 1 slice from 4 is cut by the boost at 10 so 10-12
+    # is charged to level 0 and the process stays there for 2 more units, and so on
+    # after every boost: 4 units at level 0 and 6 at level 1 per boost period
+
+    _, statistics, finish_times = simulate("MLFQ", [(1, 0, 40, 1)], _policy_options={"quanta": [4, 8, 16], "boost_period": 10})
+
+    assert finish_times == {1: 40}
+    assert statistics["level_cpu_time"] == pytest.approx([16, 24, 0])
+    assert statistics["demotions"] == 4
+    assert statistics["boosts"] == 4
+
+
+@pytest.mark.parametrize("quantum", [0, -1])
+def test_non_positive_quantum_is_rejected(quantum):
+
+    with pytest.raises(ValueError):
+        simulate("RoundRobin", quantum=quantum)
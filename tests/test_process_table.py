@@ -0,0 +1,63 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+from src.ProcessTable import ProcessTable
+from src.SimulationEngine import SimulationEngine
+from src.Timeline import Timeline, MIXED
+
+
+def test_text_pids_keep_their_labels():
+
+    table = ProcessTable()
+
+    for label, arrival_time in [("P1", 2), ("7", 0), ("P2", 1), (" P1 ", 3)]:
+        table.append(table.pid_of(label), arrival_time, 2, 1)
+
+    assert list(table.pid) == [-1, 7, -2, -1]
+    assert [table.label(pid) for pid in table.pid] == ["P1", 7, "P2", "P1"]
+
+    copy = table.copy()
+    copy.append(copy.pid_of("P3"), 4, 1, 1)
+
+    assert copy.label(-3) == "P3"
+    assert table.label(-3) == -3
+
+    # The engine reorders the rows and simulates the ids, the labels still apply
+    engine = SimulationEngine(copy, "FIFO", _block_probability=0)
+    engine.run()
+
+    assert [engine.table.label(pid) for pid in engine.table.pid] == [7, "P2", "P1", "P1", "P3"]
+    assert engine.statistics()["completed"] == 5
+
+
+def test_nbytes_counts_the_columns():
+
+    table = ProcessTable()
+    table.extend([1, 2], [0.0, 1.0], [3.0, 4.0], [1, 2])
+
+    assert table.nbytes == 2 * 32
+
+    table.allocate_results()
+
+    assert table.nbytes == 2 * (32 + 24)
+
+
+def test_labelled_pids_are_not_mixed_gantt_intervals():
+
+    table = ProcessTable()
+    table.append(table.pid_of("P1"), 0, 2, 1)
+
+    engine = SimulationEngine(table, "FIFO", _block_probability=0)
+    timeline = Timeline(1)
+    timeline.attach(engine)
+    engine.run()
+
+    assert [value for _, _, value in timeline.query(0, 2, 100)[0]] == [-1]
+    assert MIXED != -1
@@ -0,0 +1,151 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import random
+
+from conftest import make_table
+from src.Process import Process
+from src.ReadyQueues import FifoQueue, HeapQueue, RandomQueue, MultiLevelQueue, LotteryQueue, queue_window
+from src.SimulationEngine import SimulationEngine
+
+
+def make_processes(count):
+    return [Process(pid, 0, pid % 7 + 1, pid % 5 + 1) for pid in range(count)]
+
+
+def test_heap_queue_order_and_lazy_removal():
+
+    processes = make_processes(50)
+    queue = HeapQueue(lambda process: process.burst_time)
+
+    for process in processes:
+        queue.push(process)
+
+    for process in processes[::3]:
+        queue.remove(process)
+
+    remaining = [process for index, process in enumerate(processes) if index % 3]
+    expected = sorted(remaining, key=lambda process: process.burst_time)       # Ties in push order
+
+    assert len(queue) == len(remaining)
+    assert queue.peek() is expected[0]
+    assert [queue.pop() for _ in range(len(remaining))] == expected
+
+
+def test_windows_list_processes_in_service_order():
+
+    processes = make_processes(50)
+    heap = HeapQueue(lambda process: process.burst_time)
+    lottery = LotteryQueue(random.Random(0), lambda process: process.priority)
+    fifo = FifoQueue()
+
+    for queue in (heap, lottery, fifo):
+        for process in processes:
+            queue.push(process)
+
+        for process in processes[::3]:
+            queue.remove(process)
+
+    remaining = [process for index, process in enumerate(processes) if index % 3]
+    by_burst = sorted(remaining, key=lambda process: process.burst_time)
+    by_tickets = sorted(remaining, key=lambda process: -process.priority)
+
+    assert queue_window(heap, 0, 10) == by_burst[:10]
+    assert queue_window(heap, 30, 40) == by_burst[30:40]
+    assert [process.priority for process in queue_window(lottery, 5, 15)] == [process.priority for process in by_tickets[5:15]]
+    assert queue_window(fifo, 2, 4) == remaining[2:4]
+
+
+def test_per_core_window_walks_the_cores_in_order():
+
+    engine = SimulationEngine(make_table(300, span=100), "SJF", _cpus=3, _queue_mode="per_core", _block_probability=0)
+    engine.run_until(100)
+
+    expected = [process for core in engine.cores
+                for process in sorted(core.ready_processes, key=lambda process: (process.remaining_burst_time, core.ready_processes.entries[process][1]))]
+
+    assert len(expected) > 10
+    assert engine.ready_processes.window(0, len(expected)) == expected
+    assert engine.ready_processes.window(3, 9) == expected[3:9]
+
+
+def test_fifo_and_random_queues_keep_every_process():
+
+    rng = random.Random(1)
+    processes = make_processes(40)
+
+    for queue in (FifoQueue(), RandomQueue(rng)):
+        for process in processes:
+            queue.push(process)
+
+        queue.remove(processes[10])
+        popped = [queue.pop() for _ in range(len(queue))]
+
+        assert sorted(process.pid for process in popped) == [process.pid for process in processes if process.pid != 10]
+
+
+def test_multi_level_queue_serves_the_top_level_first():
+
+    levels = {}
+    queue = MultiLevelQueue(3, levels.__getitem__)
+
+    for process in make_processes(9):
+        levels[process] = process.pid % 3
+        queue.push(process)
+
+    assert [queue.pop().pid for _ in range(3)] == [0, 3, 6]
+
+    queue.merge_levels()
+
+    assert [process.pid for process in queue] == [1, 4, 7, 2, 5, 8]
+    assert queue.top_level() == 0
+
+
+def test_lottery_queue_tree_matches_the_tickets():
+    """The Fenwick tree prefix sums equal the ticket sums of the slots after random pushes and removals"""
+
+    rng = random.Random(4)
+    queue = LotteryQueue(rng, lambda process: process.priority)
+    processes = make_processes(200)
+    queued = set()
+
+    for step in range(2000):
+        if queued and rng.random() < 0.45:
+            process = queue.pop()
+            assert process in queued
+            queued.remove(process)
+        else:
+            process = rng.choice([process for process in processes if process not in queued] or processes)
+
+            if process not in queued:
+                queue.push(process)
+                queued.add(process)
+
+        assert len(queue) == len(queued)
+        assert queue.total == sum(process.priority for process in queued)
+
+        for slot in range(len(queue.slots) + 1):
+            assert queue.prefix_sum(slot) == sum(queue.weights[:slot])
+
+
+def test_lottery_queue_draws_by_tickets():
+
+    rng = random.Random(9)
+    low, high = Process(1, 0, 1, 1), Process(2, 0, 1, 3)
+    queue = LotteryQueue(rng, lambda process: process.priority)
+    wins = 0
+
+    for _ in range(20000):
+        queue.push(low)
+        queue.push(high)
+        wins += queue.pop() is high
+        queue.remove(low if high not in queue.positions else high)
+
+    assert abs(wins / 20000 - 0.75) < 0.02
@@ -0,0 +1,99 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import asyncio
+import json
+
+import pytest
+
+from src.SimulationEngine import SimulationEngine
+from src.SimulationService import SimulationService, parse_submission
+
+
+WORKLOAD = {"pid": [1, 2, 3, 4], "arrival_time": [0, 1, 2, 3], "burst_time": [5, 3, 1, 2], "priority": [1, 3, 2, 4]}
+
+
+def submission(**fields):
+    return json.dumps(dict({"workload": WORKLOAD, "algorithm": "SRTF", "seed": 1, "block_probability": 0}, **fields)).encode()
+
+
+def test_parse_submission():
+
+    table, algorithm, seed, options = parse_submission(submission(quantum=3, policy_options={}))
+
+    assert (len(table), algorithm, seed) == (4, "SRTF", 1)
+    assert options["_quantum"] == 3 and options["_block_probability"] == 0
+
+
+@pytest.mark.parametrize("body", [
+    b"not json",
+    b"[1, 2]",
+    submission(workload={"pid": [1], "arrival_time": [0], "burst_time": [1]}),
+    submission(workload=[{"pid": "P1", "arrival_time": 0, "burst_time": 1, "priority": 1}]),
+    submission(workload={"pid": [1, 2], "arrival_time": [0], "burst_time": [1], "priority": [1]}),
+    submission(workload=[]),
+    submission(quantum=0),
+    submission(queue_mode="sideways"),
+    submission(algorithm="FIFO", policy_options={"levels": 2}),
+    submission(algorithm="MLFQ", policy_options=[2])
+])
+def test_invalid_submissions(body):
+
+    with pytest.raises(ValueError):
+        parse_submission(body)
+
+
+async def request(port, method, path, body=b""):
+    """Status code and body of one HTTP request"""
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+
+    response = await reader.read()
+    writer.close()
+
+    head, _, payload = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), payload
+
+
+async def submit_and_follow(service):
+
+    await service.start()
+    port = service.server.sockets[0].getsockname()[1]
+
+    try:
+        status, payload = await request(port, "POST", "/runs", submission())
+        run = json.loads(payload)
+
+        assert status == 201 and run["processes"] == 4
+
+        _, events = await request(port, "GET", f"/runs/{run['id']}/events")
+        updates = [json.loads(line[len(b"data: "):]) for line in events.splitlines() if line.startswith(b"data: ")]
+
+        status_codes = [
+            (await request(port, "GET", "/runs/99"))[0],
+            (await request(port, "DELETE", "/runs"))[0],
+            (await request(port, "POST", "/runs", b"{}"))[0]
+        ]
+
+        return updates, status_codes
+    finally:
+        await service.close()
+
+
+def test_service_streams_until_the_run_finishes():
+
+    updates, status_codes = asyncio.run(submit_and_follow(SimulationService(_port=0, _workers=1)))
+    expected = SimulationEngine(parse_submission(submission())[0], "SRTF", _seed=1, _block_probability=0).run()
+
+    assert updates[-1]["status"] == "finished"
+    assert updates[-1]["statistics"] == json.loads(json.dumps(expected))
+    assert status_codes == [404, 405, 400]
@@ -0,0 +1,65 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import math
+import random
+import statistics
+
+import pytest
+
+from src.Statistics import RunningStat, QuantileSketch
+
+
+@pytest.fixture
+def values():
+    rng = random.Random(5)
+    return [rng.lognormvariate(1, 1.5) for _ in range(5000)] + [0] * 50
+
+
+def test_running_stat_merge_matches_one_pass(values):
+
+    parts = [RunningStat() for _ in range(3)]
+
+    for index, value in enumerate(values):
+        parts[index % 3].add(value)
+
+    merged = RunningStat()
+
+    for part in [RunningStat()] + parts:
+        merged.merge(part)
+
+    assert merged.count == len(values)
+    assert merged.total == pytest.approx(sum(values))
+    assert merged.mean == pytest.approx(statistics.mean(values))
+    assert merged.stdev == pytest.approx(statistics.stdev(values))
+    assert (merged.min, merged.max) == (min(values), max(values))
+
+
+@pytest.mark.parametrize("q", [0, 0.01, 0.5, 0.95, 0.99, 1])
+def test_sketch_quantiles_within_relative_error(values, q):
+
+    sketch = QuantileSketch(0.01)
+    left, right = QuantileSketch(0.01), QuantileSketch(0.01)
+
+    for index, value in enumerate(values):
+        sketch.add(value)
+        (left if index % 2 else right).add(value)
+
+    left.merge(right)
+
+    # The estimate is the one of the value at the rounded down rank
+    expected = sorted(values)[math.floor(q * (len(values) - 1))]
+
+    assert sketch.quantile(q) == pytest.approx(expected, rel=0.01, abs=1e-12)
+    assert left.quantile(q) == sketch.quantile(q)
+
+
+def test_empty_sketch():
+    assert QuantileSketch().quantile(0.5) == 0
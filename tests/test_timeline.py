@@ -0,0 +1,115 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import random
+
+import pytest
+
+from src.EventTrace import record_trace, TraceReader
+from src.SimulationEngine import SimulationEngine
+from src.Timeline import IntervalLevel, IntervalLane, Timeline, MIXED
+
+
+def make_lane(count, seed=0):
+    """Lane of count slices with random gaps and a few pids, and the slices"""
+
+    rng = random.Random(seed)
+    lane = IntervalLane()
+    slices = []
+    time = 0
+
+    for _ in range(count):
+        start = time + rng.choice([0, rng.paretovariate(0.7)])               # Heavy tailed idle gaps
+        time = start + rng.uniform(0.001, 2)
+        slices.append((start, time, rng.randint(0, 3)))
+        lane.add(*slices[-1])
+
+    return lane, slices
+
+
+def test_levels_merge_by_gap():
+
+    exact = IntervalLevel(0)
+    coarse = IntervalLevel(1)
+
+    for interval in [(0, 1, 5), (1, 2, 5), (2, 3, 6), (3.5, 4, 6), (6, 7, 6)]:
+        exact.add(*interval)
+        coarse.add(*interval)
+
+    # Level 0 only joins touching slices of the same process
+    assert list(exact.query(0, 10)) == [(0, 2, 5), (2, 3, 6), (3.5, 4, 6), (6, 7, 6)]
+    assert list(coarse.query(0, 10)) == [(0, 4, MIXED), (6, 7, 6)]
+
+
+@pytest.mark.parametrize("units", [10, 100, 1000])
+def test_coarse_queries_cover_every_slice(units):
+
+    lane, slices = make_lane(20000)
+    start_time, end_time = slices[100][0], slices[15000][1]
+    resolution = (end_time - start_time) / units
+
+    intervals = list(lane.query(start_time, end_time, resolution))
+    inside = [interval for interval in slices if interval[1] >= start_time and interval[0] <= end_time]
+
+    # Gaps between drawn intervals are over a quarter of the resolution
+    assert len(intervals) <= 4 * units + 1
+    assert len(intervals) < len(inside)
+
+    # Every slice in range lies inside one drawn interval
+    position = 0
+
+    for start, end, value in inside:
+        while intervals[position][1] < end:
+            position += 1
+
+        assert intervals[position][0] <= start
+        assert intervals[position][2] in (value, MIXED)
+
+
+def test_incremental_sync_matches_a_fresh_index():
+
+    lane, slices = make_lane(5000, seed=1)
+    fresh = IntervalLane()
+
+    lane_slices = slices[:]
+    lane.query(0, slices[-1][1], 1)                   # Syncs the coarse levels halfway
+
+    for start, end, value in [(slices[-1][1] + gap, slices[-1][1] + gap + 1, 2) for gap in (0.5, 3, 7)]:
+        lane.add(start, end, value)
+        lane_slices.append((start, end, value))
+
+    for interval in lane_slices:
+        fresh.add(*interval)
+
+    for resolution in (0.001, 0.1, 1, 50):
+        end_time = lane_slices[-1][1]
+        assert list(lane.query(0, end_time, resolution)) == list(fresh.query(0, end_time, resolution))
+
+
+def test_live_timeline_matches_the_trace(table, tmp_path):
+
+    path = str(tmp_path / "run.trace")
+    engine = SimulationEngine(table, "RoundRobin", _seed=1, _cpus=2, _block_probability=0.01)
+    timeline = Timeline(engine.cpus)
+    timeline.attach(engine)
+
+    writer = record_trace(engine, path)
+    engine.run()
+    writer.close()
+
+    reader = TraceReader(path)
+    replayed = Timeline.from_trace(reader)
+    reader.close()
+
+    for units in (50, 5000):
+        assert timeline.query(0, engine.time, units) == replayed.query(0, engine.time, units)
+
+    busy_time = sum(end - start for lane in timeline.query(0, engine.time, 10 ** 9)[:-1] for start, end, _ in lane)
+    assert busy_time == pytest.approx(engine.statistics()["cpu_usage"] / 100 * engine.time * engine.cpus)
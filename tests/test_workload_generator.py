@@ -0,0 +1,65 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.WorkloadGenerator import WorkloadGenerator
+
+
+SIZE = 200000
+
+
+@pytest.mark.parametrize("arrival", ["poisson", "bursty"])
+@pytest.mark.parametrize("burst", ["exponential", "pareto"])
+def test_distributions_keep_their_means(arrival, burst):
+
+    table = WorkloadGenerator(arrival, arrival_rate=2.0, burst=burst, mean_burst_time=5.0, seed=1).generate(SIZE, chunk_size=30000)
+    arrival_times = np.frombuffer(table.arrival_time)
+    burst_times = np.frombuffer(table.burst_time)
+
+    assert len(table) == SIZE
+    assert list(table.pid) == list(range(SIZE))
+    assert np.all(np.diff(arrival_times) >= 0)
+    assert SIZE / arrival_times[-1] == pytest.approx(2.0, rel=0.05)
+    assert burst_times.mean() == pytest.approx(5.0, rel=0.05)
+
+
+def test_priorities_follow_a_truncated_zipf_law():
+
+    priorities = np.frombuffer(WorkloadGenerator(priority_levels=5, seed=2).generate(SIZE).priority, dtype=np.int64)
+    counts = np.bincount(priorities, minlength=6)[1:]
+
+    assert counts.sum() == SIZE
+    assert all(counts[index] > counts[index + 1] for index in range(4))
+
+
+def test_same_seed_and_chunks_give_the_same_workload():
+
+    first = WorkloadGenerator("bursty", seed=3).generate(5000, chunk_size=700)
+    second = WorkloadGenerator("bursty", seed=3).generate(5000, chunk_size=700)
+
+    assert [first.row(index) for index in range(5000)] == [second.row(index) for index in range(5000)]
+
+
+def test_integer_times():
+
+    table = WorkloadGenerator(integer_times=True, seed=4).generate(1000)
+
+    assert all(float(value).is_integer() for value in table.arrival_time)
+    assert min(table.burst_time) >= 1 and all(float(value).is_integer() for value in table.burst_time)
+
+
+@pytest.mark.parametrize("options", [{"arrival": "uniform"}, {"burst": "normal"}, {"burst": "pareto", "pareto_shape": 1}])
+def test_invalid_options(options):
+
+    with pytest.raises(ValueError):
+        WorkloadGenerator(**options)
@@ -0,0 +1,70 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import pytest
+
+from src.WorkloadIO import read_workload
+
+
+def write(tmp_path, name, text):
+
+    path = tmp_path / name
+    path.write_text(text)
+
+    return str(path)
+
+
+def test_reads_csv_and_json_lines(tmp_path):
+
+    csv_path = write(tmp_path, "workload.csv", "PID,Arrival Time,Burst Time,Priority\n1,0,5,2\n\n2,1.5,3,1\n")
+    json_path = write(tmp_path, "workload.jsonl", '{"pid": 1, "arrival_time": 0, "burst_time": 5, "priority": 2}\n\n'
+                                                  '{"pid": 2, "arrival_time": 1.5, "burst_time": 3, "priority": 1}\n')
+
+    for path in (csv_path, json_path):
+        table = read_workload(path, chunk_size=1)
+
+        assert [table.row(index) for index in range(len(table))] == [(1, 0.0, 5.0, 2), (2, 1.5, 3.0, 1)]
+
+
+@pytest.mark.parametrize("name, text", [
+    ("short.csv", "pid,arrival_time,burst_time,priority\n1,0,5,2\n2,1\n"),
+    ("label.csv", "pid,arrival_time,burst_time,priority\nP1,0,5,2\n"),
+    ("columns.csv", "pid,arrival_time,burst_time\n1,0,5\n"),
+    ("list.jsonl", '{"pid": 1, "arrival_time": 0, "burst_time": 5, "priority": 2}\n[1, 2]\n'),
+    ("broken.jsonl", "{oops\n"),
+    ("workload.txt", "1,0,5,2\n")
+])
+def test_invalid_files_raise_value_error(tmp_path, name, text):
+
+    with pytest.raises(ValueError):
+        read_workload(write(tmp_path, name, text))
+
+
+@pytest.mark.parametrize("pids, expected_error", [
+    ([1.0, 2.0, 3.0], None),
+    ([1, None, 3], "row 2"),
+    ([1.0, 2.5, 3.0], "row 2"),
+    (["1", "P2", "3"], "row 2")
+])
+def test_parquet_columns_are_validated(tmp_path, pids, expected_error):
+
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    path = str(tmp_path / "workload.parquet")
+    pq.write_table(pa.table({"PID": pids, "Arrival Time": [0, 1, 2], "Burst Time": [5.0, 3.0, 1.0], "Priority": [2, 1, 3]}), path)
+
+    if expected_error is None:
+        table = read_workload(path, chunk_size=2)
+        assert [table.row(index) for index in range(len(table))] == [(1, 0.0, 5.0, 2), (2, 1.0, 3.0, 1), (3, 2.0, 1.0, 3)]
+        return
+
+    with pytest.raises(ValueError, match=expected_error):
+        read_workload(path, chunk_size=2)
@@ -0,0 +1,178 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import tkinter as tk
+from tkinter import Toplevel
+
+import settings
+
+from src.Timeline import MIXED
+
+
+COLORS = ["#4e79a7", "#f28e2b", "#e15759", "#76b7b2", "#59a14f", "#edc948", "#b07aa1", "#ff9da7", "#9c755f"]
+
+MIXED_COLOR = "#bab0ac"
+BLOCKED_COLOR = "#d37295"
+
+LABEL_WIDTH = 70
+LANE_HEIGHT = 24
+AXIS_HEIGHT = 24
+
+# Drawn intervals are at least this many pixels wide, which bounds the items per lane
+
+PIXELS_PER_INTERVAL = 2
+
+
+class GanttView(Toplevel):
+    """Gantt chart of a Timeline. Each redraw asks the timeline for intervals
+    already downsampled to the zoom level, so the canvas holds at most a few
+    thousand items however many context switches the run had"""
+
+    def __init__(self, parent, _timeline, _is_live=None, width=1000, _labels=None):
+        super().__init__(parent)
+        self.title("Gantt Chart")
+
+        self.timeline = _timeline
+        self.is_live = _is_live
+        self.labels = _labels or {}
+        self.refresh_scheduled = False
+        self.lanes = min(self.timeline.cpus, settings.SHOWN_CPUS)
+        self.width = width
+        self.height = AXIS_HEIGHT + LANE_HEIGHT * (self.lanes + 1)
+
+        # Visible time range, None until the first draw shows the whole run
+
+        self.start_time = 0
+        self.end_time = None
+        self.drag_x = None
+
+        self.canvas = tk.Canvas(self, width=self.width, height=self.height, background="white")
+        self.canvas.pack(padx=10, pady=10)
+
+        self.fit_button = tk.Button(self, text="Fit", command=self.fit)
+        self.fit_button.pack(pady=(0, 10))
+
+        self.canvas.bind("<MouseWheel>", self.on_zoom)
+        self.canvas.bind("<Button-4>", self.on_zoom)
+        self.canvas.bind("<Button-5>", self.on_zoom)
+        self.canvas.bind("<ButtonPress-1>", self.on_press)
+        self.canvas.bind("<B1-Motion>", self.on_drag)
+
+        self.redraw()
+
+
+    def fit(self):
+        self.start_time = 0
+        self.end_time = None
+        self.redraw()
+
+
+    def visible_range(self):
+        end_time = self.end_time if self.end_time is not None else max(self.timeline.end_time, 1)
+        return self.start_time, end_time
+
+
+    def to_x(self, time, start_time, scale):
+        return LABEL_WIDTH + (time - start_time) * scale
+
+
+    def redraw(self):
+
+        canvas = self.canvas
+        canvas.delete("all")
+
+        start_time, end_time = self.visible_range()
+        plot_width = self.width - LABEL_WIDTH
+        scale = plot_width / (end_time - start_time)
+
+        lanes = self.timeline.query(start_time, end_time, plot_width / PIXELS_PER_INTERVAL, self.lanes)
+
+        for row, intervals in enumerate(lanes):
+            top = AXIS_HEIGHT + row * LANE_HEIGHT
+            blocked = row == len(lanes) - 1
+
+            canvas.create_text(5, top + LANE_HEIGHT / 2, text="Blocked" if blocked else f"CPU {row}", anchor="w")
+
+            for interval_start, interval_end, value in intervals:
+                x0 = max(LABEL_WIDTH, self.to_x(interval_start, start_time, scale))
+                x1 = max(x0 + 1, min(self.width, self.to_x(interval_end, start_time, scale)))
+
+                if blocked:
+                    color = BLOCKED_COLOR
+                else:
+                    color = MIXED_COLOR if value == MIXED else COLORS[value % len(COLORS)]
+
+                canvas.create_rectangle(x0, top + 2, x1, top + LANE_HEIGHT - 2, fill=color, width=0)
+
+                # Labels only where the slice is wide enough to read them
+
+                if not blocked and value != MIXED and x1 - x0 > 30:
+                    canvas.create_text((x0 + x1) / 2, top + LANE_HEIGHT / 2, text=str(self.labels.get(value, value)), fill="white")
+
+        self.draw_axis(start_time, end_time, scale)
+
+        if self.is_live and self.is_live() and self.end_time is None and not self.refresh_scheduled:
+            self.refresh_scheduled = True
+            self.after(500, self.refresh)
+
+
+    def refresh(self):
+        """Follow the running simulation while the whole run is shown"""
+
+        self.refresh_scheduled = False
+
+        if self.winfo_exists() and self.end_time is None:
+            self.redraw()
+
+
+    def draw_axis(self, start_time, end_time, scale):
+
+        ticks = 10
+        step = (end_time - start_time) / ticks
+
+        for tick in range(ticks + 1):
+            time = start_time + tick * step
+            x = self.to_x(time, start_time, scale)
+
+            self.canvas.create_line(x, AXIS_HEIGHT - 5, x, AXIS_HEIGHT, fill="gray")
+            self.canvas.create_text(x, AXIS_HEIGHT - 12, text=f"{time:.4g}", anchor="e" if tick == ticks else "center")
+
+
+    def on_zoom(self, event):
+        """Zoom in or out around the time under the pointer"""
+
+        start_time, end_time = self.visible_range()
+        scale = (self.width - LABEL_WIDTH) / (end_time - start_time)
+        pointer_time = start_time + (event.x - LABEL_WIDTH) / scale
+
+        factor = 0.8 if event.num == 4 or getattr(event, "delta", 0) > 0 else 1.25
+
+        self.start_time = max(0, pointer_time - (pointer_time - start_time) * factor)
+        self.end_time = max(self.start_time + 1e-6, pointer_time + (end_time - pointer_time) * factor)
+        self.redraw()
+
+        return "break"
+
+
+    def on_press(self, event):
+        self.drag_x = event.x
+
+
+    def on_drag(self, event):
+        """Pan the visible range"""
+
+        start_time, end_time = self.visible_range()
+        shift = (self.drag_x - event.x) * (end_time - start_time) / (self.width - LABEL_WIDTH)
+        shift = max(shift, -start_time)
+
+        self.drag_x = event.x
+        self.start_time = start_time + shift
+        self.end_time = end_time + shift
+        self.redraw()
@@ -9,11 +9,23 @@ Developed at: September 2024
 
 
 import tkinter as tk
-from tkinter import ttk, simpledialog, Toplevel
+from tkinter import ttk, simpledialog, filedialog, Toplevel
 
 import settings
 from windows.SimulationWindow import SimulationWindow
-from src.Process import Process
+from src.ProcessTable import ProcessTable
+from src.WorkloadIO import WORKLOAD_FILE_TYPES, read_workload
+from src.Clock import CLOCK_MODES, make_clock
+from src.BatchRunner import submit_comparison, format_table
+from src.SimulationEngine import QUANTUM, QUEUE_MODES
+from src.EventTrace import TRACE_FILE_TYPES, TraceReader, TraceReplay
+from src.Checkpoint import CHECKPOINT_FILE_TYPES, load_checkpoint
+from src.Policies import policy_names
+
+
+# Milliseconds between two checks of the comparison runs
+
+COMPARISON_POLL_INTERVAL = 100
 
 
 class MainWindow(tk.Tk):
@@ -24,6 +36,14 @@ class MainWindow(tk.Tk):
         self.geometry(f"{settings.WINDOW_WIDTH}x{settings.WINDOW_HEIGHT}")
         self.resizable(False, False)
         
+        # The workload is stored in a process table, the Treeview only previews its first rows
+        
+        self.workload = ProcessTable()
+        
+        # Executor and futures of the comparison in progress, if any
+        
+        self.comparison = None
+        
         # Window grid configurations
         
         self.grid_columnconfigure(0, weight=1)
@@ -44,21 +64,60 @@ class MainWindow(tk.Tk):
         self.algorithm_combobox = ttk.Combobox(
             self, 
             textvariable=self.algorithm_var, 
-            values=[
-                "FIFO", 
-                "SJF", 
-                "RandomSelection", 
-                "PrioritySelection (Non-Preemptive)", 
-                "RoundRobin", 
-                "SRTF",
-                "PrioritySelection (Preemptive)"
-            ],
+            values=policy_names(),
             state="readonly"
         )
         self.algorithm_combobox.grid(row=0, column=1, padx=10, pady=10, sticky="n")
         self.algorithm_combobox.current(0)
         
         
+        # Simulation clock and seed, virtual clocks with a seed give reproducible runs
+        
+        self.options_frame = tk.Frame(self)
+        self.options_frame.grid(row=1, column=0, padx=10, pady=10, sticky="n")
+        
+        self.clock_label = tk.Label(self.options_frame, text="Clock:")
+        self.clock_label.pack(anchor="w")
+        
+        self.clock_var = tk.StringVar()
+        self.clock_combobox = ttk.Combobox(self.options_frame, textvariable=self.clock_var, values=CLOCK_MODES, state="readonly")
+        self.clock_combobox.pack(anchor="w")
+        self.clock_combobox.current(0)
+        
+        self.seed_label = tk.Label(self.options_frame, text="Seed:")
+        self.seed_label.pack(anchor="w")
+        
+        self.seed_var = tk.StringVar()
+        self.seed_entry = tk.Entry(self.options_frame, textvariable=self.seed_var)
+        self.seed_entry.pack(anchor="w")
+        
+        self.quantum_label = tk.Label(self.options_frame, text="Quantum (time slice policies):")
+        self.quantum_label.pack(anchor="w")
+        
+        self.quantum_var = tk.StringVar(value=str(QUANTUM))
+        self.quantum_entry = tk.Entry(self.options_frame, textvariable=self.quantum_var)
+        self.quantum_entry.pack(anchor="w")
+        
+        self.cpus_label = tk.Label(self.options_frame, text="CPUs:")
+        self.cpus_label.pack(anchor="w")
+        
+        self.cpus_var = tk.StringVar(value="1")
+        self.cpus_entry = tk.Entry(self.options_frame, textvariable=self.cpus_var)
+        self.cpus_entry.pack(anchor="w")
+        
+        self.queue_mode_label = tk.Label(self.options_frame, text="Run Queues:")
+        self.queue_mode_label.pack(anchor="w")
+        
+        self.queue_mode_var = tk.StringVar()
+        self.queue_mode_combobox = ttk.Combobox(self.options_frame, textvariable=self.queue_mode_var, values=QUEUE_MODES, state="readonly")
+        self.queue_mode_combobox.pack(anchor="w")
+        self.queue_mode_combobox.current(0)
+        
+        self.record_trace_var = tk.BooleanVar(value=False)
+        self.record_trace_check = tk.Checkbutton(self.options_frame, text="Record event trace", variable=self.record_trace_var)
+        self.record_trace_check.pack(anchor="w")
+        
+        
         # Treeview widget to display the list of processes
         
         self.tree = ttk.Treeview(self, columns=("PID", "Arrival Time", "Burst Time", "Priority"), show="headings", height=8)
@@ -72,6 +131,9 @@ class MainWindow(tk.Tk):
         self.tree.grid_columnconfigure(0, weight=1)
         self.tree.grid_rowconfigure(1, weight=1)
         
+        self.workload_label = tk.Label(self, text="0 processes")
+        self.workload_label.grid(row=1, column=1, padx=10, pady=10, sticky="s")
+        
         
         # Window Buttons
         
@@ -80,10 +142,25 @@ class MainWindow(tk.Tk):
 
         self.remove_button = tk.Button(self, text="- Remove Selected", command=self.remove_process)
         self.remove_button.grid(row=0, column=2, padx=10, pady=10, sticky="se")
+        
+        self.import_button = tk.Button(self, text="Import Workload", command=self.import_workload)
+        self.import_button.grid(row=1, column=2, padx=10, pady=10, sticky="ne")
+        
+        self.generate_button = tk.Button(self, text="Generate Workload", command=self.generate_workload)
+        self.generate_button.grid(row=1, column=2, padx=10, pady=(50, 10), sticky="ne")
 
         self.simulate_button = tk.Button(self, text="Simulate", command=self.simulate)
         self.simulate_button.grid(row=2, column=1, padx=10, pady=10, sticky="n")
         
+        self.compare_button = tk.Button(self, text="Compare All", command=self.compare)
+        self.compare_button.grid(row=2, column=2, padx=10, pady=10, sticky="n")
+        
+        self.replay_button = tk.Button(self, text="Replay Trace", command=self.replay_trace)
+        self.replay_button.grid(row=2, column=0, padx=10, pady=10, sticky="n")
+        
+        self.resume_button = tk.Button(self, text="Resume Checkpoint", command=self.resume_checkpoint)
+        self.resume_button.grid(row=2, column=0, padx=10, pady=(50, 10), sticky="n")
+        
         
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
         self.mainloop()
@@ -98,32 +175,236 @@ class MainWindow(tk.Tk):
         priority = simpledialog.askstring("Input", "Enter Priority:", parent=self)
         
         if pid and arrival_time and burst_time and priority:
-            self.tree.insert("", "end", values=(pid, arrival_time, burst_time, priority))
+            try:
+                self.workload.append(self.workload.pid_of(pid), float(arrival_time), float(burst_time), int(priority))
+            except ValueError:
+                settings.show_error_message("Priority must be an integer, arrival and burst time numbers")
+                return
+            
+            self.refresh_preview()
 
 
     def remove_process(self):
-        selected_item = self.tree.selection() 
-        if selected_item:
-            self.tree.delete(selected_item)
+        selected_items = self.tree.selection() 
+        
+        for item in sorted((int(item) for item in selected_items), reverse=True):
+            self.workload.remove(item)
+        
+        if selected_items:
+            self.refresh_preview()
+            
+            
+    def import_workload(self):
+        """Load a CSV, JSON lines or Parquet workload file in chunks straight into the process table"""
+        
+        path = filedialog.askopenfilename(parent=self, filetypes=WORKLOAD_FILE_TYPES)
+        
+        if not path: return
+        
+        try:
+            self.workload = read_workload(path)
+        except (OSError, ValueError, ImportError) as error:
+            settings.show_error_message(str(error))
+            return
+        
+        self.refresh_preview()
+        settings.info_message(f"{len(self.workload)} processes loaded")
+        
+        
+    def generate_workload(self):
+        """Replace the workload with a synthetic one (Poisson arrivals, exponential bursts, Zipf priorities)"""
+        
+        size = simpledialog.askinteger("Input", "Number of processes:", parent=self, minvalue=1)
+        
+        if not size: return
+        
+        try:
+            from src.WorkloadGenerator import WorkloadGenerator
+        except ImportError:
+            settings.show_error_message("NumPy is required to generate workloads")
+            return
+        
+        self.workload = WorkloadGenerator(integer_times=True, arrival_rate=0.2, seed=self.get_seed()).generate(size)
+        self.refresh_preview()
+        
+        
+    def refresh_preview(self):
+        """Show the first rows of the workload, the item ids are the table row indices"""
+        
+        self.tree.delete(*self.tree.get_children())
+        
+        preview_rows = min(len(self.workload), settings.PREVIEW_ROWS)
+        
+        for index in range(preview_rows):
+            pid, *values = self.workload.row(index)
+            self.tree.insert("", "end", iid=str(index), values=[self.workload.label(pid)] + [format_number(value) for value in values])
+            
+        self.workload_label.config(text=f"{len(self.workload)} processes (showing {preview_rows})")
     
     
     def get_processes(self):
-        processes = []
-        for child in self.tree.get_children():
-            process_data = self.tree.item(child)["values"]
-            process = Process(process_data[0], int(process_data[1]), int(process_data[2]), int(process_data[3]))
-            processes.append(process)
+        """Copy of the workload, the engine reorders the table it simulates"""
         
-        return processes
+        return self.workload.copy()
 
 
     def simulate(self):
         processes = self.get_processes()
         selected_algorithm = self.algorithm_var.get()
+        clock = make_clock(self.clock_var.get())
+        seed = self.get_seed()
+        quantum = self.get_quantum()
+        cpus = self.get_cpus()
+        
+        if not (processes and quantum and cpus): return
+        
+        trace_path = None
+        
+        if self.record_trace_var.get():
+            trace_path = filedialog.asksaveasfilename(parent=self, defaultextension=".trace", filetypes=TRACE_FILE_TYPES)
+            
+            if not trace_path: return
+        
+        self.simulation_window = SimulationWindow(self, processes, selected_algorithm, clock, seed, quantum, cpus, self.queue_mode_var.get(),
+                                                  _trace_path=trace_path)
+            
+            
+    def replay_trace(self):
+        """Open a recorded event trace in a simulation window that scrubs through it"""
+        
+        path = filedialog.askopenfilename(parent=self, filetypes=TRACE_FILE_TYPES)
+        
+        if not path: return
+        
+        try:
+            reader = TraceReader(path)
+        except (OSError, ValueError) as error:
+            settings.show_error_message(str(error))
+            return
+        
+        self.simulation_window = SimulationWindow(self, None, reader.algorithm, _replay=TraceReplay(reader))
+            
+            
+    def resume_checkpoint(self):
+        """Continue a simulation saved with Save Checkpoint, with the clock of the MainWindow"""
+        
+        path = filedialog.askopenfilename(parent=self, filetypes=CHECKPOINT_FILE_TYPES)
+        
+        if not path: return
+        
+        try:
+            engine = load_checkpoint(path)
+        except (OSError, ValueError, EOFError) as error:
+            settings.show_error_message(str(error))
+            return
+        
+        self.simulation_window = SimulationWindow(self, None, engine.algorithm, make_clock(self.clock_var.get()), _engine=engine)
+            
+            
+    def compare(self):
+        """Run every algorithm headless on the workload in parallel and show the metrics side by side"""
+        
+        if not len(self.workload): return
+        
+        quantum = self.get_quantum()
+        cpus = self.get_cpus()
+        
+        if not quantum or not cpus: return
+        
+        options = {"_quantum": quantum, "_cpus": cpus, "_queue_mode": self.queue_mode_var.get()}
+        algorithms = self.algorithm_combobox["values"]
+        
+        # The runs go to a process pool polled with after so the window stays responsive
+        
+        self.comparison = submit_comparison(self.workload, algorithms, self.get_seed(), options)
+        self.compare_button.config(state="disabled")
+        
+        comparison_window = Toplevel(self)
+        comparison_window.title("Algorithm Comparison")
         
-        if processes:
-            self.simulation_window = SimulationWindow(self, processes, selected_algorithm)
+        comparison_text = tk.Text(comparison_window, height=len(algorithms) + 2, width=140, font="TkFixedFont")
+        comparison_text.pack(padx=10, pady=10)
+        
+        self.poll_comparison(comparison_text)
+        
+        
+    def poll_comparison(self, comparison_text):
+        """Show the progress of the comparison and the table once every run is done"""
+        
+        executor, futures = self.comparison
+        done = sum(future.done() for future in futures)
+        
+        if comparison_text.winfo_exists():
+            comparison_text.config(state="normal")
+            comparison_text.delete(1.0, tk.END)
+            comparison_text.insert(tk.END, f"Running algorithms... {done} of {len(futures)} done")
+            comparison_text.config(state="disabled")
+        
+        if done < len(futures):
+            self.after(COMPARISON_POLL_INTERVAL, self.poll_comparison, comparison_text)
+            return
+        
+        executor.shutdown(wait=False)
+        self.comparison = None
+        self.compare_button.config(state="normal")
+        
+        try:
+            rows = [future.result() for future in futures]
+        except Exception as error:
+            settings.show_error_message(f"The comparison failed: {error}")
+            return
+        
+        if not comparison_text.winfo_exists(): return
+        
+        comparison_text.config(state="normal")
+        comparison_text.delete(1.0, tk.END)
+        comparison_text.insert(tk.END, format_table(rows))
+        comparison_text.config(state="disabled")
+            
+            
+    def get_quantum(self):
+        try:
+            quantum = float(self.quantum_var.get())
+        except ValueError:
+            quantum = 0
+        
+        if quantum <= 0:
+            settings.show_error_message("The quantum must be a positive number")
+            return None
+        
+        return quantum
+            
+            
+    def get_cpus(self):
+        cpus = self.cpus_var.get().strip()
+        
+        if not cpus.isdigit() or int(cpus) < 1:
+            settings.show_error_message("The number of CPUs must be a positive integer")
+            return None
+        
+        return int(cpus)
+            
+            
+    def get_seed(self):
+        seed = self.seed_var.get().strip()
+        
+        if not seed:
+            return None
+        
+        if not seed.isdigit():
+            settings.show_error_message("The seed must be a positive integer")
+            return None
+        
+        return int(seed)
 
 
     def on_closing(self):
-        self.destroy()
\ No newline at end of file
+        
+        if self.comparison is not None:
+            self.comparison[0].shutdown(wait=False, cancel_futures=True)
+        
+        self.destroy()
+
+
+def format_number(value):
+    return int(value) if float(value).is_integer() else value
\ No newline at end of file
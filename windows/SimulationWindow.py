@@ -9,16 +9,23 @@ Developed at: September 2024
 
 
 import tkinter as tk
-from tkinter import Toplevel
+from tkinter import Toplevel, filedialog
 
 import settings
-import time
-from statistics import mean
-import random
+
+from src.SimulationEngine import SimulationEngine, QUANTUM
+from src.Clock import WallClock
+from src.Profiler import PhaseProfiler
+from src.EventTrace import record_trace
+from src.Checkpoint import CHECKPOINT_FILE_TYPES, save_checkpoint
+from src.Timeline import Timeline
+from windows.GanttView import GanttView
+from windows.VirtualListbox import VirtualListbox
 
 
 class SimulationWindow(Toplevel):
-    def __init__(self, parent, _processes, _selected_algorithm):
+    def __init__(self, parent, _processes, _selected_algorithm, _clock=None, _seed=None, _quantum=QUANTUM, _cpus=1, _queue_mode="global", _frame_rate=settings.FRAME_RATE,
+                 _trace_path=None, _replay=None, _engine=None):
         super().__init__(parent)
         self.title("Process Simulation")
         self.geometry(f"{settings.WINDOW_WIDTH}x{settings.WINDOW_HEIGHT}")
@@ -26,27 +33,61 @@ class SimulationWindow(Toplevel):
         
         self.processes = _processes
         self.selected_algorithm = _selected_algorithm
-        self.total_processes = len(self.processes)
         
-        # Special variables to handle the logic during the simulation 
+        # In replay mode the state comes from a recorded trace (TraceReplay) instead of an engine
+        
+        self.replay = _replay
+        self.engine = None
+        self.trace_writer = None
+        
+        # The scheduling logic lives in the engine, the window only shows its state.
+        # Engine steps and widget updates share one profiler, off until the panel enables it
         
-        self.simulation_time = 0.1
+        self.profiler = PhaseProfiler()
+        
+        if self.replay is None:
+            if _engine is None:
+                self.engine = SimulationEngine(self.processes, self.selected_algorithm, _quantum=_quantum, _seed=_seed, _keep_finished=True,
+                                               _cpus=_cpus, _queue_mode=_queue_mode, _profiler=self.profiler)
+            else:
+                
+                # Engine resumed from a checkpoint, the processes that finished before it are
+                # only listed if the checkpointed engine kept them
+                
+                self.engine = _engine
+                self.engine.profiler = self.profiler
+                self.title(f"Process Simulation ({self.selected_algorithm}, resumed at {self.engine.time:.2f})")
+                
+                if self.engine.finished_processes is None:
+                    self.engine.finished_processes = []
+            
+            self.total_processes = self.engine.total_processes
+            
+            if _trace_path:
+                self.trace_writer = record_trace(self.engine, _trace_path)
+            
+            # Labels of the PIDs typed as text in the MainWindow (e.g. "P1"), the engine only sees their ids
             
-        self.arrival_time = 0
-        self.burst_time = 0
-        self.cpu_usage_time = 0
+            self.labels = getattr(self.engine.table, "labels", None) or {}
+            
+            # CPU slices and blocked periods for the Gantt chart
+            
+            self.timeline = Timeline(self.engine.cpus)
+            self.timeline.attach(self.engine)
+        else:
+            self.total_processes = self.replay.reader.processes
+            self.labels = {}
+            self.title(f"Process Simulation Replay ({self.selected_algorithm})")
+        
+        format_process = self.format_process if self.replay is None else self.format_replay_process
+        format_finished_process = self.format_finished_process if self.replay is None else self.format_replay_finished_process
         
-        self.cpu_available = True
+        self.clock = _clock if _clock is not None else WallClock()
         
-        self.ready_processes = []
-        self.process_waiting_times = []
-        self.finished_processes = []
-        self.cpu_usage = []
-        self.execution_time = []
-        self.blocked_time = []
-        self.blocked_processes = []
-        self.quantum = 2
-        self.current_process = None
+        # Widgets are redrawn at a fixed frame rate no matter how fast the engine runs
+        
+        self.frame_interval = max(1, int(1000 / _frame_rate))
+        self.last_statistics = None
         
         
         
@@ -64,7 +105,7 @@ class SimulationWindow(Toplevel):
         self.queue_label = tk.Label(self, text="Process Queue:")
         self.queue_label.grid(row=0, column=0, padx=10, pady=10, sticky="nw")
         
-        self.queue_listbox = tk.Listbox(self, height=10, width=30)
+        self.queue_listbox = VirtualListbox(self, format_process, height=10, width=30)
         self.queue_listbox.grid(row=0, column=0, padx=10, pady=(30, 10), sticky="nw")
         
         
@@ -73,7 +114,7 @@ class SimulationWindow(Toplevel):
         self.block_label = tk.Label(self, text="Blocked Processes:")
         self.block_label.grid(row=1, column=0, padx=10, pady=10, sticky="nw")
         
-        self.block_listbox = tk.Listbox(self, height=10, width=30)
+        self.block_listbox = VirtualListbox(self, format_process, height=10, width=30)
         self.block_listbox.grid(row=1, column=0, padx=10, pady=(30, 10), sticky="nw")
         
         
@@ -82,7 +123,7 @@ class SimulationWindow(Toplevel):
         self.finished_label = tk.Label(self, text="Finished Processes:")
         self.finished_label.grid(row=2, column=0, padx=10, pady=10, sticky="nw")
         
-        self.finished_listbox = tk.Listbox(self, height=10, width=30)
+        self.finished_listbox = VirtualListbox(self, format_finished_process, height=10, width=30)
         self.finished_listbox.grid(row=2, column=0, padx=10, pady=(30, 10), sticky="nw")
         
         
@@ -94,6 +135,13 @@ class SimulationWindow(Toplevel):
         self.current_process_value = tk.Label(self, text="None")
         self.current_process_value.grid(row=0, column=1, padx=10, pady=(30, 10), sticky="ne")
         
+        self.gantt_button = tk.Button(self, text="Gantt Chart", command=self.show_gantt)
+        self.gantt_button.grid(row=0, column=1, padx=10, pady=10, sticky="se")
+        
+        if self.replay is None:
+            self.checkpoint_button = tk.Button(self, text="Save Checkpoint", command=self.save_checkpoint)
+            self.checkpoint_button.grid(row=0, column=1, padx=(10, 110), pady=10, sticky="se")
+        
         
         # Statistics
         
@@ -103,542 +151,271 @@ class SimulationWindow(Toplevel):
         self.stats_text = tk.Text(self, height=10, width=50)
         self.stats_text.grid(row=2, column=1, padx=10, pady=(30, 10), sticky="se")
         
-        self.run_simulation()
-        
         
-    # ---------------------------- Non Preemptive Algorithms -----------------------------------------
-    
-    
-    # FIFO ALGORITHM
-
-    def fifo(self):
-        """Under the FIFO logic schedules the process in arrival order in wich
-        the first process to reach the ready queue will be the first to executes"""
-        
-        if self.total_processes == len(self.finished_processes): return
-        
-        start_timestamp = time.time()
-        
-        self.update_ready_queue()
-        
-        
-        # Manage the logic when the cpu is available to accept a process
-        
-        if self.ready_processes and self.cpu_available:
+        if self.replay is not None:
             
-            self.cpu_available = False
-            self.burst_time = 0
-            self.cpu_usage_time = 0
+            # Replay time slider
             
-            if self.processes: self.processes.pop(0)
+            self.replay_label = tk.Label(self, text="Replay time:")
+            self.replay_label.grid(row=1, column=1, padx=10, pady=10, sticky="ne")
             
-            self.current_process = self.ready_processes.pop(0)
-            self.process_waiting_times.append(self.current_process.waiting_time)
-            self.current_process_value.config(text=f"PID: {self.current_process.pid}")
-            self.queue_listbox.delete(0)
+            self.replay_scale = tk.Scale(self, from_=0, to=0, resolution=0.01, orient="horizontal", length=400, command=self.on_scrub)
+            self.replay_scale.grid(row=1, column=1, padx=10, pady=(40, 10), sticky="ne")
             
+            # The slider reaches as far as the trace is indexed, the index grows in the background
             
-        self.check_finish_execution()
-                
-        self.update_blocked_processes() 
+            self.scrub_job = None
+            self.index_job = None
             
-        self.cpu_to_none()
-            
-        self.update_statistics()
-
-        end_timestamp = time.time()
+            self.index_replay()
+            self.show_replay_time(0)
+            return
         
-        self.dt = end_timestamp - start_timestamp  
         
-        self.update_timers()
-                
-        self.after(1, self.fifo)
+        # Profiling
         
+        self.profiling = tk.BooleanVar(value=False)
+        self.profiling_check = tk.Checkbutton(self, text="Profiling", variable=self.profiling, command=self.toggle_profiling)
+        self.profiling_check.grid(row=1, column=1, padx=10, pady=10, sticky="ne")
         
+        self.profile_text = tk.Text(self, height=10, width=64, font=("Courier", 9))
+        self.profile_text.grid(row=1, column=1, padx=10, pady=(40, 10), sticky="ne")
         
-    # RANDOM SELECTION ALGORITHM
+        self.run_simulation()
         
-    def random_selection(self):
-        """Given n number of processes in the ready queue the algorithm
-        will schedule any process randomly to be executed, in the cases
-        where there is only one process at the queue this will be executed
-        right away"""
         
-        if self.total_processes == len(self.finished_processes):
-            return
+    # ---------------------------- Simulation Viewer -----------------------------------------
+
+
+    def run_simulation(self):
+        """Starts the viewer loops, the selected algorithm is executed by the engine"""
         
-        start_timestamp = time.time()
+        self.clock.next_time(self.engine)
+        self.after(1, self.tick)
+        self.after(self.frame_interval, self.render)
         
-        self.update_ready_queue()
         
+    def tick(self):
+        """Advance the engine to the time given by the clock (wall clock or virtual)"""
         
-        # Randomly select a process if the CPU is available
+        self.profiler.measure("tick", self.engine.run_until, self.clock.next_time(self.engine))
         
-        if self.ready_processes and self.cpu_available:
-            self.cpu_available = False
-            self.burst_time = 0
-            self.cpu_usage_time = 0
-            self.current_process = random.choice(self.ready_processes)
-            self.ready_processes.remove(self.current_process)
-            self.processes.remove(self.current_process)
-            self.process_waiting_times.append(self.current_process.waiting_time)
-            self.current_process_value.config(text=f"PID: {self.current_process.pid}")
-            
-            
-        self.check_finish_execution()
+        if self.engine.finished:
+            self.close_trace()
+            return
         
-        self.update_blocked_processes()
+        self.after(1, self.tick)
         
-        self.cpu_to_none()
         
-        self.update_statistics()
+    def render(self):
+        """Refresh every widget with the current engine state, once per frame"""
         
-        end_timestamp = time.time()
+        measure = self.profiler.measure
         
-        self.dt = end_timestamp - start_timestamp
+        measure("update_ready_queue", self.update_ready_queue)
+        measure("update_blocked_processes", self.update_blocked_processes)
+        measure("update_finished_processes", self.update_finished_processes)
+        measure("update_cpu", self.update_cpu)
+        measure("update_statistics", self.update_statistics)
         
-        self.update_timers()
+        self.update_profile()
         
-        self.after(1, self.random_selection)
+        if self.engine.finished: return
         
+        self.after(self.frame_interval, self.render)
         
-
-    # PRIORITY SELECTION ALGORITHM     
-            
-    def priority_selection_non_preemptive(self):
-        """All the processes will be rearranged in the ready queue
-        based on their priority value and then the one with the
-        higher value will be executed and so on in every iteration.
-        Once a process it's being executed it will stay until finished"""
         
-        if self.total_processes == len(self.finished_processes): return
+    def close_trace(self):
+        """Write what is left of the trace being recorded"""
         
-        start_timestamp = time.time()
+        if self.trace_writer is not None:
+            self.trace_writer.close()
+            
+            
+    def save_checkpoint(self):
+        """Save the engine state so the simulation can be resumed later from the MainWindow"""
         
-        self.update_ready_queue()
-                    
+        path = filedialog.asksaveasfilename(parent=self, defaultextension=".ckpt", filetypes=CHECKPOINT_FILE_TYPES)
         
-        # Manage the logic when the cpu is available to accept a process
+        if not path: return
         
-        self.ready_processes.sort(key=lambda x: x.priority, reverse=True)
+        try:
+            save_checkpoint(self.engine, path)
+        except OSError as error:
+            settings.show_error_message(str(error))
+            return
         
-        if self.ready_processes and self.cpu_available:
-            
-            self.cpu_available = False
-            self.burst_time = 0
-            self.cpu_usage_time = 0
-            if self.processes: self.processes.remove(self.ready_processes[0])
+        settings.info_message(f"Checkpoint saved at time {self.engine.time:.2f}")
             
-            self.current_process = self.ready_processes.pop(0)
-            self.process_waiting_times.append(self.current_process.waiting_time)
-            self.current_process_value.config(text=f"PID: {self.current_process.pid}")
-            self.queue_listbox.delete(0)
             
+    def show_gantt(self):
+        """Open the Gantt chart, in replay mode the timeline is read from the trace file"""
         
-        self.check_finish_execution()
-        
-        self.update_blocked_processes()  
+        if self.replay is not None:
+            GanttView(self, Timeline.from_trace(self.replay.reader))
+        else:
+            GanttView(self, self.timeline, lambda: not self.engine.finished, _labels=self.labels)
             
-        self.cpu_to_none()
             
-        self.update_statistics()
-        
-        end_timestamp = time.time()  
-        
-        self.dt = end_timestamp - start_timestamp
+    def destroy(self):
+        self.close_trace()
         
-        self.update_timers()
-                
-        self.after(1, self.priority_selection_non_preemptive)
-
-
-    #SHORTEST JOB FIRST (SJF)
-
-    def sjf(self):
-        """All the processes will be rearranged in the ready queue
-        based on their burst time value and then the one with the
-        minor value will be executed and so on in every iteration.
-        Once a process it's being executed it will stay until finished"""
-        
-        if self.total_processes == len(self.finished_processes): return
-        
-        start_timestamp = time.time()
+        if self.replay is not None:
+            for job in (self.scrub_job, self.index_job):
+                if job is not None:
+                    self.after_cancel(job)
+            
+            self.replay.reader.close()
+            
+        super().destroy()
         
-        self.update_ready_queue()
         
-        self.ready_processes.sort(key=lambda x: x.remaining_burst_time)
+    def toggle_profiling(self):
+        """Start profiling from scratch or stop it, the last report stays visible"""
         
-        if self.ready_processes and self.cpu_available:
-            self.cpu_available = False
-            self.burst_time = 0
-            self.cpu_usage_time = 0
-            if self.processes: self.processes.remove(self.ready_processes[0])
+        if self.profiling.get():
+            self.profiler.reset()
+            self.profiler.enable()
+        else:
+            self.profiler.disable()
             
-            self.current_process = self.ready_processes.pop(0)
-            self.process_waiting_times.append(self.current_process.waiting_time)
-            self.current_process_value.config(text=f"PID: {self.current_process.pid}")
-            self.queue_listbox.delete(0)
-        
-
-        self.check_finish_execution()
-        
-        self.update_blocked_processes()
-                
-        self.cpu_to_none()
-
-        self.update_statistics()
+            
+    def update_profile(self):
+        """Show the time spent per phase while profiling"""
         
-        end_timestamp = time.time()  
+        if not self.profiler.enabled: return
         
-        self.dt = end_timestamp - start_timestamp
+        self.profile_text.delete(1.0, tk.END)
+        self.profile_text.insert(tk.END, self.profiler.report())
         
-        self.update_timers()
-                
-        self.after(1, self.sjf)
         
+    def label(self, process):
+        return self.labels.get(process.pid, process.pid)
     
     
-    # ---------------------------- Preemptive Algorithms --------------------------------------------
+    def format_process(self, process):
+        return f"PID: {self.label(process)}, AT: {process.arrival_time}, Remaining BT: {round(process.remaining_burst_time, 2)}, PR: {process.priority}"
     
     
+    def format_finished_process(self, process):
+        return f"PID: {self.label(process)}, AT: {process.arrival_time}, BT: {process.burst_time}, PR: {process.priority}"
+            
     
-    # SRTF ALGORITHM
-    
-    def srtf(self):
-        """This algorithm will rearrange the processes in the ready
-        queue based on its reamining burst time value and the next
-        to be executed will be the one with the minor value. In the
-        cases when a process it's being executed and another arrives
-        with minor burst time it inmediatly will be placed at the cpu
-        and the other one will be remitted to the ready queue again"""
-        
-        if self.total_processes == len(self.finished_processes): return
-        
-        start_timestamp = time.time()
-        
-        self.update_ready_queue()
-        
-        # Manage the logic when the cpu is available to accept a process
+    def update_ready_queue(self):
+        """Update the visible rows of the ready queue based on the engine ready processes"""
         
-        if self.ready_processes and self.cpu_available:
+        self.queue_listbox.set_items(self.engine.ready_processes)
             
-            self.cpu_available = False
-            self.burst_time = 0
-            self.cpu_usage_time = 0
-            
-            if self.processes: self.processes.remove(self.ready_processes[0])
-            
-            self.current_process = self.ready_processes.pop(0)
-            self.process_waiting_times.append(self.current_process.waiting_time)
-            self.current_process_value.config(text=f"PID: {self.current_process.pid}")
-            self.queue_listbox.delete(0)
-            
-
-        self.check_finish_execution()
-        
-        self.update_blocked_processes()
             
+    def update_blocked_processes(self):
+        """Update the visible rows of the blocked list based on the engine blocked processes"""
         
-        # Check if there is a process with minor remaining burst time to reach the cpu first
+        self.block_listbox.set_items(self.engine.blocked_processes)
         
-        possible_next_process = min(self.ready_processes, key=lambda p: p.remaining_burst_time) if self.ready_processes else None
         
-        if possible_next_process and self.current_process and possible_next_process.remaining_burst_time < self.current_process.remaining_burst_time:
-            
-            self.burst_time = 0
-            self.cpu_usage_time = 0
-            
-            self.current_process.waiting_time = 0
-            self.processes.append(self.current_process)
-            self.ready_processes.append(self.current_process)
-            
-            self.current_process = possible_next_process
-            self.ready_processes.remove(self.current_process)
-            self.processes.remove(self.current_process)
-            self.current_process_value.config(text=f"PID: {self.current_process.pid}")
+    def update_finished_processes(self):
+        """Update the visible rows of the finished list based on the engine finished processes"""
         
+        self.finished_listbox.set_items(self.engine.finished_processes)
             
-        self.cpu_to_none()                     
             
-        self.update_statistics()
-        
-        end_timestamp = time.time()  
+    def update_cpu(self):
+        """Show the process currently at the CPU or None in case it's idle, with
+        several CPUs how many are busy and the processes at the first ones"""
         
-        self.dt = end_timestamp - start_timestamp
-        
-        self.update_timers()
-                
-        self.after(1, self.srtf)
-        
-        
-        
-    # PRIORITY SELECTION (PREEMPTIVE)
-
-    def priority_selection_preemptive(self):
-        """All the processes will be rearranged in the ready queue
-        based on their priority value and then the one with the
-        higher value will be executed and so on in every iteration.
-        In the cases when a process it's being executed and another
-        arrives with higher priority it inmediatly will be placed at
-        the cpu and the other one will be remitted to the ready queue
-        again"""
-        
-        if self.total_processes == len(self.finished_processes):
+        if self.engine.cpus == 1:
+            current_process = self.engine.current_process
+            self.current_process_value.config(text=f"PID: {self.label(current_process)}" if current_process else "None")
             return
         
-        start_timestamp = time.time()
+        cores = self.engine.cores
+        busy = sum(1 for core in cores if core.current_process)
+        shown = [f"CPU {core.index}: {self.label(core.current_process) if core.current_process else 'None'}" for core in cores[:settings.SHOWN_CPUS]]
         
-        self.update_ready_queue()
+        self.current_process_value.config(text=f"{busy}/{len(cores)} busy\n" + "\n".join(shown))
+            
+            
+    def update_statistics(self):
+        """Show the statistics computed by the engine, the text is only rewritten when it changes"""
         
-        # Sort ready processes by priority (higher priority first)
+        stats = self.engine.statistics()
         
-        self.ready_processes.sort(key=lambda x: x.priority, reverse=True)
+        text = (
+            f"CPU usage %: {round(stats['cpu_usage'], 2)}%\n"
+            f"Average Execution Time: {round(stats['average_execution_time'], 2)}\n"
+            f"Average Waiting Time: {round(stats['average_waiting_time'], 2)}\n"
+            f"Waiting Time p50/p95/p99: {round(stats['waiting_time_p50'], 2)} / {round(stats['waiting_time_p95'], 2)} / {round(stats['waiting_time_p99'], 2)}\n"
+            f"Execution Time p50/p95/p99: {round(stats['execution_time_p50'], 2)} / {round(stats['execution_time_p95'], 2)} / {round(stats['execution_time_p99'], 2)}\n"
+            f"Average Blocked Time: {round(stats['average_blocked_time'], 2)}\n"
+            f"Total processes completed: {stats['completed']}\n"
+            f"Simulation time: {round(stats['simulation_time'], 2)} seconds\n"
+        )
         
-        # Preempt the current process if a higher priority process arrives
+        if "level_residency" in stats:
+            text += "CPU time per level %: " + " / ".join(f"{round(residency, 1)}" for residency in stats["level_residency"]) + "\n"
         
-        if self.ready_processes:
-            if self.current_process:
-                
-                if self.ready_processes[0].priority > self.current_process.priority:            # Preempt if the new process has higher priority than the current process and
-                    self.ready_processes.append(self.current_process)                           # put the current process back into the ready queue
-                    self.processes.append(self.current_process)   
-                    self.current_process = None
-                    
-            if not self.current_process or self.cpu_available:
-                self.cpu_available = False
-                self.burst_time = 0
-                self.cpu_usage_time = 0
-                
-                if self.processes: self.processes.remove(self.ready_processes[0])
-                self.current_process = self.ready_processes.pop(0)
-                
-                self.process_waiting_times.append(self.current_process.waiting_time)
-                self.current_process_value.config(text=f"PID: {self.current_process.pid}")
-                self.queue_listbox.delete(0)
-            
-                
-        self.check_finish_execution()
-        
-        self.update_blocked_processes()
-    
-        self.cpu_to_none()
+        if text == self.last_statistics: return
         
-        self.update_statistics()
+        self.last_statistics = text
+        self.stats_text.delete(1.0, tk.END)
+        self.stats_text.insert(tk.END, text)
         
-        end_timestamp = time.time()
         
-        self.dt = end_timestamp - start_timestamp
+    # ---------------------------- Replay Viewer -----------------------------------------
+    
+    
+    def index_replay(self):
+        """Index the next chunk of the trace and let the slider reach it"""
         
-        self.update_timers()
+        done = self.replay.index(settings.REPLAY_INDEX_CHUNK)
+        self.replay_scale.config(to=self.replay.indexed_time)
         
-        self.after(1, self.priority_selection_preemptive)
-
-
-
-    #ROUND ROBIN
-
-    def round_robin(self):
-        """All the processes will have a quantum time during 
-           execution, if they finish its execution within that
-           time, perfect, contrary case they will be preempted to the ready 
-           queue and will wait for another turn at the cpu and so
-           on until they could finish"""
-        
-        if self.total_processes == len(self.finished_processes):
+        if done:
+            self.replay_label.config(text="Replay time:")
+            self.index_job = None
             return
-
-        start_timestamp = time.time()
         
-        self.update_ready_queue()
-
+        self.replay_label.config(text=f"Replay time (indexing {self.replay.scan.position / len(self.replay.reader):.0%}):")
+        self.index_job = self.after(1, self.index_replay)
         
-        # Manage the logic when the CPU is available to accept a process                
-
-        if self.ready_processes and self.cpu_available:
-            self.cpu_available = False
-            self.burst_time = 0
-            self.cpu_usage_time = 0
-            
-            if self.processes: self.processes.remove(self.ready_processes[0])
-
-            self.current_process = self.ready_processes.pop(0)
-            self.process_waiting_times.append(self.current_process.waiting_time)
-            self.current_process_value.config(text=f"PID: {self.current_process.pid}")
-
-
-        # Check if the current process has completed its quantum
         
-        if self.current_process and self.burst_time >= self.quantum:
-
-            self.current_process.remaining_burst_time -= self.quantum                   # Decrease the remaining burst time of the current process
-
-            if self.current_process.remaining_burst_time > 0:
-                
-                self.ready_processes.append(self.current_process)                       # Reinsert the process into the ready queue if it hasn't finished
-                self.processes.append(self.current_process)
-            else:
-                
-                # Move the process to the finished list
-                
-                self.finished_listbox.insert(tk.END, f"PID: {self.current_process.pid}, AT: {self.current_process.arrival_time}, BT: {self.current_process.burst_time}")
-                self.finished_processes.append(self.current_process)
-                
-                self.cpu_usage.append(self.cpu_usage_time)
-                self.execution_time.append(self.current_process.waiting_time + self.current_process.burst_time)
+    def on_scrub(self, value):
+        """Slider command, only the last position of a drag is shown once it rests"""
         
-            self.cpu_available = True
-            self.current_process = None
-
-
-        self.update_blocked_processes()
-    
-        self.cpu_to_none()
+        if self.scrub_job is not None:
+            self.after_cancel(self.scrub_job)
         
-        self.update_statistics()
-
-        end_timestamp = time.time()
-
-        self.dt = end_timestamp - start_timestamp
+        self.scrub_job = self.after(settings.SCRUB_DELAY, self.show_replay_time, float(value))
         
-        self.update_timers()
-
-        self.after(1, self.round_robin)    
         
+    def show_replay_time(self, time):
+        """Move the replay to the time of the slider and refresh the widgets"""
         
-
-
-
-    # Resources and utils for simulation
-
-
-    def run_simulation(self):
-        """Determines wich algorithm to use and executes its logic"""
+        self.scrub_job = None
+        self.replay.seek(time)
         
-        if self.selected_algorithm == "FIFO":
-                      
-            self.processes.sort(key=lambda x: x.arrival_time)
-            self.fifo()
-            
-        elif self.selected_algorithm == "SJF":
-
-            self.processes.sort(key=lambda x: x.remaining_burst_time)
-            self.sjf()
-
-        elif self.selected_algorithm == "RandomSelection":
-            
-            self.random_selection()
-            
-        elif self.selected_algorithm == "PrioritySelection (Non-Preemptive)":
-            
-            self.processes.sort(key=lambda x: x.priority, reverse=True)
-            self.priority_selection_non_preemptive()
-            
+        self.queue_listbox.set_items(self.replay.ready_pids())
+        self.block_listbox.set_items(self.replay.blocked_pids())
+        self.finished_listbox.set_items(self.replay.finished_processes)
         
-        elif self.selected_algorithm == "RoundRobin":
-            
-            self.processes.sort(key=lambda x: x.remaining_burst_time)
-            self.round_robin()
-
-        elif self.selected_algorithm == "SRTF":
-              
-            self.processes.sort(key=lambda x: x.remaining_burst_time)
-            self.srtf()
-            
-        elif self.selected_algorithm == "PrioritySelection (Preemptive)":
+        running = self.replay.running
+        shown = [f"CPU {index}: {pid if pid is not None else 'None'}" for index, pid in enumerate(running[:settings.SHOWN_CPUS])]
+        self.current_process_value.config(text=f"{self.replay.busy_cpus}/{len(running)} busy\n" + "\n".join(shown))
         
-            self.processes.sort(key=lambda x: x.priority, reverse=True)
-            self.priority_selection_preemptive()
-            
-    
-    def update_ready_queue(self):
-        """Update the value of the ready queue based on the available processes in the list"""
-        
-        self.queue_listbox.delete(0, tk.END)
-        for process in self.processes:
-            if  self.arrival_time >= process.arrival_time:    
-                self.queue_listbox.insert(tk.END, f"PID: {process.pid}, AT: {process.arrival_time}, Remaining BT: {process.remaining_burst_time}, PR: {process.priority}")
-                if process not in self.ready_processes:
-                    self.ready_processes.append(process)
-                    
-                    
-    def check_finish_execution(self):
-        """Check if the current process in execution has reached its burst time to update its state"""
-        
-        if self.current_process and self.burst_time >= self.current_process.remaining_burst_time:
-            self.finished_listbox.insert(tk.END, f"PID: {self.current_process.pid}, AT: {self.current_process.arrival_time}, BT: {self.current_process.burst_time}, PR: {self.current_process.priority}")
-            self.cpu_available = True
-            self.cpu_usage.append(self.cpu_usage_time)
-            self.execution_time.append(self.current_process.waiting_time + self.current_process.burst_time)
-            self.finished_processes.append(self.current_process)
-            self.current_process = None
-            
-            
-    def update_blocked_processes(self):
-        """Update the blocked list based on the available process in the blocked list"""
+        stats = self.replay.statistics()
         
-        self.block_listbox.delete(0, tk.END)    
-        for process in self.blocked_processes:
-            self.block_listbox.insert(tk.END, f"PID: {process.pid}, AT: {process.arrival_time}, Remaining BT: {process.remaining_burst_time}, PR: {process.priority}")
-            
-            
-    def cpu_to_none(self):
-        """Set the CPU label to None in case it's not currently executing a process"""
+        self.stats_text.delete(1.0, tk.END)
+        self.stats_text.insert(tk.END, (
+            f"CPU usage %: {round(stats['cpu_usage'], 2)}%\n"
+            f"Total processes completed: {stats['completed']} of {self.total_processes}\n"
+            f"Simulation time: {round(stats['simulation_time'], 2)} seconds\n"
+        ))
         
-        if not self.current_process:
-            self.current_process_value.config(text="None")
-            
-            
-    def update_statistics(self):
-        """Manage all the logic and calcules to show the required statistics"""
         
-        self.stats_text.delete(1.0, tk.END)
+    def format_replay_process(self, pid):
+        return f"PID: {pid}"
     
-        avrg_cpu_usage = (sum(self.cpu_usage) / self.simulation_time ) * 100
-        self.stats_text.insert(tk.END, f"CPU usage %: {round(avrg_cpu_usage,2)}%\n")
-        avrg_execution_time = mean(self.execution_time) if self.execution_time else 0
-        self.stats_text.insert(tk.END, f"Average Execution Time: {round(avrg_execution_time, 2)}\n")
-        avrg_waiting_time = mean(self.process_waiting_times) if self.process_waiting_times else 0
-        self.stats_text.insert(tk.END, f"Average Waiting Time: {round(avrg_waiting_time, 2)}\n")
-        avrg_blocked_time = mean(self.blocked_time) if self.blocked_time else 0
-        self.stats_text.insert(tk.END, f"Average Blocked Time: {round(avrg_blocked_time, 2)}\n")
-        self.stats_text.insert(tk.END, f"Total processes completed: {len(self.finished_processes)}\n")
-        self.stats_text.insert(tk.END, f"Simulation time: {round(self.simulation_time, 2)} seconds\n")
-        self.update_idletasks()
-        
-        
-    def update_timers(self):
-        """Update all the timers involved in the simulation"""
-        
-        self.arrival_time += self.dt
-        self.burst_time += self.dt
-        
-        for process in self.ready_processes:
-            process.waiting_time += self.dt
-            
-            
-        for process in self.blocked_processes:
-            if not process.still_bloked(self.dt):
-                self.blocked_processes.remove(process)
-                self.processes.append(process)
-                self.ready_processes.append(process)
-            
-            
-        if not self.cpu_available:
-            self.cpu_usage_time += self.dt
-            self.current_process.remaining_burst_time -= (self.dt)
-            
-            rand = random.randint(0,3000)
-            
-            if  rand == 11:
-                
-                self.current_process.bloked = True
-                self.current_process.blocked_time = 0
-                blocked_time = random.randint(1,7)
-                self.current_process.blocked_max_time = blocked_time
-                self.blocked_time.append(blocked_time)
-                self.blocked_processes.append(self.current_process)
-                
-                self.cpu_available = True
-                self.current_process = None
-            
-        self.simulation_time += self.dt
\ No newline at end of file
+    
+    def format_replay_finished_process(self, finished):
+        pid, finish_time = finished
+        return f"PID: {pid}, Finished at: {round(finish_time, 2)}"
@@ -0,0 +1,108 @@
+"""
+Authors:
+- Iván Maldonado (Kikemaldonado11@gmail.com)
+- Maria José Vera (nandadevi97816@gmail.com)
+- Sergio Fernández (sergiofnzg@gmail.com)
+
+Developed at: September 2024
+"""
+
+
+import tkinter as tk
+from itertools import islice
+
+
+class VirtualListbox(tk.Frame):
+    """Listbox that only materializes the rows inside its visible window.
+    Every refresh formats just those rows and patches the ones that
+    changed, so the cost does not depend on how long the list is"""
+
+    def __init__(self, parent, _format_row, height=10, width=30):
+        super().__init__(parent)
+
+        self.format_row = _format_row
+        self.height = height
+        self.offset = 0
+        self.total = 0
+        self.items = []
+        self.shown = []
+
+        self.listbox = tk.Listbox(self, height=height, width=width)
+        self.listbox.pack(side="left", fill="both", expand=True)
+
+        self.scrollbar = tk.Scrollbar(self, orient="vertical", command=self.on_scroll)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.listbox.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.listbox.bind("<Button-4>", self.on_mouse_wheel)
+        self.listbox.bind("<Button-5>", self.on_mouse_wheel)
+
+
+    def set_items(self, items):
+        """Set the sized iterable shown by the list and refresh the visible rows.
+        It may define window(start, stop) returning the rows in that range"""
+
+        self.items = items
+        self.total = len(items)
+        self.offset = max(0, min(self.offset, self.total - self.height))
+        self.refresh()
+
+
+    def refresh(self):
+
+        # Items with a window method hand over the visible rows themselves (read from a
+        # file or in service order), any other iterable is walked up to the window
+
+        if hasattr(self.items, "window"):
+            items = self.items.window(self.offset, self.offset + self.height)
+        else:
+            items = islice(self.items, self.offset, self.offset + self.height)
+
+        rows = [self.format_row(item) for item in items]
+
+        for index, row in enumerate(rows):
+            if index >= len(self.shown):
+                self.listbox.insert(tk.END, row)
+            elif self.shown[index] != row:
+                self.listbox.delete(index)
+                self.listbox.insert(index, row)
+
+        if len(self.shown) > len(rows):
+            self.listbox.delete(len(rows), tk.END)
+
+        self.shown = rows
+        self.update_scrollbar()
+
+
+    def update_scrollbar(self):
+
+        if self.total <= self.height:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self.offset / self.total, (self.offset + self.height) / self.total)
+
+
+    def scroll_to(self, offset):
+
+        self.offset = max(0, min(offset, self.total - self.height))
+        self.refresh()
+
+
+    def on_scroll(self, action, value, unit=None):
+        """Scrollbar command, moves the visible window instead of the listbox"""
+
+        if action == "moveto":
+            self.scroll_to(int(float(value) * self.total))
+        elif action == "scroll":
+            step = self.height if unit == "pages" else 1
+            self.scroll_to(self.offset + int(value) * step)
+
+
+    def on_mouse_wheel(self, event):
+
+        if event.num == 4 or event.delta > 0:
+            self.scroll_to(self.offset - 1)
+        else:
+            self.scroll_to(self.offset + 1)
+
+        return "break"